@@ -0,0 +1,84 @@
+# Broadphase for the Car game's falling entities, as a sweep-and-prune along
+# the y axis.
+#
+# Every kind of entity (obstacles, coins, power-ups, enemy cars) spawns at the
+# same height above the screen and falls at one fixed speed, so appending new
+# ones keeps a kind's list sorted by y, lowest on screen first, without ever
+# sorting. Everything that has fallen off the bottom is then one slice at the
+# front of the list, and the only entities that can touch the player's car
+# are found by walking from the front until one is wholly above the car.
+#
+# Since a whole lane falls together, rects are stored in lane coordinates
+# (screen y minus the distance the lane has fallen) and a frame's fall is one
+# addition however many entities there are. Iterating a lane gives rects in
+# screen coordinates.
+
+
+class FallingLane:
+    def __init__(self, speed):
+        self.speed = speed
+        self.offset = 0
+        # In lane coordinates; x can be changed in place
+        self.rects = []
+        # One value per rect for whoever needs it, e.g. the power-up type
+        self.payloads = []
+
+    def __len__(self):
+        return len(self.rects)
+
+    def __iter__(self):
+        offset = self.offset
+        for rect in self.rects:
+            yield rect.move(0, offset)
+
+    def items(self):
+        return zip(self, self.payloads)
+
+    def rect(self, index):
+        return self.rects[index].move(0, self.offset)
+
+    def clear(self):
+        self.rects.clear()
+        self.payloads.clear()
+        self.offset = 0
+
+    def spawn(self, rect, payload=None):
+        # New entities must start at or above every other one in the lane
+        self.rects.append(rect.move(0, -self.offset))
+        self.payloads.append(payload)
+
+    def move(self, frames=1):
+        self.offset += self.speed * frames
+
+    def cull(self, bottom):
+        # Drop everything whose top edge is past bottom, all at once
+        rects = self.rects
+        bottom -= self.offset
+        count = 0
+        while count < len(rects) and rects[count].y > bottom:
+            count += 1
+        if count:
+            del rects[:count]
+            del self.payloads[:count]
+            if not rects:
+                self.offset = 0
+        return count
+
+    def hits(self, rect):
+        # Indices of the entities overlapping rect, oldest first
+        rect = rect.move(0, -self.offset)
+        found = []
+        top, bottom = rect.top, rect.bottom
+        for index, other in enumerate(self.rects):
+            if other.top >= bottom:
+                continue
+            if other.bottom <= top:
+                break
+            if other.colliderect(rect):
+                found.append(index)
+        return found
+
+    def remove(self, indices):
+        for index in sorted(indices, reverse=True):
+            del self.rects[index]
+            del self.payloads[index]
@@ -0,0 +1,247 @@
+import pygame
+
+from smg.game import HEIGHT
+from CarGame.car_broadphase import FallingLane
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Everything that falls down the road in the Car game. With NumPy installed
+# the entities are kept as columns (x, y, w, h, vx, vy, kind, alive) and a
+# frame's motion, homing, culling and collision tests are each one vectorized
+# pass however many entities there are; without it, one FallingLane per kind
+# does the same job in plain Python. Both are used through create_entities()
+# and have the same methods. Entity handles from hits() and sweep() are only
+# good until the next step().
+#
+# step_frames() moves everything several frames at once, with the player's x
+# after each of them for the homing, and sweep() finds what may touch a rect
+# at some point during those frames, for CarSim's swept collisions.
+
+OBSTACLE, COIN, SPEED_POWERUP, SHIELD_POWERUP, ENEMY = range(5)
+KIND_COUNT = 5
+POWERUPS = (SPEED_POWERUP, SHIELD_POWERUP)
+
+# Per kind: size in pixels and fall speed in pixels per frame
+KIND_SIZES = [(30, 30), (20, 20), (40, 40), (40, 40), (50, 80)]
+KIND_SPEEDS = [5, 3, 3, 3, 4]
+# Enemy cars drift one pixel a frame towards the player's x
+HOMING_KINDS = (ENEMY,)
+SPAWN_Y = -50
+
+# Share of each kind in horde mode
+HORDE_MIX = [0.4, 0.3, 0.05, 0.05, 0.2]
+
+
+class EntityLanes:
+    def __init__(self):
+        self.lanes = [FallingLane(speed) for speed in KIND_SPEEDS]
+
+    def __len__(self):
+        return sum(len(lane) for lane in self.lanes)
+
+    def clear(self):
+        for lane in self.lanes:
+            lane.clear()
+
+    def spawn(self, kind, x, y=SPAWN_Y):
+        width, height = KIND_SIZES[kind]
+        self.lanes[kind].spawn(pygame.Rect(x, y, width, height))
+
+    def spawn_many(self, kinds, xs, ys=None):
+        if ys is None:
+            ys = [SPAWN_Y] * len(xs)
+        for kind, x, y in zip(kinds, xs, ys):
+            self.spawn(kind, x, y)
+
+    def step(self, target_x, bottom=HEIGHT):
+        self.step_frames((target_x,), bottom)
+
+    def step_frames(self, target_xs, bottom=HEIGHT):
+        for kind, lane in enumerate(self.lanes):
+            lane.move(len(target_xs))
+            lane.cull(bottom)
+            if kind in HOMING_KINDS:
+                for rect in lane.rects:
+                    x = rect.x
+                    for target_x in target_xs:
+                        if x < target_x:
+                            x += 1
+                        elif x > target_x:
+                            x -= 1
+                    rect.x = x
+
+    def hits(self, rect, kinds):
+        # (kind, index) handles, oldest first within each kind
+        return [(kind, index) for kind in kinds for index in self.lanes[kind].hits(rect)]
+
+    def sweep(self, rect, frames):
+        # Handles of everything that may overlap rect within the next frames
+        found = []
+        for kind, lane in enumerate(self.lanes):
+            drift = frames if kind in HOMING_KINDS else 0
+            fall = lane.speed * frames
+            reach = pygame.Rect(rect.x - drift, rect.y - fall, rect.width + 2 * drift, rect.height + fall)
+            found += [(kind, index) for index in lane.hits(reach)]
+        return found
+
+    def remove(self, handles):
+        for kind, lane in enumerate(self.lanes):
+            lane.remove([index for handle_kind, index in handles if handle_kind == kind])
+
+    def kind(self, handle):
+        return handle[0]
+
+    def rect(self, handle):
+        kind, index = handle
+        return self.lanes[kind].rect(index)
+
+    def rects(self, kinds):
+        for kind in kinds:
+            yield from self.lanes[kind]
+
+
+class EntityArrays:
+    def __init__(self, capacity=256):
+        self.count = 0
+        self.capacity = 0
+        self.x = self.y = self.w = self.h = self.vx = self.vy = None
+        self.kinds = self.alive = self.homing = None
+        self.grow(capacity)
+
+        self.kind_sizes = np.array(KIND_SIZES, dtype=np.float64)
+        self.kind_speeds = np.array(KIND_SPEEDS, dtype=np.float64)
+        self.kind_homing = np.isin(np.arange(KIND_COUNT), HOMING_KINDS)
+
+    def grow(self, capacity):
+        def resized(array, dtype):
+            new = np.zeros(capacity, dtype=dtype)
+            if array is not None:
+                new[:self.count] = array[:self.count]
+            return new
+
+        self.x, self.y = resized(self.x, np.float64), resized(self.y, np.float64)
+        self.w, self.h = resized(self.w, np.float64), resized(self.h, np.float64)
+        self.vx, self.vy = resized(self.vx, np.float64), resized(self.vy, np.float64)
+        self.kinds = resized(self.kinds, np.int8)
+        self.alive = resized(self.alive, np.bool_)
+        self.homing = resized(self.homing, np.bool_)
+        self.capacity = capacity
+
+    def __len__(self):
+        return int(np.count_nonzero(self.alive[:self.count]))
+
+    def clear(self):
+        self.count = 0
+
+    def spawn(self, kind, x, y=SPAWN_Y):
+        self.spawn_many(np.array([kind]), np.array([x]), np.array([y]))
+
+    def spawn_many(self, kinds, xs, ys=None):
+        kinds = np.asarray(kinds, dtype=np.int8)
+        added = len(kinds)
+        if self.count + added > self.capacity:
+            self.grow(max(self.capacity * 2, self.count + added))
+        new = slice(self.count, self.count + added)
+        self.x[new] = xs
+        self.y[new] = SPAWN_Y if ys is None else ys
+        self.w[new] = self.kind_sizes[kinds, 0]
+        self.h[new] = self.kind_sizes[kinds, 1]
+        self.vx[new] = 0
+        self.vy[new] = self.kind_speeds[kinds]
+        self.kinds[new] = kinds
+        self.alive[new] = True
+        self.homing[new] = self.kind_homing[kinds]
+        self.count += added
+
+    def step(self, target_x, bottom=HEIGHT):
+        n = self.count
+        x, y = self.x[:n], self.y[:n]
+        x += self.vx[:n]
+        y += self.vy[:n]
+        homing = self.homing[:n]
+        x[homing] += np.sign(target_x - x[homing])
+        self.cull(bottom)
+
+    def step_frames(self, target_xs, bottom=HEIGHT):
+        n = self.count
+        frames = len(target_xs)
+        x, y = self.x[:n], self.y[:n]
+        x += self.vx[:n] * frames
+        y += self.vy[:n] * frames
+        homing = np.flatnonzero(self.homing[:n])
+        if len(homing):
+            homing_x = x[homing]
+            for target_x in target_xs:
+                homing_x += np.sign(target_x - homing_x)
+            x[homing] = homing_x
+        self.cull(bottom)
+
+    def cull(self, bottom):
+        # Drop what fell off the bottom or was removed, keeping spawn order
+        n = self.count
+        keep = self.alive[:n] & (self.y[:n] <= bottom)
+        kept = int(np.count_nonzero(keep))
+        if kept < n:
+            for array in (self.x, self.y, self.w, self.h, self.vx, self.vy, self.kinds, self.homing):
+                array[:kept] = array[:n][keep]
+            self.alive[:kept] = True
+            self.count = kept
+
+    def hits(self, rect, kinds):
+        # Indices, oldest first
+        n = self.count
+        x, y = self.x[:n], self.y[:n]
+        overlap = (self.alive[:n] & (x < rect.right) & (x + self.w[:n] > rect.left)
+                   & (y < rect.bottom) & (y + self.h[:n] > rect.top))
+        if not overlap.any():
+            return []
+        return np.flatnonzero(overlap & np.isin(self.kinds[:n], kinds)).tolist()
+
+    def sweep(self, rect, frames):
+        # Indices of everything that may overlap rect within the next frames
+        n = self.count
+        x, y = self.x[:n], self.y[:n]
+        drift = self.homing[:n] * frames + np.abs(self.vx[:n]) * frames
+        fall = self.vy[:n] * frames
+        overlap = (self.alive[:n] & (x - drift < rect.right) & (x + self.w[:n] + drift > rect.left)
+                   & (y < rect.bottom) & (y + self.h[:n] + fall > rect.top))
+        return np.flatnonzero(overlap).tolist()
+
+    def remove(self, handles):
+        self.alive[handles] = False
+
+    def kind(self, handle):
+        return int(self.kinds[handle])
+
+    def rect(self, handle):
+        return pygame.Rect(int(self.x[handle]), int(self.y[handle]), int(self.w[handle]), int(self.h[handle]))
+
+    def rects(self, kinds):
+        n = self.count
+        chosen = np.flatnonzero(self.alive[:n] & np.isin(self.kinds[:n], kinds))
+        columns = (self.x[chosen].astype(np.int32).tolist(), self.y[chosen].astype(np.int32).tolist(),
+                   self.w[chosen].astype(np.int32).tolist(), self.h[chosen].astype(np.int32).tolist())
+        for x, y, w, h in zip(*columns):
+            yield pygame.Rect(x, y, w, h)
+
+
+def create_entities(arrays=None):
+    # NumPy columns when available, unless asked for one or the other
+    if arrays is None:
+        arrays = np is not None
+    return EntityArrays() if arrays else EntityLanes()
+
+
+def spawn_horde(entities, rng, population, width):
+    # One frame's spawns to keep about population entities on screen, kinds
+    # mixed as in HORDE_MIX; rng is a random.Random
+    kinds = []
+    for kind, share in enumerate(HORDE_MIX):
+        lifetime = (HEIGHT - SPAWN_Y) / KIND_SPEEDS[kind]
+        rate = population * share / lifetime
+        kinds += [kind] * (int(rate) + (rng.random() < rate % 1))
+    xs = [rng.randint(0, width - KIND_SIZES[kind][0]) for kind in kinds]
+    entities.spawn_many(kinds, xs)
@@ -0,0 +1,340 @@
+import math
+import random
+
+import pygame
+
+from smg.game import WIDTH, HEIGHT
+from CarGame.car_entities import (
+    OBSTACLE, COIN, SPEED_POWERUP, ENEMY, POWERUPS, KIND_COUNT, KIND_SIZES, KIND_SPEEDS,
+    HOMING_KINDS, SPAWN_Y, create_entities, spawn_horde,
+)
+from CarGame.car_spawner import SpawnScheduler
+from CarGame.car_track import TrackStream, MAX_ROAD_SLOPE
+
+# Car rules without a window: spawning, homing enemy cars, power-ups, shield
+# and speed boost, and difficulty rising with distance. The game, bots and
+# benchmarks all play through CarSim; it only needs pygame for Rect, so it
+# runs without a display and as fast as the CPU allows.
+#
+# In track mode the road is a procedural TrackStream: obstacles and coins
+# are its barriers and coin patterns, which the track keeps at their place on
+# the road rather than in the entity store, power-ups and enemy cars are kept
+# on the road, and the road's edges hold the car in. rects() gives both.
+#
+# step() takes LEFT, STAY or RIGHT and returns (observation, reward, done).
+# advance() is the same without building the observation, for the game.
+# Both can hold the action for several frames at once, with the same outcome
+# as stepping frame by frame (see advance_swept).
+# What happened during the last frame is in events, so the game can play
+# sounds and add particles:
+#   ("spawn", kind), ("coin", rect), ("powerup", kind, rect),
+#   ("shield_used", kind), ("crash", kind), ("shield_off",), ("boost_off",)
+
+LEFT, STAY, RIGHT = -1, 0, 1
+ACTIONS = (LEFT, STAY, RIGHT)
+
+# Rewards returned by step
+COIN_REWARD = 1
+DEATH_REWARD = -1
+
+# The observation is the car's state followed by the NEAREST entities that
+# have not yet passed it, closest first, as (kind + 1, dx, dy) scaled to
+# about -1..1; missing entities are zeros
+NEAREST = 8
+CAR_FEATURES = 5
+OBSERVATION_SIZE = CAR_FEATURES + 3 * NEAREST
+
+# Difficulty settings
+DIFFICULTY_LEVELS = ["Easy", "Medium", "Hard"]
+difficulty_multipliers = {
+    "Easy": {"spawn_rate": 1.5, "speed": 0.8, "powerup_duration": 1.5},  # Slower, less frequent spawns, longer power-ups
+    "Medium": {"spawn_rate": 1.0, "speed": 1.0, "powerup_duration": 1.0},  # Default settings
+    "Hard": {"spawn_rate": 0.7, "speed": 1.2, "powerup_duration": 0.8}  # Faster, more frequent spawns, shorter power-ups
+}
+
+ALL_KINDS = tuple(range(KIND_COUNT))
+# What the car touches is dealt with in this order each frame
+COLLISION_ORDER = ((OBSTACLE,), (COIN,), POWERUPS, (ENEMY,))
+
+
+# Stands in for the entity store to collect horde spawns during a swept step
+class SpawnLog:
+    def __init__(self):
+        self.spawns = []
+
+    def spawn_many(self, kinds, xs):
+        self.spawns += zip(kinds, xs)
+
+    def take(self):
+        spawns, self.spawns = self.spawns, []
+        return spawns
+
+
+class CarSim:
+    def __init__(self, difficulty="Medium", seed=None, horde=0, track=False):
+        self.difficulty = difficulty
+        self.horde = horde
+        self.track_mode = track
+        self.events = []
+        self.reset(seed)
+
+    def reset(self, seed=None):
+        multipliers = difficulty_multipliers[self.difficulty]
+        if seed is None:
+            seed = random.randrange(2 ** 32)
+        self.car = pygame.Rect(WIDTH // 2 - 25, HEIGHT - 150, 50, 80)
+        self.base_car_speed = 5 * multipliers["speed"]
+        self.car_speed = self.base_car_speed
+        # A handful of entities is quicker in plain Python lanes; the NumPy
+        # columns pay off in horde mode
+        self.entities = create_entities(arrays=None if self.horde else False)
+        self.spawner = SpawnScheduler(multipliers, seed)
+        self.track = TrackStream(self.spawner.track_rng()) if self.track_mode else None
+        self.score = 0
+        self.distance_traveled = 0
+        self.background_speed = 2 * multipliers["speed"]
+        self.shield_active = False
+        self.speed_boost_active = False
+        self.shield_timer = 0
+        self.speed_boost_timer = 0
+        self.powerup_duration = int(600 * multipliers["powerup_duration"])
+        self.frames = 0
+        self.done = False
+        self.events.clear()
+        return self.observation()
+
+    @property
+    def seed(self):
+        return self.spawner.seed
+
+    def step(self, action=STAY, frames=1):
+        reward = self.advance(action, frames)
+        return self.observation(), reward, self.done
+
+    def advance(self, action=STAY, frames=1):
+        # frames > 1 holds the action for that many frames, with the same
+        # outcome as that many calls
+        self.events.clear()
+        if self.done:
+            return 0
+        score = self.score
+        if frames == 1:
+            self.advance_frame(action)
+        else:
+            self.advance_swept(action, frames)
+        return (self.score - score) * COIN_REWARD + (DEATH_REWARD if self.done else 0)
+
+    def begin_frame(self, action):
+        # A frame up to the entities: difficulty, power-up timers, distance,
+        # the car's move, and the (kind, x) spawns it brings
+        events = self.events
+        self.frames += 1
+
+        # Difficulty rises with distance, looked up by play frame
+        self.background_speed = self.spawner.background_speed()
+
+        if self.shield_active:
+            self.shield_timer -= 1
+            if self.shield_timer <= 0:
+                self.shield_active = False
+                events.append(("shield_off",))
+        if self.speed_boost_active:
+            self.speed_boost_timer -= 1
+            if self.speed_boost_timer <= 0:
+                self.speed_boost_active = False
+                self.car_speed = self.base_car_speed
+                events.append(("boost_off",))
+
+        self.distance_traveled += self.background_speed
+
+        if action == LEFT and self.car.left > 0:
+            self.car.x -= self.car_speed
+        elif action == RIGHT and self.car.right < WIDTH:
+            self.car.x += self.car_speed
+
+        spawns = self.spawner.advance() if self.track is None else self.follow_track()
+        for kind, _ in spawns:
+            events.append(("spawn", kind))
+        return spawns
+
+    def advance_frame(self, action):
+        entities = self.entities
+        for kind, x in self.begin_frame(action):
+            entities.spawn(kind, x)
+        if self.horde:
+            spawn_horde(entities, self.spawner.horde_rng(), self.horde, WIDTH)
+
+        # Fall, home in on the car and drop what left the screen
+        entities.step(self.car.x)
+
+        # Only what overlaps the car, found by the entity store
+        for kinds in COLLISION_ORDER:
+            found = entities.hits(self.car, kinds)
+            entities.remove([handle for handle in found if self.touch(entities.kind(handle), entities.rect(handle))])
+            if self.track is not None:
+                self.touch_track(kinds)
+
+    def advance_swept(self, action, frames):
+        # Several frames with one pass over the entity store. Sweeping the
+        # car's widest possible path against each entity's fall gives the few
+        # that can touch it in these frames; only those are followed frame by
+        # frame, so nothing passes through the car however many frames a
+        # step covers. Everything else moves all the frames at once.
+        entities = self.entities
+        car = self.car
+        # The car moves at most its boosted speed a frame, or as fast as a
+        # road edge pushes it; the road scrolls at most base_car_speed a frame
+        reach = int(self.base_car_speed * 1.5) + 1
+        if self.track is not None:
+            reach = max(reach, math.ceil(self.base_car_speed * MAX_ROAD_SLOPE) + 1)
+        reach *= frames
+        path = pygame.Rect(car.x - reach, car.y, car.width + 2 * reach, car.height)
+        # [kind, rect, fall per frame, homing, handle or None, frame spawned, alive]
+        followed = []
+        for handle in entities.sweep(path, frames):
+            kind = entities.kind(handle)
+            followed.append([kind, entities.rect(handle), KIND_SPEEDS[kind], kind in HOMING_KINDS, handle, 0, True])
+        spawned = []
+        horde = SpawnLog() if self.horde else None
+        targets = []
+        for frame in range(1, frames + 1):
+            spawns = self.begin_frame(action)
+            if horde is not None:
+                spawn_horde(horde, self.spawner.horde_rng(), self.horde, WIDTH)
+                spawns += horde.take()
+            for kind, x in spawns:
+                width, height = KIND_SIZES[kind]
+                record = [kind, pygame.Rect(x, SPAWN_Y, width, height), KIND_SPEEDS[kind], kind in HOMING_KINDS,
+                          None, frame, True]
+                spawned.append(record)
+                if SPAWN_Y + height + KIND_SPEEDS[kind] * (frames - frame + 1) > car.top:
+                    followed.append(record)
+
+            car_x = car.x
+            targets.append(car_x)
+            for entity in followed:
+                if entity[5] <= frame:
+                    rect = entity[1]
+                    rect.y += entity[2]
+                    if entity[3]:
+                        if rect.x < car_x:
+                            rect.x += 1
+                        elif rect.x > car_x:
+                            rect.x -= 1
+            for kinds in COLLISION_ORDER:
+                for entity in followed:
+                    if entity[6] and entity[0] in kinds and entity[5] <= frame and entity[1].colliderect(car):
+                        if self.touch(entity[0], entity[1].copy()):
+                            entity[6] = False
+                if self.track is not None:
+                    self.touch_track(kinds)
+            if self.done:
+                break
+
+        # The store catches up on the frames actually played
+        played = len(targets)
+        entities.remove([entity[4] for entity in followed if not entity[6] and entity[4] is not None])
+        entities.step_frames(targets)
+        kinds, xs, ys = [], [], []
+        for kind, rect, fall, homing, _, frame, alive in spawned:
+            y = SPAWN_Y + fall * (played - frame + 1)
+            if not alive or y > HEIGHT:
+                continue
+            x = rect.x
+            if homing and rect.y == SPAWN_Y:
+                # Not followed, so not moved yet
+                x = self.home(x, targets[frame - 1:])
+            kinds.append(kind)
+            xs.append(x)
+            ys.append(y)
+        if kinds:
+            entities.spawn_many(kinds, xs, ys)
+
+    def home(self, x, targets):
+        for target_x in targets:
+            if x < target_x:
+                x += 1
+            elif x > target_x:
+                x -= 1
+        return x
+
+    def touch_track(self, kinds):
+        # Track items of these kinds under the car, where the road has them
+        # this frame
+        track = self.track
+        distance = self.distance_traveled
+        found = track.hits(self.car, kinds, distance)
+        if found:
+            track.remove([item for item in found if self.touch(item[1], track.item_rect(item, distance))])
+
+    def touch(self, kind, rect):
+        # What happens when the car touches an entity; True if it goes
+        events = self.events
+        if kind == COIN:
+            self.score += 1
+            events.append(("coin", rect))
+            return True
+        if kind in POWERUPS:
+            events.append(("powerup", kind, rect))
+            if kind == SPEED_POWERUP:
+                self.speed_boost_active = True
+                self.speed_boost_timer = self.powerup_duration
+                self.car_speed = self.base_car_speed * 1.5
+            else:
+                self.shield_active = True
+                self.shield_timer = self.powerup_duration
+            return True
+        # Obstacles and enemy cars: the shield destroys one and is gone;
+        # without it, a crash
+        if self.shield_active:
+            self.shield_active = False
+            self.shield_timer = 0
+            events.append(("shield_used", kind))
+            return True
+        self.done = True
+        events.append(("crash", kind))
+        return False
+
+    def follow_track(self):
+        track = self.track
+        car = self.car
+        distance = self.distance_traveled
+        left, right = track.road_at(distance + HEIGHT - car.centery)
+        if car.left < left:
+            car.left = left
+        elif car.right > right:
+            car.right = right
+
+        # The track's own items stay with it; only their arrival is news
+        for kind in track.advance(distance):
+            self.events.append(("spawn", kind))
+        spawns = []
+        left, right = track.road_at(distance + HEIGHT - SPAWN_Y)
+        for kind, x in self.spawner.advance():
+            if kind != OBSTACLE and kind != COIN:
+                spawns.append((kind, int(min(max(x, left), right - KIND_SIZES[kind][0]))))
+        return spawns
+
+    def rects(self, kinds):
+        # Everything of these kinds on the road, from the entity store and the
+        # track
+        yield from self.entities.rects(kinds)
+        if self.track is not None:
+            yield from self.track.rects(kinds, self.distance_traveled)
+
+    def observation(self):
+        # A list of OBSERVATION_SIZE floats
+        car = self.car
+        duration = self.powerup_duration
+        values = [car.x / WIDTH, self.car_speed / 10, self.shield_timer / duration,
+                  self.speed_boost_timer / duration, self.background_speed / 10]
+        ahead = []
+        for kind in ALL_KINDS:
+            for rect in self.rects((kind,)):
+                if rect.top < car.bottom:
+                    ahead.append((rect.bottom, kind, rect.x))
+        ahead.sort(reverse=True)
+        for bottom, kind, x in ahead[:NEAREST]:
+            values += (kind + 1, (x - car.x) / WIDTH, (car.top - bottom) / HEIGHT)
+        values += [0.0] * (OBSERVATION_SIZE - len(values))
+        return values
@@ -0,0 +1,134 @@
+import random
+
+from smg.game import WIDTH
+from CarGame.car_entities import OBSTACLE, COIN, ENEMY, POWERUPS, KIND_SIZES
+
+# When things appear on the Car game's road.
+#
+# Distance, and so the difficulty, only depends on how many frames have been
+# played, so the background speed and the four spawn intervals are worked out
+# once per difficulty as a table indexed by play frame, up to the frame where
+# they all stop changing. Each spawn books the next one of its type on a
+# timing wheel, and a frame only looks at the wheel slot for that frame: its
+# cost is the number of spawns due, not the number of spawn types. Each type
+# draws from its own random stream, seeded from the game's seed, so a seed
+# replays the same road whatever else uses random numbers.
+
+# Frames between spawns at the start and the fastest they get
+BASE_OBSTACLE_SPAWN_RATE, MIN_OBSTACLE_SPAWN_RATE = 60, 30
+BASE_ENEMY_SPAWN_RATE, MIN_ENEMY_SPAWN_RATE = 120, 60
+COIN_SPAWN_RATE = 90
+POWERUP_SPAWN_RATE = 240
+
+# Spawn types, one random stream each; power-ups pick speed or shield
+OBSTACLES, COINS, POWERUP_DROPS, ENEMIES = range(4)
+STREAM_NAMES = ["obstacles", "coins", "powerups", "enemies", "horde", "track"]
+HORDE_STREAM, TRACK_STREAM = 4, 5
+
+# Longer than any spawn interval, so a slot only holds spawns due this frame
+WHEEL_SLOTS = 512
+
+_curves = {}
+
+
+class DifficultyCurve:
+    def __init__(self, speed, spawn_rate):
+        # Play frame n's background speed and spawn intervals, from the
+        # distance before that frame's move
+        self.background_speeds = []
+        self.spawn_rates = [[] for _ in range(4)]
+        coin_rate = COIN_SPAWN_RATE * spawn_rate
+        powerup_rate = POWERUP_SPAWN_RATE * spawn_rate
+        distance = 0
+        while True:
+            difficulty_multiplier = 1.0 + (distance / 1000)
+            background_speed = min(5 * speed, (2 + (distance / 500)) * speed)
+            obstacle_rate = max(MIN_OBSTACLE_SPAWN_RATE,
+                                (BASE_OBSTACLE_SPAWN_RATE / difficulty_multiplier) * spawn_rate)
+            enemy_rate = max(MIN_ENEMY_SPAWN_RATE, (BASE_ENEMY_SPAWN_RATE / difficulty_multiplier) * spawn_rate)
+            self.background_speeds.append(background_speed)
+            for rates, rate in zip(self.spawn_rates, (obstacle_rate, coin_rate, powerup_rate, enemy_rate)):
+                rates.append(rate)
+            if (background_speed == 5 * speed and obstacle_rate == MIN_OBSTACLE_SPAWN_RATE
+                    and enemy_rate == MIN_ENEMY_SPAWN_RATE):
+                break
+            distance += background_speed
+        self.length = len(self.background_speeds)
+
+        # Frames from a spawn on frame n (or the start, n = -1) to the next
+        # of its type: the first k with k > the interval on frame n + k, as
+        # the old per-frame counters did it
+        self.delays = []
+        for rates in self.spawn_rates:
+            delays = []
+            for start in range(-1, self.length):
+                delay = 1
+                while delay <= rates[min(start + delay, self.length - 1)]:
+                    delay += 1
+                delays.append(delay)
+            self.delays.append(delays)
+
+    def background_speed(self, frame):
+        return self.background_speeds[min(frame, self.length - 1)]
+
+    def delay(self, stream, start):
+        delays = self.delays[stream]
+        return delays[min(start + 1, len(delays) - 1)]
+
+
+def difficulty_curve(multipliers):
+    key = (multipliers["speed"], multipliers["spawn_rate"])
+    if key not in _curves:
+        _curves[key] = DifficultyCurve(*key)
+    return _curves[key]
+
+
+class SpawnScheduler:
+    def __init__(self, multipliers, seed=None):
+        self.curve = difficulty_curve(multipliers)
+        self.seed = seed
+        seeds = random.Random(seed)
+        self.streams = [random.Random(seeds.getrandbits(64)) for _ in STREAM_NAMES]
+        self.frame = 0
+        self.wheel = [[] for _ in range(WHEEL_SLOTS)]
+        for stream in (OBSTACLES, COINS, POWERUP_DROPS, ENEMIES):
+            self.book(stream, -1)
+
+    def book(self, stream, start):
+        due = start + self.curve.delay(stream, start)
+        self.wheel[due % WHEEL_SLOTS].append((due, stream))
+
+    def background_speed(self):
+        return self.curve.background_speed(self.frame)
+
+    def horde_rng(self):
+        return self.streams[HORDE_STREAM]
+
+    def track_rng(self):
+        return self.streams[TRACK_STREAM]
+
+    def advance(self):
+        # (kind, x) for each spawn due this play frame, then on to the next
+        frame = self.frame
+        index = frame % WHEEL_SLOTS
+        slot = self.wheel[index]
+        spawns = []
+        if slot:
+            self.wheel[index] = []
+            for due, stream in sorted(slot, key=lambda event: event[1]):
+                if due != frame:
+                    self.wheel[index].append((due, stream))
+                    continue
+                rng = self.streams[stream]
+                if stream == OBSTACLES:
+                    kind = OBSTACLE
+                elif stream == COINS:
+                    kind = COIN
+                elif stream == POWERUP_DROPS:
+                    kind = rng.choice(POWERUPS)
+                else:
+                    kind = ENEMY
+                spawns.append((kind, rng.randint(0, WIDTH - KIND_SIZES[kind][0])))
+                self.book(stream, frame)
+        self.frame = frame + 1
+        return spawns
@@ -0,0 +1,190 @@
+import heapq
+from collections import deque
+
+import pygame
+
+from smg.game import WIDTH, HEIGHT
+from CarGame.car_entities import OBSTACLE, COIN, KIND_SIZES, SPAWN_Y
+
+# Procedural road for the Car game's track mode. The road is made of chunks
+# generated from the game's seed a few screens ahead of the car, and each is
+# dropped as soon as it has scrolled off the bottom, so however far the car
+# drives the track holds the same handful of chunks. A frame generates at
+# most one chunk, which is far more road than a frame scrolls, so the
+# lookahead never runs out and no frame waits on a burst of generation.
+#
+# Positions are distances along the road, the same units as the distance on
+# the dashboard. The screen shows positions distance..distance + HEIGHT, the
+# top row being the furthest ahead. Every chunk bends the road towards a new
+# centre and may hold a barrier across some lanes and a pattern of coins.
+# Those become obstacles and coins on screen when their row reaches the top,
+# and stay at their place on the road: their screen y follows the distance
+# rather than a fall speed, so barrier rows and coin lines keep to their
+# lanes through the bends.
+
+LANES = 4
+LANE_WIDTH = 110
+ROAD_WIDTH = LANES * LANE_WIDTH
+# Furthest the road's centre goes from the middle of the screen
+CENTRE_MIN = ROAD_WIDTH // 2 + 20
+CENTRE_MAX = WIDTH - ROAD_WIDTH // 2 - 20
+CHUNK_LENGTH = 300
+# Furthest a chunk moves the centre, and so the steepest the road gets
+# sideways per unit of distance (smoothstep's slope peaks at 1.5)
+MAX_BEND = 120
+MAX_ROAD_SLOPE = 1.5 * MAX_BEND / CHUNK_LENGTH
+# Road generated beyond the top of the screen
+LOOKAHEAD = 2 * HEIGHT
+# The first chunks are straight and empty, for a run-up
+CLEAR_CHUNKS = 3
+
+BARRIER_CHANCE = 0.4
+COIN_PATTERN_CHANCE = 0.6
+COIN_SPACING = 40
+BARRIER_BLOCKS = 3
+# Tallest item, for finding the ones that overlap a rect
+ITEM_HEIGHT = max(KIND_SIZES[OBSTACLE][1], KIND_SIZES[COIN][1])
+
+
+class TrackChunk:
+    def __init__(self, start, centre_start, centre_end):
+        self.start = start
+        self.end = start + CHUNK_LENGTH
+        self.centre_start = centre_start
+        self.centre_end = centre_end
+
+    def centre(self, position):
+        # Smoothstep between the two centres, so chunks join without a kink
+        t = (position - self.start) / CHUNK_LENGTH
+        t = t * t * (3 - 2 * t)
+        return self.centre_start + (self.centre_end - self.centre_start) * t
+
+
+class TrackStream:
+    def __init__(self, rng):
+        self.rng = rng
+        self.chunks = deque()
+        # Heap of (position, kind, x) not yet spawned; a chunk's coins can
+        # run into the next chunk
+        self.pending = []
+        # (position, kind, x) on screen, lowest on screen first
+        self.items = []
+        self.generated = 0
+        self.centre = WIDTH / 2
+        self.chunks_made = 0
+
+    def __len__(self):
+        return len(self.chunks)
+
+    def advance(self, distance):
+        # Kinds of the items whose row has reached the top of the screen
+        if self.generated < distance + HEIGHT + LOOKAHEAD:
+            self.generate()
+        chunks = self.chunks
+        while len(chunks) > 1 and chunks[0].end < distance:
+            chunks.popleft()
+
+        # Off the bottom once the top edge is past it, as entities are
+        items = self.items
+        gone = 0
+        while gone < len(items) and items[gone][0] < distance:
+            gone += 1
+        if gone:
+            del items[:gone]
+
+        spawned = []
+        pending = self.pending
+        reach = distance + HEIGHT - SPAWN_Y
+        while pending and pending[0][0] <= reach:
+            item = heapq.heappop(pending)
+            items.append(item)
+            spawned.append(item[1])
+        return spawned
+
+    def item_rect(self, item, distance):
+        position, kind, x = item
+        width, height = KIND_SIZES[kind]
+        return pygame.Rect(x, int(distance + HEIGHT - position), width, height)
+
+    def rects(self, kinds, distance):
+        for item in self.items:
+            if item[1] in kinds:
+                yield self.item_rect(item, distance)
+
+    def hits(self, rect, kinds, distance):
+        # Items of these kinds overlapping rect, lowest on screen first
+        found = []
+        for item in self.items:
+            item_rect = self.item_rect(item, distance)
+            if item_rect.top >= rect.bottom:
+                continue
+            if item_rect.top + ITEM_HEIGHT <= rect.top:
+                break
+            if item[1] in kinds and item_rect.colliderect(rect):
+                found.append(item)
+        return found
+
+    def remove(self, found):
+        if found:
+            self.items = [item for item in self.items if item not in found]
+
+    def generate(self):
+        rng = self.rng
+        start = self.generated
+        centre_start = self.centre
+        if self.chunks_made >= CLEAR_CHUNKS:
+            bend = rng.choice((-1, 0, 0, 1)) * rng.uniform(40, MAX_BEND)
+            self.centre = min(CENTRE_MAX, max(CENTRE_MIN, centre_start + bend))
+        chunk = TrackChunk(start, centre_start, self.centre)
+        self.chunks.append(chunk)
+        self.generated = chunk.end
+        self.chunks_made += 1
+        if self.chunks_made <= CLEAR_CHUNKS:
+            return
+
+        items = []
+        open_lanes = list(range(LANES))
+        if rng.random() < BARRIER_CHANCE:
+            # Never every lane, so there is always a way through
+            blocked = rng.sample(open_lanes, rng.randint(1, LANES - 1))
+            position = start + rng.randrange(CHUNK_LENGTH // 2)
+            width = KIND_SIZES[OBSTACLE][0]
+            gap = (LANE_WIDTH - BARRIER_BLOCKS * width) // (BARRIER_BLOCKS + 1)
+            for lane in blocked:
+                left = self.lane_left(chunk, position, lane)
+                for block in range(BARRIER_BLOCKS):
+                    items.append((position, OBSTACLE, left + gap + block * (width + gap)))
+            open_lanes = [lane for lane in open_lanes if lane not in blocked]
+
+        if rng.random() < COIN_PATTERN_CHANCE:
+            width = KIND_SIZES[COIN][0]
+            count = rng.randint(3, 6)
+            position = start + CHUNK_LENGTH // 2
+            if rng.random() < 0.5:
+                # A line down one lane
+                lanes = [rng.choice(open_lanes)] * count
+            else:
+                # A zigzag across the road
+                first = rng.randrange(LANES)
+                lanes = [abs((first + i) % (2 * LANES - 2) - (LANES - 1)) for i in range(count)]
+            for i, lane in enumerate(lanes):
+                row = position + i * COIN_SPACING
+                x = self.lane_left(chunk, min(row, chunk.end), lane) + (LANE_WIDTH - width) // 2
+                items.append((row, COIN, x))
+
+        for item in items:
+            heapq.heappush(self.pending, item)
+
+    def lane_left(self, chunk, position, lane):
+        return int(chunk.centre(position) - ROAD_WIDTH / 2 + lane * LANE_WIDTH)
+
+    def centre_at(self, position):
+        for chunk in self.chunks:
+            if position < chunk.end:
+                return chunk.centre(max(position, chunk.start))
+        return self.centre
+
+    def road_at(self, position):
+        # Left and right edge of the road at a position
+        centre = self.centre_at(position)
+        return centre - ROAD_WIDTH / 2, centre + ROAD_WIDTH / 2
@@ -0,0 +1,190 @@
+import multiprocessing
+import os
+import random
+import time
+from array import array
+from multiprocessing import shared_memory
+
+from CarGame.car_sim import CarSim, OBSERVATION_SIZE
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Many CarSim games spread over worker processes, for bots that train on the
+# Car rules. Each worker steps a contiguous block of games. Actions,
+# observations, rewards and done flags live in one shared memory block that
+# the workers read and write in place, so a step costs one short message per
+# worker rather than pickling observations. Games that end start over inside
+# the same step, with a new seed drawn from their own stream; done marks the
+# step a game ended. Each step can cover several frames with the action
+# held (CarSim's swept steps), for more frames per second.
+#
+# With NumPy the buffers are arrays (observations is count x
+# OBSERVATION_SIZE); without it they are flat memoryviews.
+
+
+def buffer_size(count):
+    return count * (OBSERVATION_SIZE * 8 + 8 + 1 + 1)
+
+
+def buffer_views(buffer, count):
+    # observations, rewards, actions, dones as memoryviews of doubles and bytes
+    observations_end = count * OBSERVATION_SIZE * 8
+    rewards_end = observations_end + count * 8
+    actions_end = rewards_end + count
+    return (buffer[:observations_end].cast("d"), buffer[observations_end:rewards_end].cast("d"),
+            buffer[rewards_end:actions_end].cast("b"), buffer[actions_end:actions_end + count].cast("B"))
+
+
+def game_seeds(seed, index):
+    # Seeds for one slot's successive games; random ones without a seed
+    return random.Random(None if seed is None else f"{seed}:{index}")
+
+
+def run_worker(connection, name, count, first, last, difficulty, seed, horde, frames):
+    memory = shared_memory.SharedMemory(name=name)
+    observations, rewards, actions, dones = buffer_views(memory.buf, count)
+    slots = range(first, last)
+    seeds = [game_seeds(seed, index) for index in slots]
+    sims = [CarSim(difficulty, slot_seeds.getrandbits(32), horde) for slot_seeds in seeds]
+
+    def write_observation(index, observation):
+        start = index * OBSERVATION_SIZE
+        observations[start:start + OBSERVATION_SIZE] = array("d", observation)
+
+    for index, sim in zip(slots, sims):
+        write_observation(index, sim.observation())
+    connection.send("ready")
+
+    try:
+        while True:
+            message = connection.recv()
+            if message == "step":
+                for index, sim, slot_seeds in zip(slots, sims, seeds):
+                    observation, reward, done = sim.step(actions[index], frames)
+                    if done:
+                        observation = sim.reset(slot_seeds.getrandbits(32))
+                    write_observation(index, observation)
+                    rewards[index] = reward
+                    dones[index] = done
+            elif message == "reset":
+                for index, sim, slot_seeds in zip(slots, sims, seeds):
+                    write_observation(index, sim.reset(slot_seeds.getrandbits(32)))
+                    rewards[index] = 0
+                    dones[index] = 0
+            else:
+                break
+            connection.send(message)
+    except (EOFError, KeyboardInterrupt):
+        pass
+    finally:
+        for view in (observations, rewards, actions, dones):
+            view.release()
+        memory.close()
+
+
+class CarVectorEnv:
+    def __init__(self, count, workers=None, difficulty="Medium", seed=None, horde=0, frames=1):
+        self.count = count
+        self.frames = frames
+        workers = max(1, min(count, workers or os.cpu_count() or 1))
+        self.memory = shared_memory.SharedMemory(create=True, size=buffer_size(count))
+        views = buffer_views(self.memory.buf, count)
+        if np is not None:
+            self.views = ()
+            self.observations = np.ndarray((count, OBSERVATION_SIZE), dtype=np.float64, buffer=self.memory.buf)
+            self.rewards = np.ndarray(count, dtype=np.float64, buffer=self.memory.buf,
+                                      offset=count * OBSERVATION_SIZE * 8)
+            self.actions = np.ndarray(count, dtype=np.int8, buffer=self.memory.buf,
+                                      offset=count * (OBSERVATION_SIZE * 8 + 8))
+            self.dones = np.ndarray(count, dtype=np.bool_, buffer=self.memory.buf,
+                                    offset=count * (OBSERVATION_SIZE * 8 + 9))
+            for view in views:
+                view.release()
+        else:
+            self.views = views
+            self.observations, self.rewards, self.actions, self.dones = views
+
+        # Games are shared out as evenly as they go
+        self.connections = []
+        self.processes = []
+        for worker in range(workers):
+            first, last = count * worker // workers, count * (worker + 1) // workers
+            connection, worker_connection = multiprocessing.Pipe()
+            process = multiprocessing.Process(
+                target=run_worker,
+                args=(worker_connection, self.memory.name, count, first, last, difficulty, seed, horde, frames),
+                daemon=True,
+            )
+            process.start()
+            worker_connection.close()
+            self.connections.append(connection)
+            self.processes.append(process)
+        for connection in self.connections:
+            connection.recv()
+        self.steps = 0
+        self.step_time = 0
+
+    @property
+    def workers(self):
+        return len(self.processes)
+
+    def send(self, message):
+        for connection in self.connections:
+            connection.send(message)
+        for connection in self.connections:
+            connection.recv()
+
+    def reset(self):
+        # New games everywhere; the first ones are ready when this is made
+        self.send("reset")
+        return self.observations
+
+    def step(self, actions):
+        # actions: LEFT, STAY or RIGHT per game
+        start = time.perf_counter()
+        if np is not None:
+            self.actions[:] = actions
+        else:
+            self.actions[:] = array("b", actions)
+        self.send("step")
+        self.step_time += time.perf_counter() - start
+        self.steps += self.count
+        return self.observations, self.rewards, self.dones
+
+    def steps_per_second(self):
+        return self.steps / self.step_time if self.step_time else 0
+
+    def report(self):
+        print(f"Car vector env: {self.count} games on {self.workers} workers, {self.frames} frames a step, "
+              f"{self.steps} steps, {self.steps_per_second():,.0f} steps/sec "
+              f"({self.steps_per_second() * self.frames:,.0f} frames/sec)")
+
+    def close(self):
+        for connection in self.connections:
+            try:
+                connection.send("close")
+            except (BrokenPipeError, OSError):
+                pass
+        for process in self.processes:
+            process.join(timeout=5)
+            if process.is_alive():
+                process.terminate()
+        self.connections = []
+        self.processes = []
+        if self.memory is not None:
+            self.observations = self.rewards = self.actions = self.dones = None
+            for view in self.views:
+                view.release()
+            self.views = ()
+            self.memory.close()
+            self.memory.unlink()
+            self.memory = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,77 @@
+import os
+import sys
+
+if __package__ in (None, ""):
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from smg.game import run_standalone
+from SnakeGame.big_snake import BigSnakeGame, parse_board_size, EMPTY_COLORS, BODY, FOOD
+from SnakeGame.snake_arena import Arena, FOOD as FOOD_CELL, BODY as OTHER_CELL, HUMAN_BODY
+from SnakeGame.snake_core import FOOD_REWARD, DEATH_REWARD
+
+# Board size in cells and number of computer snakes, e.g.
+# SMG_ARENA_BOARD=1000x1000 SMG_ARENA_SNAKES=1000
+ARENA_BOARD = os.environ.get("SMG_ARENA_BOARD", "300x300")
+ARENA_SNAKES = int(os.environ.get("SMG_ARENA_SNAKES", "200"))
+
+# Colors
+OTHER = (200, 120, 255)
+
+
+# SnakeGame steps a SnakeSim; this stands in for one. Each step advances the
+# whole arena with the player's turn and reports on the player's snake.
+class ArenaPlayer:
+    def __init__(self, arena, index=0):
+        self.arena = arena
+        self.index = index
+        self.body = arena.snakes[index]
+
+    @property
+    def direction(self):
+        return self.body.direction
+
+    @property
+    def score(self):
+        return self.body.score
+
+    def step(self, action=None):
+        score = self.body.score
+        self.arena.tick({self.index: action})
+        state = self.body.head, None, self.body.direction
+        if not self.body.alive:
+            return state, DEATH_REWARD, True
+        return state, (self.body.score - score) * FOOD_REWARD, False
+
+
+# Big Snake with a few hundred computer snakes on the same board. Drawing
+# works the same way: the tiles repaint only what the arena changed this tick.
+class SnakeArenaGame(BigSnakeGame):
+    caption = "SMG Snake Arena"
+    cols, rows = parse_board_size(ARENA_BOARD)
+
+    def create_sim(self):
+        self.arena = Arena(self.cols, self.rows, ARENA_SNAKES + 1, humans=1, track_changes=True)
+        return ArenaPlayer(self.arena)
+
+    def toggle_autopilot(self):
+        print("The autopilot only plays single-snake boards")
+
+    def cell_color(self, cell):
+        value = self.arena.grid[cell]
+        if value == FOOD_CELL:
+            return FOOD
+        if value == OTHER_CELL:
+            return OTHER
+        # The player's head is drawn as a sliding sprite on an empty cell
+        if value == HUMAN_BODY and cell != self.sim.body.head:
+            return BODY
+        return EMPTY_COLORS[(cell % self.cols + cell // self.cols) % 2]
+
+    def changed_cells(self, old_head):
+        changed = self.arena.take_changes()
+        changed.append(old_head)
+        return changed
+
+
+if __name__ == "__main__":
+    run_standalone(SnakeArenaGame)
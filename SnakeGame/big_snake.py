@@ -0,0 +1,176 @@
+import pygame
+import os
+import sys
+from collections import OrderedDict
+from itertools import islice
+
+if __package__ in (None, ""):
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from smg.game import WIDTH, HEIGHT, run_standalone
+from SnakeGame.snake_game import SnakeGame, GRID_SIZE
+
+# Board size in cells, e.g. SMG_SNAKE_BOARD=1000x1000
+BOARD_SIZE = os.environ.get("SMG_SNAKE_BOARD", "500x500")
+CELL_SIZE = 8
+
+# The board is drawn into square chunks of CHUNK_CELLS x CHUNK_CELLS cells.
+# Only the chunks near the camera are kept, oldest dropped first.
+CHUNK_CELLS = 64
+MAX_CHUNKS = 24
+
+# Colors
+OUTSIDE = (10, 10, 10)
+EMPTY_COLORS = ((24, 70, 24), (30, 80, 30))
+BODY = (0, 200, 0)
+HEAD = (255, 255, 255)
+FOOD = (255, 0, 0)
+
+# Explode only the front of the snake; the rest is off screen anyway
+MAX_EXPLODING_SEGMENTS = 200
+
+
+def parse_board_size(text):
+    cols, rows = text.lower().split("x")
+    return int(cols), int(rows)
+
+
+def follow(x, y, board_width, board_height, cell_size):
+    # Camera that keeps (x, y) centred, clamped to the board (or the board
+    # centred when it is smaller than the window)
+    if board_width <= WIDTH:
+        camera_x = (board_width - WIDTH) / 2
+    else:
+        camera_x = min(max(x + cell_size / 2 - WIDTH / 2, 0), board_width - WIDTH)
+    if board_height <= HEIGHT:
+        camera_y = (board_height - HEIGHT) / 2
+    else:
+        camera_y = min(max(y + cell_size / 2 - HEIGHT / 2, 0), board_height - HEIGHT)
+    return camera_x, camera_y
+
+
+# Persistent tile surfaces for the whole board. A chunk is painted from the
+# game state once when it first comes into view; after that only the cells
+# that change are repainted, so drawing costs the same however long the
+# snake gets.
+class TileChunks:
+    def __init__(self, cols, rows, cell_size, color_of):
+        self.cols = cols
+        self.rows = rows
+        self.cell_size = cell_size
+        self.color_of = color_of
+        self.chunk_size = CHUNK_CELLS * cell_size
+        self.chunks = OrderedDict()
+        self.built = 0
+
+    def chunk(self, key):
+        surface = self.chunks.get(key)
+        if surface is not None:
+            self.chunks.move_to_end(key)
+            return surface
+
+        surface = pygame.Surface((self.chunk_size, self.chunk_size)).convert()
+        surface.fill(OUTSIDE)
+        chunk_x, chunk_y = key
+        for y in range(chunk_y * CHUNK_CELLS, min((chunk_y + 1) * CHUNK_CELLS, self.rows)):
+            for x in range(chunk_x * CHUNK_CELLS, min((chunk_x + 1) * CHUNK_CELLS, self.cols)):
+                self.paint_cell(surface, x, y)
+        self.chunks[key] = surface
+        self.built += 1
+        if len(self.chunks) > MAX_CHUNKS:
+            self.chunks.popitem(last=False)
+        return surface
+
+    def paint_cell(self, surface, x, y):
+        size = self.cell_size
+        rect = ((x % CHUNK_CELLS) * size, (y % CHUNK_CELLS) * size, size, size)
+        surface.fill(self.color_of(y * self.cols + x), rect)
+
+    def repaint(self, cells):
+        # Chunks that aren't built yet will pick the change up when they are
+        for cell in cells:
+            if cell is None:
+                continue
+            x, y = cell % self.cols, cell // self.cols
+            surface = self.chunks.get((x // CHUNK_CELLS, y // CHUNK_CELLS))
+            if surface is not None:
+                self.paint_cell(surface, x, y)
+
+    def draw(self, screen, camera_x, camera_y):
+        width, height = screen.get_size()
+        first_x = max(0, int(camera_x) // self.chunk_size)
+        first_y = max(0, int(camera_y) // self.chunk_size)
+        last_x = min((self.cols - 1) // CHUNK_CELLS, int(camera_x + width) // self.chunk_size)
+        last_y = min((self.rows - 1) // CHUNK_CELLS, int(camera_y + height) // self.chunk_size)
+        for chunk_y in range(first_y, last_y + 1):
+            for chunk_x in range(first_x, last_x + 1):
+                screen.blit(self.chunk((chunk_x, chunk_y)),
+                            (chunk_x * self.chunk_size - int(camera_x),
+                             chunk_y * self.chunk_size - int(camera_y)))
+
+
+# Snake on a board far bigger than the window, with a camera that follows the
+# head. The rules are the same as SnakeGame; only the drawing changes.
+class BigSnakeGame(SnakeGame):
+    caption = "SMG Big Snake"
+    cols, rows = parse_board_size(BOARD_SIZE)
+    cell_size = CELL_SIZE
+
+    def reset_game(self):
+        super().reset_game()
+        self.camera_x = self.camera_y = 0
+        self.tiles = TileChunks(self.cols, self.rows, self.cell_size, self.cell_color)
+
+    def cell_color(self, cell):
+        # The head cell stays empty in the tiles; the head sprite slides into
+        # it between ticks and the cell turns into body on the next tick
+        if cell == self.sim.body.head:
+            return EMPTY_COLORS[(cell % self.cols + cell // self.cols) % 2]
+        if cell == self.sim.food:
+            return FOOD
+        if cell in self.sim.body:
+            return BODY
+        return EMPTY_COLORS[(cell % self.cols + cell // self.cols) % 2]
+
+    def tick(self):
+        old_head = self.sim.body.head
+        super().tick()
+        if not self.game_over:
+            self.tiles.repaint(self.changed_cells(old_head))
+
+    def changed_cells(self, old_head):
+        # Old head becomes body, the new head cell is cleared (it may have
+        # been food), the tail leaves a hole and the food may have moved
+        return old_head, self.sim.body.head, self.sim.vacated, self.sim.food
+
+    def cell_position(self, cell):
+        # Screen position, so pop-ups and particles start where the cell is
+        size = self.cell_size
+        return (cell % self.cols * size - int(self.camera_x) + size // 2 - GRID_SIZE // 2,
+                cell // self.cols * size - int(self.camera_y) + size // 2 - GRID_SIZE // 2)
+
+    def explode(self, segments):
+        super().explode(islice(segments, MAX_EXPLODING_SEGMENTS))
+
+    def head_position(self, alpha):
+        # Only the head is interpolated; it comes from the cell behind it
+        size = self.cell_size
+        head = self.sim.body.head
+        before = self.sim.body.cells[1] if len(self.sim.body) > 1 else head
+        x, y = head % self.cols * size, head // self.cols * size
+        before_x, before_y = before % self.cols * size, before // self.cols * size
+        return before_x + (x - before_x) * alpha, before_y + (y - before_y) * alpha
+
+    def draw_board(self, alpha):
+        self.screen.fill(OUTSIDE)
+        head_x, head_y = self.head_position(0 if self.game_over else alpha)
+        self.camera_x, self.camera_y = follow(head_x, head_y, self.cols * self.cell_size,
+                                              self.rows * self.cell_size, self.cell_size)
+        self.tiles.draw(self.screen, self.camera_x, self.camera_y)
+        if not self.game_over:
+            self.screen.fill(HEAD, (int(head_x - self.camera_x), int(head_y - self.camera_y),
+                                    self.cell_size, self.cell_size))
+
+
+if __name__ == "__main__":
+    run_standalone(BigSnakeGame)
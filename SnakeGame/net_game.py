@@ -0,0 +1,207 @@
+import pygame
+import os
+import queue
+import socket
+import sys
+import threading
+import time
+from collections import deque
+
+if __package__ in (None, ""):
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from smg.fonts import sys_font
+from smg.game import Game, WIDTH, run_standalone
+from SnakeGame.arena_game import OTHER
+from SnakeGame.big_snake import TileChunks, follow, CELL_SIZE, EMPTY_COLORS, OUTSIDE, BODY, FOOD, HEAD
+from SnakeGame.snake_arena import FOOD as FOOD_CELL, BODY as OTHER_CELL, HUMAN_BODY
+from SnakeGame.snake_core import DIRECTIONS, UP, DOWN, LEFT, RIGHT
+from SnakeGame.snake_protocol import (
+    ANY_ROOM, DELTA, HELLO, HELLO_BODY, NO_HEAD, PING, PING_BODY, PONG, RESPAWN, TURN, TURN_BODY, WELCOME,
+    apply_delta, decode_delta, decode_welcome, frame, read_frame_blocking,
+)
+
+# Server to join, e.g. SMG_SNAKE_SERVER=192.168.1.20:8765
+SERVER = os.environ.get("SMG_SNAKE_SERVER", "127.0.0.1:8765")
+CONNECT_TIMEOUT = 3
+# Seconds between round-trip pings
+PING_INTERVAL = 0.5
+
+KEY_TURNS = {
+    pygame.K_UP: DIRECTIONS.index(UP),
+    pygame.K_DOWN: DIRECTIONS.index(DOWN),
+    pygame.K_LEFT: DIRECTIONS.index(LEFT),
+    pygame.K_RIGHT: DIRECTIONS.index(RIGHT),
+}
+
+# Colors
+WHITE = (255, 255, 255)
+OTHER_PLAYER = (255, 190, 60)
+
+
+# Client for SnakeGame/snake_server.py. The server runs the rules; this only
+# sends key presses and draws the cells the server says have changed.
+class SnakeNetGame(Game):
+    caption = "SMG Snake Online"
+
+    def load_assets(self):
+        self.font = sys_font("Arial", 24, bold=True)
+
+    def connect(self):
+        host, port = SERVER.rsplit(":", 1)
+        self.sock = socket.create_connection((host, int(port)), timeout=CONNECT_TIMEOUT)
+        self.sock.settimeout(None)
+        self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.sock.sendall(frame(HELLO, HELLO_BODY.pack(ANY_ROOM)))
+        self.stream = self.sock.makefile("rb")
+        message = read_frame_blocking(self.stream)
+        if message is None or message[0] != WELCOME:
+            raise ConnectionError("no welcome from the server")
+        self.room, self.cols, self.rows, self.index, self.grid = decode_welcome(message[1])
+
+        self.deltas = queue.Queue()
+        self.pings = {}
+        self.next_ping = 0
+        self.round_trips = []
+        threading.Thread(target=self.receive, daemon=True).start()
+
+    def receive(self):
+        # Reader thread; None tells the game loop the server has gone
+        while True:
+            try:
+                message = read_frame_blocking(self.stream)
+            except OSError:
+                message = None
+            if message is None:
+                self.deltas.put(None)
+                return
+            if message[0] == DELTA:
+                self.deltas.put(decode_delta(message[1]))
+            elif message[0] == PONG:
+                sent = self.pings.pop(PING_BODY.unpack_from(message[1])[0], None)
+                if sent is not None:
+                    self.round_trips.append(time.monotonic() - sent)
+
+    def ping(self):
+        # Timed on our own clock, so it holds for a server on another machine
+        ping_id = self.next_ping
+        self.next_ping = (ping_id + 1) & 0xFFFFFFFF
+        self.pings[ping_id] = time.monotonic()
+        self.send(PING, PING_BODY.pack(ping_id))
+
+    def send(self, kind, payload=b""):
+        try:
+            self.sock.sendall(frame(kind, payload))
+        except OSError:
+            pass
+
+    def cell_color(self, cell):
+        value = self.grid[cell]
+        if value == FOOD_CELL:
+            return FOOD
+        if value == OTHER_CELL:
+            return OTHER
+        if value == HUMAN_BODY:
+            if cell == self.head:
+                return HEAD
+            return BODY if cell in self.own_cells else OTHER_PLAYER
+        return EMPTY_COLORS[(cell % self.cols + cell // self.cols) % 2]
+
+    def apply_deltas(self):
+        # Returns False once the connection is gone
+        while True:
+            try:
+                delta = self.deltas.get_nowait()
+            except queue.Empty:
+                return True
+            if delta is None:
+                print("Disconnected from the Snake server")
+                return False
+            tick, sent_at, head, self.score, self.alive, cells, values = delta
+            old_head, self.head = self.head, None if head == NO_HEAD else head
+            apply_delta(self.grid, cells, values)
+            self.tiles.repaint(cells)
+            self.tiles.repaint((old_head, self.head))
+            self.tiles.repaint(self.follow_own_snake())
+
+    def follow_own_snake(self):
+        # Every human snake is HUMAN_BODY in the grid. Ours is the last
+        # score + 1 cells our head has been on (it grows one cell per food),
+        # so other players can be drawn in their own color. Returns the
+        # cells that stopped being ours.
+        trail = self.own_trail
+        if self.head is None:
+            left = list(trail)
+            trail.clear()
+        else:
+            trail.appendleft(self.head)
+            self.own_cells.add(self.head)
+            left = []
+            while len(trail) > self.score + 1:
+                left.append(trail.pop())
+        self.own_cells.difference_update(left)
+        return left
+
+    def run(self):
+        try:
+            self.connect()
+        except OSError as e:
+            print(f"Could not join the Snake server at {SERVER}: {e}")
+            return True
+        print(f"Joined room {self.room} on {SERVER}")
+
+        self.tiles = TileChunks(self.cols, self.rows, CELL_SIZE, self.cell_color)
+        self.head = None
+        self.own_trail = deque()
+        self.own_cells = set()
+        self.score = 0
+        self.alive = True
+        last_ping = 0
+        camera_x = camera_y = 0
+
+        running = True
+        return_to_launcher = True
+        while running:
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    running = False
+                    return_to_launcher = False
+                elif event.type == pygame.KEYDOWN:
+                    if event.key in KEY_TURNS:
+                        self.send(TURN, TURN_BODY.pack(KEY_TURNS[event.key]))
+                    elif event.key == pygame.K_SPACE and not self.alive:
+                        self.send(RESPAWN)
+                    elif event.key == pygame.K_ESCAPE:
+                        running = False
+
+            if not self.apply_deltas():
+                running = False
+            if time.monotonic() - last_ping >= PING_INTERVAL:
+                last_ping = time.monotonic()
+                self.ping()
+
+            # Keep the camera where it was while the snake is dead
+            if self.head is not None:
+                camera_x, camera_y = follow(self.head % self.cols * CELL_SIZE, self.head // self.cols * CELL_SIZE,
+                                            self.cols * CELL_SIZE, self.rows * CELL_SIZE, CELL_SIZE)
+            self.screen.fill(OUTSIDE)
+            self.tiles.draw(self.screen, camera_x, camera_y)
+            status = f"Room {self.room}  Score: {self.score}"
+            if not self.alive:
+                status += "  Press Space to play again"
+            text = self.font.render(status, True, WHITE)
+            self.screen.blit(text, text.get_rect(topright=(WIDTH - 15, 15)))
+            self.present()
+            self.clock.tick(60)
+
+        self.sock.close()
+        round_trips = list(self.round_trips)
+        if round_trips:
+            average = sum(round_trips) / len(round_trips)
+            print(f"Round trip to the server over {len(round_trips)} pings: "
+                  f"avg {average * 1000:.1f} ms, max {max(round_trips) * 1000:.1f} ms")
+        return return_to_launcher
+
+
+if __name__ == "__main__":
+    run_standalone(SnakeNetGame)
@@ -0,0 +1,222 @@
+import random
+from collections import deque
+
+from SnakeGame.snake_core import DIRECTIONS
+
+# Many snakes on one board, with no window. Every snake writes into one
+# shared grid of bytes, so a collision test is a single lookup for each head
+# however many snakes there are and however long they get.
+#
+# All snakes move at once each tick. Tails leave first (except for snakes
+# that are eating), then heads arrive: two heads on the same cell both die,
+# and a head on a wall or on any body dies. A dead snake's cells are cleared
+# and computer snakes respawn somewhere free. Human snakes stay dead.
+
+EMPTY, FOOD, BODY, HUMAN_BODY = 0, 1, 2, 3
+
+# Tries at finding a free cell by random pick before giving up for the tick
+SPAWN_TRIES = 32
+# Chance per tick that a computer snake turns for no reason
+WANDER = 0.05
+
+
+class ArenaSnake:
+    __slots__ = ("cells", "direction", "alive", "score", "mark", "index", "removed")
+
+    def __init__(self, cell, direction, human=False):
+        self.cells = deque([cell])
+        self.direction = direction
+        self.alive = True
+        self.score = 0
+        self.mark = HUMAN_BODY if human else BODY
+        # Taken off the board for good by Arena.remove
+        self.removed = False
+
+    def __len__(self):
+        return len(self.cells)
+
+    def __iter__(self):
+        return iter(self.cells)
+
+    @property
+    def head(self):
+        return self.cells[0]
+
+    @property
+    def human(self):
+        return self.mark == HUMAN_BODY
+
+
+class Arena:
+    def __init__(self, cols, rows, snake_count, food_count=None, humans=0, seed=None, track_changes=False):
+        self.cols = cols
+        self.rows = rows
+        self.rng = random.Random(seed)
+        self.grid = bytearray(cols * rows)
+        self.snakes = []
+        # Indexes of removed snakes, given to the next snakes that join
+        self.free_slots = []
+        self.food_count = 0
+        self.food_target = food_count if food_count is not None else snake_count
+        self.ticks = 0
+        self.deaths = 0
+        # Cells changed since the last take_changes(), for renderers and the
+        # server; only kept when asked for, so headless arenas do not grow it
+        self.changed = [] if track_changes else None
+        for i in range(snake_count):
+            self.spawn_snake(human=i < humans)
+        for _ in range(self.food_target):
+            self.spawn_food()
+
+    def take_changes(self):
+        if self.changed is None:
+            return []
+        changed, self.changed = self.changed, []
+        return changed
+
+    def free_cell(self):
+        cell_count = len(self.grid)
+        for _ in range(SPAWN_TRIES):
+            cell = self.rng.randrange(cell_count)
+            if self.grid[cell] == EMPTY:
+                return cell
+        return None
+
+    def spawn_snake(self, human=False):
+        cell = self.free_cell()
+        if cell is None:
+            return None
+        snake = ArenaSnake(cell, self.rng.choice(DIRECTIONS), human)
+        self.grid[cell] = snake.mark
+        if self.changed is not None:
+            self.changed.append(cell)
+        if self.free_slots:
+            snake.index = self.free_slots.pop()
+            self.snakes[snake.index] = snake
+        else:
+            snake.index = len(self.snakes)
+            self.snakes.append(snake)
+        return snake
+
+    def respawn(self, snake):
+        if snake.removed:
+            return
+        cell = self.free_cell()
+        if cell is None:
+            return
+        snake.cells = deque([cell])
+        snake.direction = self.rng.choice(DIRECTIONS)
+        snake.alive = True
+        snake.score = 0
+        self.grid[cell] = snake.mark
+        if self.changed is not None:
+            self.changed.append(cell)
+
+    def remove(self, snake):
+        # Take a snake off the board for good, e.g. when its player leaves;
+        # its index goes to the next snake that joins, so arenas that see
+        # many players come and go do not grow
+        if snake.removed:
+            return
+        snake.removed = True
+        if snake.alive:
+            snake.alive = False
+            for cell in snake.cells:
+                self.grid[cell] = EMPTY
+            if self.changed is not None:
+                self.changed.extend(snake.cells)
+        self.free_slots.append(snake.index)
+
+    def spawn_food(self):
+        cell = self.free_cell()
+        if cell is not None:
+            self.grid[cell] = FOOD
+            self.food_count += 1
+            if self.changed is not None:
+                self.changed.append(cell)
+
+    def next_cell(self, cell, direction):
+        # None past the edge of the board
+        x = cell % self.cols + direction[0]
+        y = cell // self.cols + direction[1]
+        if x < 0 or x >= self.cols or y < 0 or y >= self.rows:
+            return None
+        return y * self.cols + x
+
+    def steer(self, snake):
+        # Computer snakes: keep going, wander now and then, and turn aside
+        # from walls and bodies when there is a way out
+        grid = self.grid
+        dx, dy = snake.direction
+        if self.rng.random() < WANDER:
+            dx, dy = (dy, -dx) if self.rng.random() < 0.5 else (-dy, dx)
+        for direction in ((dx, dy), (dy, -dx), (-dy, dx)):
+            cell = self.next_cell(snake.cells[0], direction)
+            if cell is not None and grid[cell] < BODY:
+                return direction
+        return dx, dy
+
+    def tick(self, turns=None):
+        # turns maps the index of a human snake to its new direction; a turn
+        # straight back into the neck is ignored, as in SnakeSim
+        grid = self.grid
+        # Without change tracking this tick's changes go nowhere
+        changed = self.changed if self.changed is not None else []
+        self.ticks += 1
+
+        moving = []
+        for index, snake in enumerate(self.snakes):
+            if not snake.alive:
+                continue
+            if snake.human:
+                turn = turns.get(index) if turns else None
+                if turn is not None and turn != (-snake.direction[0], -snake.direction[1]):
+                    snake.direction = turn
+            else:
+                snake.direction = self.steer(snake)
+            moving.append((snake, self.next_cell(snake.cells[0], snake.direction)))
+
+        # Tails leave first, except for the snakes that are about to eat
+        tails = {}
+        for snake, cell in moving:
+            if cell is None or grid[cell] != FOOD:
+                tail = tails[snake] = snake.cells.pop()
+                grid[tail] = EMPTY
+                changed.append(tail)
+
+        # Heads that share a target all die; the rest die on a wall or body
+        arrivals = {}
+        for snake, cell in moving:
+            if cell is not None:
+                arrivals[cell] = arrivals.get(cell, 0) + 1
+        dead = []
+        for snake, cell in moving:
+            if cell is None or arrivals[cell] > 1 or grid[cell] >= BODY:
+                dead.append(snake)
+                continue
+            if grid[cell] == FOOD:
+                snake.score += 1
+                self.food_count -= 1
+            snake.cells.appendleft(cell)
+            grid[cell] = snake.mark
+            changed.append(cell)
+
+        # A dead snake keeps its last shape for renderers, but is gone from
+        # the grid (its tail cell may already belong to someone else)
+        for snake in dead:
+            snake.alive = False
+            self.deaths += 1
+            for cell in snake.cells:
+                grid[cell] = EMPTY
+            changed.extend(snake.cells)
+            if snake in tails:
+                snake.cells.append(tails[snake])
+            if not snake.human:
+                self.respawn(snake)
+
+        while self.food_count < self.food_target:
+            before = self.food_count
+            self.spawn_food()
+            if self.food_count == before:
+                break
+        return dead
@@ -0,0 +1,207 @@
+from array import array
+from collections import deque
+from itertools import islice
+
+from SnakeGame.snake_core import UP, DOWN, LEFT, RIGHT
+
+# Autopilot for SnakeSim that plays a board to the end.
+#
+# Safety comes from a Hamiltonian cycle over the board. The body always lies
+# on one stretch of the cycle, tail to head, so every cell ahead of the head
+# up to the tail is free or about to be. A move is allowed only if it lands
+# in that stretch, and never past the food. Following the cycle always
+# qualifies, so the snake can't die and eventually fills the board.
+#
+# Speed comes from the shortcuts. A breadth-first search runs on a bitboard
+# of the grid: a Python int whose bits are SnakeBody's occupancy bytes, one
+# shifted-and-masked int per search layer. Body cells free up as the tail
+# moves on, so a cell k segments from the tail counts as free from layer k+1.
+# The path that comes out stays valid while the head follows it and the food
+# stays put; it is reused step by step and only replanned when either
+# changes.
+#
+# That reuse is all the incremental planning there is: the search itself is
+# not patched cell by cell as the head and tail move. A path can't be blocked
+# by the tail, which only frees cells, and the head is on it, so checking the
+# head and the food is enough to keep it valid. What the tail frees is only
+# used at the next replan.
+#
+# Cost: from PLAN_LIMIT on there is no planning, and the snake follows the
+# cycle. Each food then takes up to a full lap, so a game to the end is
+# O(cells²) steps, each an O(1) decision. Measured, it takes about
+# 0.25 × cells² steps, or roughly 620,000 on 40x40.
+# benchmarks/snake_autopilot.py prints that ratio for each game it plays.
+
+# Layers searched per plan; further food is approached in stages
+PLAN_DEPTH = 256
+# Only look for shortcuts while the snake covers less than this share of the
+# board; past it the shortcut rule rejects almost every path
+PLAN_LIMIT = 0.5
+# Decisions to wait before planning again after a plan is rejected,
+# doubling while plans keep failing
+PLAN_BACKOFF = 4
+MAX_PLAN_BACKOFF = 256
+
+
+def hamiltonian_cycle(cols, rows):
+    # Along the top row, then a serpentine over the other rows that leaves
+    # column 0 free for the way back up. Needs an even number of rows, so
+    # odd ones are handled by transposing.
+    if rows % 2 == 1 and cols % 2 == 0:
+        return [y * cols + x for x, y in
+                (divmod(cell, rows) for cell in hamiltonian_cycle(rows, cols))]
+    if rows % 2 == 1 or cols < 2:
+        raise ValueError("Autopilot needs an even number of rows or columns")
+    cycle = list(range(cols))
+    for y in range(1, rows):
+        xs = range(cols - 1, 0, -1) if y % 2 == 1 else range(1, cols)
+        cycle.extend(y * cols + x for x in xs)
+    cycle.extend(y * cols for y in range(rows - 1, 0, -1))
+    return cycle
+
+
+class Autopilot:
+    def __init__(self, sim):
+        self.sim = sim
+        self.cols = cols = sim.cols
+        self.rows = rows = sim.rows
+        self.cell_count = cols * rows
+        self.order = array("i", bytes(4 * self.cell_count))
+        for i, cell in enumerate(hamiltonian_cycle(cols, rows)):
+            self.order[cell] = i
+
+        # Bitboard masks; cells with x > 0 and with x < cols - 1 catch bits
+        # that a one-cell shift wrapped onto the neighbouring row
+        self.board = (1 << self.cell_count) - 1
+        left_column = sum(1 << (y * cols) for y in range(rows))
+        self.not_left = self.board & ~left_column
+        self.not_right = self.board & ~(left_column << (cols - 1))
+
+        self.path = deque()
+        self.path_food = None
+        self.expected_head = None
+        self.plan_after = 0
+        self.backoff = PLAN_BACKOFF
+        self.decisions = 0
+        self.plans = 0
+
+    def neighbours(self, cell):
+        x, y = cell % self.cols, cell // self.cols
+        if x > 0:
+            yield cell - 1
+        if x < self.cols - 1:
+            yield cell + 1
+        if y > 0:
+            yield cell - self.cols
+        if y < self.rows - 1:
+            yield cell + self.cols
+
+    def safe(self, cell, head, limit, food_distance, back):
+        # Ahead of the head along the cycle and no further than the tail,
+        # which is never food and so always moves out of the way; not past
+        # the food either
+        distance = (self.order[cell] - self.order[head]) % self.cell_count
+        return 0 < distance <= limit and distance <= food_distance and cell != back
+
+    def decide(self):
+        self.decisions += 1
+        sim = self.sim
+        body = sim.body
+        head = body.cells[0]
+        order = self.order
+        count = self.cell_count
+        limit = (order[body.cells[-1]] - order[head]) % count or count
+        food_distance = (order[sim.food] - order[head]) % count
+        # Turning straight back is ignored by the rules. That only matters
+        # for a lone head, and for a two-cell snake whose neck is its tail.
+        if len(body) > 1:
+            back = body.cells[1]
+        else:
+            back = head - sim.direction[0] - sim.direction[1] * self.cols
+
+        # Drop the path once the head has left it or the food has moved
+        if self.path and (head != self.expected_head or sim.food != self.path_food):
+            self.path.clear()
+        if (not self.path and self.decisions >= self.plan_after
+                and len(body) < count * PLAN_LIMIT):
+            self.plan()
+
+        if self.path and self.safe(self.path[0], head, limit, food_distance, back):
+            step = self.path.popleft()
+            self.backoff = PLAN_BACKOFF
+        else:
+            if self.path:
+                self.path.clear()
+                self.plan_after = self.decisions + self.backoff
+                self.backoff = min(self.backoff * 2, MAX_PLAN_BACKOFF)
+            # The furthest allowed jump along the cycle. The next cell on the
+            # cycle is always allowed once the snake is longer than one cell;
+            # a lone head with that cell behind it can go anywhere but back.
+            allowed = [cell for cell in self.neighbours(head)
+                       if self.safe(cell, head, limit, food_distance, back)]
+            if not allowed:
+                allowed = [cell for cell in self.neighbours(head) if cell != back]
+            step = max(allowed, key=lambda cell: (order[cell] - order[head]) % count)
+
+        self.expected_head = step
+        difference = step - head
+        if difference == 1:
+            return RIGHT
+        if difference == -1:
+            return LEFT
+        return DOWN if difference > 0 else UP
+
+    def plan(self):
+        self.plans += 1
+        sim = self.sim
+        body = sim.body
+        cols = self.cols
+        food_bit = 1 << sim.food
+        free = self.board & ~int.from_bytes(body.occupancy, "little")
+        leaving = islice(reversed(body.cells), PLAN_DEPTH)
+
+        frontier = visited = 1 << body.cells[0]
+        layers = [frontier]
+        for _ in range(PLAN_DEPTH):
+            # The next segment from the tail has left by the next layer
+            segment = next(leaving, None)
+            if segment is not None:
+                free |= 1 << segment
+            frontier = (((frontier << 1) & self.not_left) | ((frontier >> 1) & self.not_right)
+                        | (frontier << cols) | (frontier >> cols)) & free & ~visited
+            if not frontier:
+                break
+            visited |= frontier
+            layers.append(frontier)
+            if frontier & food_bit:
+                break
+        if len(layers) < 2:
+            return
+
+        # Head for the food, or for the cell of the last layer nearest to it
+        if layers[-1] & food_bit:
+            target = sim.food
+        else:
+            food_x, food_y = sim.food % cols, sim.food // cols
+            bits = bin(layers[-1])[:1:-1]
+            cell = bits.find("1")
+            target, best = cell, None
+            while cell >= 0:
+                distance = abs(cell % cols - food_x) + abs(cell // cols - food_y)
+                if best is None or distance < best:
+                    target, best = cell, distance
+                cell = bits.find("1", cell + 1)
+
+        # Walk back through the layers to the head
+        path = [target]
+        cell = target
+        for layer in reversed(layers[1:-1]):
+            for neighbour in self.neighbours(cell):
+                if layer >> neighbour & 1:
+                    cell = neighbour
+                    break
+            path.append(cell)
+        path.reverse()
+        self.path = deque(path)
+        self.path_food = sim.food
+        self.expected_head = body.cells[0]
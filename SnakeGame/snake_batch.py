@@ -0,0 +1,119 @@
+import numpy as np
+
+from SnakeGame.snake_core import DIRECTIONS, RIGHT, FOOD_REWARD, DEATH_REWARD
+
+# Many games of Snake stepped together with NumPy, for bots that train on
+# thousands of boards at once. The rules are SnakeSim's: a turn into the neck
+# is ignored, the tail leaves before the head arrives unless the snake eats,
+# the walls and the body kill, and a full board ends the game. Games that end
+# start over inside the same step.
+#
+# Actions are indices into DIRECTIONS, or -1 to keep going. Each board keeps
+# a byte per cell and its body as a ring buffer of cell indices.
+
+DX = np.array([dx for dx, dy in DIRECTIONS], dtype=np.int32)
+DY = np.array([dy for dx, dy in DIRECTIONS], dtype=np.int32)
+OPPOSITE = np.array([DIRECTIONS.index((-dx, -dy)) for dx, dy in DIRECTIONS], dtype=np.int8)
+
+# Below this many free cells food is picked from the free list directly
+# instead of by retrying random cells
+DIRECT_PICK_CELLS = 64
+
+
+class SnakeBatch:
+    def __init__(self, count, cols, rows, seed=None):
+        self.count = count
+        self.cols = cols
+        self.rows = rows
+        self.cell_count = cols * rows
+        self.start_cell = rows // 2 * cols + cols // 2
+        self.rng = np.random.default_rng(seed)
+        self.envs = np.arange(count)
+
+        self.occupancy = np.zeros((count, self.cell_count), dtype=np.uint8)
+        self.body = np.zeros((count, self.cell_count), dtype=np.int32)
+        self.head_slot = np.zeros(count, dtype=np.int32)
+        self.tail_slot = np.zeros(count, dtype=np.int32)
+        self.length = np.zeros(count, dtype=np.int32)
+        self.direction = np.zeros(count, dtype=np.int8)
+        self.food = np.zeros(count, dtype=np.int32)
+        self.score = np.zeros(count, dtype=np.int32)
+        self.games = 0
+        self.reset()
+
+    @property
+    def head(self):
+        return self.body[self.envs, self.head_slot]
+
+    def state(self):
+        return self.head, self.food.copy(), self.direction.copy()
+
+    def reset(self, envs=None):
+        if envs is None:
+            envs = self.envs
+        self.occupancy[envs] = 0
+        self.body[envs, 0] = self.start_cell
+        self.head_slot[envs] = 0
+        self.tail_slot[envs] = 0
+        self.length[envs] = 1
+        self.direction[envs] = DIRECTIONS.index(RIGHT)
+        self.score[envs] = 0
+        self.occupancy[envs, self.start_cell] = 1
+        self.spawn_food(envs)
+        self.games += len(envs)
+        return self.state()
+
+    def spawn_food(self, envs):
+        # Uniform over each board's free cells. Retry random cells while the
+        # boards are mostly empty; nearly full boards pick from the free list.
+        crowded = self.cell_count - self.length[envs] <= DIRECT_PICK_CELLS
+        for env in envs[crowded]:
+            free = np.flatnonzero(self.occupancy[env] == 0)
+            self.food[env] = free[self.rng.integers(len(free))] if len(free) else -1
+        pending = envs[~crowded]
+        while len(pending):
+            cells = self.rng.integers(self.cell_count, size=len(pending))
+            self.food[pending] = cells
+            pending = pending[self.occupancy[pending, cells] != 0]
+
+    def step(self, actions):
+        actions = np.asarray(actions)
+        envs = self.envs
+
+        # Turn, unless it is straight back into the neck
+        turn = (actions >= 0) & (actions != OPPOSITE[self.direction])
+        self.direction = np.where(turn, actions, self.direction).astype(np.int8)
+
+        head = self.body[envs, self.head_slot]
+        x = head % self.cols + DX[self.direction]
+        y = head // self.cols + DY[self.direction]
+        wall = (x < 0) | (x >= self.cols) | (y < 0) | (y >= self.rows)
+        new_head = np.where(wall, 0, y * self.cols + x)
+        ate = ~wall & (new_head == self.food)
+
+        # The tail leaves first, so following your own tail is allowed
+        moving = ~wall & ~ate
+        movers = envs[moving]
+        self.occupancy[movers, self.body[movers, self.tail_slot[movers]]] = 0
+        self.tail_slot[movers] = (self.tail_slot[movers] + 1) % self.cell_count
+
+        hit = wall | (self.occupancy[envs, new_head] != 0)
+        alive = envs[~hit]
+        slots = (self.head_slot[alive] + 1) % self.cell_count
+        self.head_slot[alive] = slots
+        self.body[alive, slots] = new_head[alive]
+        self.occupancy[alive, new_head[alive]] = 1
+        self.length += ate
+        self.score += ate
+
+        # New food for the boards that ate; a full board has none and ends
+        eaters = envs[ate & ~hit]
+        if len(eaters):
+            self.spawn_food(eaters)
+        done = hit | (self.food < 0)
+        reward = np.where(hit, DEATH_REWARD, np.where(ate, FOOD_REWARD, 0)).astype(np.int8)
+
+        finished = envs[done]
+        if len(finished):
+            self.reset(finished)
+        return self.state(), reward, done
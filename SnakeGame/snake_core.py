@@ -0,0 +1,173 @@
+import random
+from array import array
+from collections import deque
+
+# Snake rules that don't need pygame. Cells are indexed as y * cols + x.
+
+# Directions in cells
+UP, DOWN, LEFT, RIGHT = (0, -1), (0, 1), (-1, 0), (1, 0)
+DIRECTIONS = (UP, DOWN, LEFT, RIGHT)
+
+# Rewards returned by SnakeSim.step
+FOOD_REWARD = 1
+DEATH_REWARD = -1
+
+
+# Cells the snake doesn't cover, kept in an array with each cell's slot in a
+# second array. Removing swaps the last cell into the hole, so add, remove and
+# a uniform random pick are all O(1) however full the board is.
+class FreeCells:
+    def __init__(self, count):
+        self.all_cells = array("i", range(count))
+        self.reset()
+
+    def reset(self):
+        # Copying the template is a memcpy, far cheaper than range() again
+        self.cells = array("i", self.all_cells)
+        self.position = array("i", self.all_cells)
+
+    def __len__(self):
+        return len(self.cells)
+
+    def __contains__(self, cell):
+        return self.position[cell] >= 0
+
+    def add(self, cell):
+        self.position[cell] = len(self.cells)
+        self.cells.append(cell)
+
+    def remove(self, cell):
+        slot = self.position[cell]
+        last = self.cells.pop()
+        if last != cell:
+            self.cells[slot] = last
+            self.position[last] = slot
+        self.position[cell] = -1
+
+    def choice(self, rng):
+        # None once the snake fills the board
+        if not self.cells:
+            return None
+        return self.cells[rng.randrange(len(self.cells))]
+
+
+# Snake body as a deque of cell indices, head first, plus a bitset of the
+# occupied cells. Moving, growing and the self-collision test are O(1) no
+# matter how long the snake is. The body also keeps its FreeCells up to date.
+class SnakeBody:
+    def __init__(self, cols, rows, start_cell):
+        self.cols = cols
+        self.rows = rows
+        self.cells = deque([start_cell])
+        self.occupancy = bytearray((cols * rows + 7) // 8)
+        self.occupancy[start_cell >> 3] |= 1 << (start_cell & 7)
+        self.free_cells = FreeCells(cols * rows)
+        self.free_cells.remove(start_cell)
+
+    def reset(self, start_cell):
+        # Only the bytes under the body need clearing; the free cells go back
+        # to their starting order so a seeded game replays exactly
+        for cell in self.cells:
+            self.occupancy[cell >> 3] = 0
+        self.free_cells.reset()
+        self.cells = deque([start_cell])
+        self.occupancy[start_cell >> 3] |= 1 << (start_cell & 7)
+        self.free_cells.remove(start_cell)
+
+    def __len__(self):
+        return len(self.cells)
+
+    def __iter__(self):
+        return iter(self.cells)
+
+    def __contains__(self, cell):
+        return self.occupancy[cell >> 3] >> (cell & 7) & 1 == 1
+
+    @property
+    def head(self):
+        return self.cells[0]
+
+    @property
+    def tail(self):
+        return self.cells[-1]
+
+    def next_cell(self, direction):
+        # Cell one step from the head, or None past the edge of the board
+        x = self.cells[0] % self.cols + direction[0]
+        y = self.cells[0] // self.cols + direction[1]
+        if x < 0 or x >= self.cols or y < 0 or y >= self.rows:
+            return None
+        return y * self.cols + x
+
+    def move(self, cell, grow=False):
+        # The tail leaves before the head arrives, so following your own tail
+        # is allowed unless the snake is growing this tick. Returns the cell
+        # the tail left (None when growing) and whether the head hit the body.
+        vacated = None
+        if not grow:
+            vacated = self.cells.pop()
+            self.occupancy[vacated >> 3] &= ~(1 << (vacated & 7)) & 0xFF
+            self.free_cells.add(vacated)
+        hit = cell in self
+        if not hit:
+            self.free_cells.remove(cell)
+        self.cells.appendleft(cell)
+        self.occupancy[cell >> 3] |= 1 << (cell & 7)
+        return vacated, hit
+
+    def spawn_food(self, rng):
+        # Uniform over the cells the snake doesn't cover; None on a full board
+        return self.free_cells.choice(rng)
+
+
+# One game of Snake with no window: the rules the interactive game, bots and
+# benchmarks all share. step() takes a direction (or None to keep going) and
+# returns (state, reward, done), where state is (head, food, direction).
+# A turn straight back into the neck is ignored, as it is with the keyboard.
+class SnakeSim:
+    def __init__(self, cols, rows, seed=None):
+        self.cols = cols
+        self.rows = rows
+        self.body = SnakeBody(cols, rows, rows // 2 * cols + cols // 2)
+        self.reset(seed)
+
+    def reset(self, seed=None):
+        self.rng = random.Random(seed)
+        self.body.reset(self.rows // 2 * self.cols + self.cols // 2)
+        self.direction = RIGHT
+        self.food = self.body.spawn_food(self.rng)
+        self.vacated = None
+        self.ate = False
+        self.score = 0
+        self.steps = 0
+        self.done = False
+        return self.state()
+
+    def state(self):
+        return self.body.cells[0], self.food, self.direction
+
+    def step(self, action=None):
+        if self.done:
+            return self.state(), 0, True
+        if action is not None and action != (-self.direction[0], -self.direction[1]):
+            self.direction = action
+        self.steps += 1
+
+        new_head = self.body.next_cell(self.direction)
+        if new_head is None:
+            self.done = True
+            return self.state(), DEATH_REWARD, True
+
+        self.ate = new_head == self.food
+        self.vacated, hit = self.body.move(new_head, grow=self.ate)
+        if hit:
+            self.done = True
+            return self.state(), DEATH_REWARD, True
+        if not self.ate:
+            return self.state(), 0, False
+
+        # No room left for food means the board is full
+        self.score += 1
+        self.food = self.body.spawn_food(self.rng)
+        self.done = self.food is None
+        return self.state(), FOOD_REWARD, self.done
@@ -1,16 +1,24 @@
 import pygame
 import random
 import os
+import sys
 import math
+import time
+from collections import deque
+from itertools import islice
 
-# Initialize Pygame
-pygame.init()
+if __package__ in (None, ""):
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from smg.assets import load_image
+from smg.fonts import sys_font
+from smg.game import Game, run_standalone
+from smg.transforms import transforms
+from SnakeGame.snake_autopilot import Autopilot
+from SnakeGame.snake_core import SnakeSim, UP, DOWN, LEFT, RIGHT
 
 # Window settings
 WIDTH, HEIGHT = 800, 600
-screen = pygame.display.set_mode((WIDTH, HEIGHT))
-pygame.display.set_caption("SMG Snake Game")
-clock = pygame.time.Clock()
 
 # Colors
 GREEN = (0, 255, 0)
@@ -21,34 +29,10 @@ DARK_GREEN = (0, 200, 0)
 LIGHT_GREEN = (100, 255, 100)
 TRANSPARENT_PURPLE = (128, 0, 128, 150)
 
-# Load textures (place these files in the SnakeGame/ folder)
-try:
-    snake_head_image = pygame.image.load("SnakeGame/snake_head.png").convert_alpha()
-    snake_head_image = pygame.transform.scale(snake_head_image, (30, 30))
-except FileNotFoundError:
-    snake_head_image = pygame.Surface((20, 20))
-    snake_head_image.fill(WHITE)
-
-try:
-    snake_body_image = pygame.image.load("SnakeGame/snake_body.png").convert_alpha()
-    snake_body_image = pygame.transform.scale(snake_body_image, (22, 22))
-except FileNotFoundError:
-    snake_body_image = snake_head_image
-
-try:
-    food_image = pygame.image.load("SnakeGame/food.png").convert_alpha()
-    food_base_size = (25, 25)
-    food_image = pygame.transform.scale(food_image, food_base_size)
-except FileNotFoundError:
-    food_image = pygame.Surface((26, 26))
-    food_image.fill(RED)
-
-try:
-    background_image = pygame.image.load("SnakeGame/background.png").convert()
-    background_image = pygame.transform.scale(background_image, (WIDTH, HEIGHT))
-except FileNotFoundError:
-    background_image = pygame.Surface((WIDTH, HEIGHT))
-    background_image.fill(GREEN)
+food_base_size = (25, 25)
+# The head image faces right
+HEAD_ANGLES = {RIGHT: 0, LEFT: 180, UP: 90, DOWN: -90}
+background_speed = 10  # pixels per second
 
 # Particle class for death animation
 class Particle:
@@ -73,6 +57,8 @@ class Particle:
         pygame.draw.circle(surface, PURPLE, (int(self.x), int(self.y)), self.radius, 1)
 
 # Score pop-up class for animation
+POPUP_RATE = 10  # pixels and lifetime per second
+
 class ScorePopup:
     def __init__(self, x, y, value):
         self.x = x
@@ -81,195 +67,296 @@ class ScorePopup:
         self.lifetime = 60
         self.alpha = 255
 
-    def update(self):
-        self.y -= 1
-        self.lifetime -= 1
+    def update(self, dt):
+        # Rises and fades at the old 10 FPS play rate, whatever the frame rate
+        self.y -= POPUP_RATE * dt
+        self.lifetime -= POPUP_RATE * dt
         self.alpha = max(0, int(255 * (self.lifetime / 60)))
 
     def draw(self, surface):
-        font = pygame.font.SysFont("Arial", 16, bold=True)  # Reduced from 20 to 16
+        font = sys_font("Arial", 16, bold=True)  # Reduced from 20 to 16
         text = font.render(f"+{self.value}", True, RED)
         text.set_alpha(self.alpha)
-        text_rect = text.get_rect(center=(self.x, self.y))
+        text_rect = text.get_rect(center=(self.x, int(self.y)))
         surface.blit(text, text_rect)
 
 # Snake and food
 GRID_SIZE = 30
-snake = [(400, 300)]
-direction = (GRID_SIZE, 0)
-food = pygame.Rect(
-    random.randint(0, WIDTH - GRID_SIZE) // GRID_SIZE * GRID_SIZE,
-    random.randint(0, HEIGHT - GRID_SIZE) // GRID_SIZE * GRID_SIZE,
-    GRID_SIZE, GRID_SIZE
-)
-score = 0
-score_animation_scale = 1.0
-score_popups = []
-
-# Animation variables
-animation_time = 0
-background_y = 0
-background_speed = 1
-glow_animation = 0
-
-# Death animation variables
-particles = []
+GRID_COLS = WIDTH // GRID_SIZE
+GRID_ROWS = HEIGHT // GRID_SIZE
+
+KEY_DIRECTIONS = {pygame.K_UP: UP, pygame.K_DOWN: DOWN, pygame.K_LEFT: LEFT, pygame.K_RIGHT: RIGHT}
+
+# Fixed simulation step; rendering runs at display rate in between
+TICK_TIME = 0.1
+MAX_FRAME_TIME = 0.25
+TURN_QUEUE_SIZE = 3
+
+def cell_position(cell):
+    return cell % GRID_COLS * GRID_SIZE, cell // GRID_COLS * GRID_SIZE
+
+# Death animation
 death_animation_duration = 120
-death_animation_timer = 0
-game_over = False
-
-# Game loop
-running = True
-last_direction = direction
-while running:
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
-            running = False
-
-    if not game_over:
-        # Update animation time
-        animation_time += 0.1
-        glow_animation += 0.05
-
-        # Movement
-        keys = pygame.key.get_pressed()
-        if keys[pygame.K_UP] and direction != (0, GRID_SIZE):
-            direction = (0, -GRID_SIZE)
-        if keys[pygame.K_DOWN] and direction != (0, -GRID_SIZE):
-            direction = (0, GRID_SIZE)
-        if keys[pygame.K_LEFT] and direction != (GRID_SIZE, 0):
-            direction = (-GRID_SIZE, 0)
-        if keys[pygame.K_RIGHT] and direction != (-GRID_SIZE, 0):
-            direction = (GRID_SIZE, 0)
-
-        # Update snake
-        new_head = (snake[0][0] + direction[0], snake[0][1] + direction[1])
-        snake.insert(0, new_head)
-        if pygame.Rect(new_head[0], new_head[1], GRID_SIZE, GRID_SIZE).colliderect(food):
-            food.topleft = (
-                random.randint(0, WIDTH - GRID_SIZE) // GRID_SIZE * GRID_SIZE,
-                random.randint(0, HEIGHT - GRID_SIZE) // GRID_SIZE * GRID_SIZE
+
+
+class SnakeGame(Game):
+    caption = "SMG Snake Game"
+    cols = GRID_COLS
+    rows = GRID_ROWS
+
+    def load_assets(self):
+        # Load textures (place these files in the SnakeGame/ folder)
+        try:
+            self.snake_head_image = load_image("SnakeGame/snake_head.png", (30, 30))
+        except FileNotFoundError:
+            self.snake_head_image = pygame.Surface((20, 20))
+            self.snake_head_image.fill(WHITE)
+
+        try:
+            self.snake_body_image = load_image("SnakeGame/snake_body.png", (22, 22))
+        except FileNotFoundError:
+            self.snake_body_image = self.snake_head_image
+
+        try:
+            self.food_image = load_image("SnakeGame/food.png", food_base_size)
+        except FileNotFoundError:
+            self.food_image = pygame.Surface((26, 26))
+            self.food_image.fill(RED)
+
+        try:
+            self.background_image = load_image("SnakeGame/background.png", (WIDTH, HEIGHT), alpha=False)
+        except FileNotFoundError:
+            self.background_image = pygame.Surface((WIDTH, HEIGHT))
+            self.background_image.fill(GREEN)
+
+    def reset_game(self):
+        # The rules run in a SnakeSim; the game reads it to draw
+        self.sim = self.create_sim()
+        self.autopilot = None
+        self.score_animation_scale = 1.0
+        self.score_popups = []
+
+        # Buffered turns as (direction, time the key went down)
+        self.turn_queue = deque()
+        self.turn_latencies = []
+        self.accumulator = 0.0
+
+        # Animation variables
+        self.animation_time = 0
+        self.background_y = 0
+        self.glow_animation = 0
+
+        # Death animation variables
+        self.particles = []
+        self.death_animation_timer = 0
+        self.game_over = False
+
+    def create_sim(self):
+        return SnakeSim(self.cols, self.rows)
+
+    def run(self):
+        self.reset_game()
+
+        # Game loop: simulation on a fixed tick, rendering at display rate
+        self.running = True
+        self.return_to_launcher = True
+        self.clock.tick()
+        while self.running:
+            self.frame(min(self.clock.get_time() / 1000, MAX_FRAME_TIME))
+            self.present()
+            self.clock.tick(60)
+        self.report_latency()
+        return self.return_to_launcher
+
+    def queue_turn(self, direction):
+        # Validate against the last queued direction so quick combos like
+        # UP then LEFT inside one tick both land instead of being dropped
+        last = self.turn_queue[-1][0] if self.turn_queue else self.sim.direction
+        if direction == last or direction == (-last[0], -last[1]):
+            return
+        if len(self.turn_queue) < TURN_QUEUE_SIZE:
+            self.turn_queue.append((direction, time.perf_counter()))
+
+    def toggle_autopilot(self):
+        if self.autopilot is not None:
+            self.autopilot = None
+            print("Autopilot off")
+            return
+        try:
+            self.autopilot = Autopilot(self.sim)
+            self.turn_queue.clear()
+            print("Autopilot on")
+        except ValueError as e:
+            print(e)
+
+    def report_latency(self):
+        if self.turn_latencies:
+            average = sum(self.turn_latencies) / len(self.turn_latencies)
+            print(f"Input latency over {len(self.turn_latencies)} turns: "
+                  f"avg {average * 1000:.1f} ms, max {max(self.turn_latencies) * 1000:.1f} ms")
+
+    def tick(self):
+        # Apply at most one buffered turn per logical tick
+        turn = None
+        if self.autopilot is not None:
+            turn = self.autopilot.decide()
+        elif self.turn_queue:
+            turn, pressed_at = self.turn_queue.popleft()
+            self.turn_latencies.append(time.perf_counter() - pressed_at)
+
+        _, reward, done = self.sim.step(turn)
+        if reward > 0:
+            self.score_animation_scale = 1.3
+            head_x, head_y = self.cell_position(self.sim.body.head)
+            self.score_popups.append(ScorePopup(head_x + GRID_SIZE // 2, head_y, reward))
+
+        # Collision, or no room left for food on a full board
+        if done:
+            self.game_over = True
+            self.explode(self.sim.body)
+
+    def cell_position(self, cell):
+        return cell_position(cell)
+
+    def explode(self, segments):
+        for segment in segments:
+            segment_x, segment_y = self.cell_position(segment)
+            for _ in range(5):
+                particle = Particle(segment_x + GRID_SIZE // 2, segment_y + GRID_SIZE // 2)
+                self.particles.append(particle)
+
+    def segment_positions(self, alpha):
+        # Each segment slides from where the segment behind it now sits (the
+        # vacated cell for the tail, or nowhere if the snake just grew)
+        cells = self.sim.body.cells
+        previous = list(islice(cells, 1, None))
+        previous.append(cells[-1] if self.sim.vacated is None else self.sim.vacated)
+        for cell, before in zip(cells, previous):
+            x, y = cell_position(cell)
+            before_x, before_y = cell_position(before)
+            yield before_x + (x - before_x) * alpha, before_y + (y - before_y) * alpha
+
+    def frame(self, dt):
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                self.running = False
+                self.return_to_launcher = False
+            elif event.type == pygame.KEYDOWN and event.key in KEY_DIRECTIONS:
+                if self.autopilot is None:
+                    self.queue_turn(KEY_DIRECTIONS[event.key])
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_a:
+                self.toggle_autopilot()
+
+        if not self.game_over:
+            # Update animation time
+            self.animation_time += dt
+            self.glow_animation += dt * 0.5
+
+            # Run however many logical ticks the elapsed time covers
+            self.accumulator += dt
+            while self.accumulator >= TICK_TIME and not self.game_over:
+                self.accumulator -= TICK_TIME
+                self.tick()
+
+        # Scroll the background
+        self.background_y += background_speed * dt
+        if self.background_y >= HEIGHT:
+            self.background_y = 0
+
+        self.draw_board(self.accumulator / TICK_TIME)
+
+        # Draw particles for death animation
+        if self.game_over:
+            self.death_animation_timer += 1
+            for particle in self.particles[:]:
+                particle.update()
+                particle.draw(self.screen)
+                if particle.lifetime <= 0:
+                    self.particles.remove(particle)
+            if self.death_animation_timer >= death_animation_duration:
+                self.running = False
+
+        self.draw_score(dt)
+
+    def draw_board(self, alpha):
+        # Draw the scrolling background
+        self.screen.blit(self.background_image, (0, int(self.background_y) - HEIGHT))
+        self.screen.blit(self.background_image, (0, int(self.background_y)))
+
+        if not self.game_over:
+            # Draw snake with animation, interpolated between the last two ticks
+            for i, (segment_x, segment_y) in enumerate(self.segment_positions(alpha)):
+                if i == 0:
+                    head_rotated = transforms.rotate(self.snake_head_image, HEAD_ANGLES[self.sim.direction])
+                    self.screen.blit(head_rotated, (int(segment_x), int(segment_y)))
+                else:
+                    scale = 1 + 0.1 * math.sin(self.animation_time + i * 0.5)
+                    body_scaled = transforms.scale(self.snake_body_image, (int(30 * scale), int(30 * scale)))
+                    body_rect = body_scaled.get_rect(center=(int(segment_x) + 15, int(segment_y) + 15))
+                    self.screen.blit(body_scaled, body_rect)
+
+            # Draw food with pulsing animation
+            food_scale = 1 + 0.05 * math.sin(self.animation_time * 2)
+            food_scaled = transforms.scale(
+                self.food_image,
+                (int(food_base_size[0] * food_scale), int(food_base_size[1] * food_scale))
             )
-            score += 1
-            score_animation_scale = 1.3
-            score_popups.append(ScorePopup(new_head[0] + GRID_SIZE // 2, new_head[1], 1))
-        else:
-            snake.pop()
-
-        # Collision
-        if (new_head[0] < 0 or new_head[0] >= WIDTH or
-            new_head[1] < 0 or new_head[1] >= HEIGHT or
-            new_head in snake[1:]):
-            game_over = True
-            for segment in snake:
-                for _ in range(5):
-                    particle = Particle(segment[0] + GRID_SIZE // 2, segment[1] + GRID_SIZE // 2)
-                    particles.append(particle)
-
-    # Scroll the background
-    background_y += background_speed
-    if background_y >= HEIGHT:
-        background_y = 0
-
-    # Draw the scrolling background
-    screen.blit(background_image, (0, background_y - HEIGHT))
-    screen.blit(background_image, (0, background_y))
-
-    if not game_over:
-        # Draw snake with animation
-        for i, segment in enumerate(snake):
-            if i == 0:
-                head_rotated = snake_head_image
-                if direction == (GRID_SIZE, 0):
-                    head_rotated = pygame.transform.rotate(snake_head_image, 0)
-                elif direction == (-GRID_SIZE, 0):
-                    head_rotated = pygame.transform.rotate(snake_head_image, 180)
-                elif direction == (0, -GRID_SIZE):
-                    head_rotated = pygame.transform.rotate(snake_head_image, 90)
-                elif direction == (0, GRID_SIZE):
-                    head_rotated = pygame.transform.rotate(snake_head_image, -90)
-                screen.blit(head_rotated, (segment[0], segment[1]))
-            else:
-                scale = 1 + 0.1 * math.sin(animation_time + i * 0.5)
-                body_scaled = pygame.transform.scale(
-                    snake_body_image,
-                    (int(30 * scale), int(30 * scale))
-                )
-                body_rect = body_scaled.get_rect(center=(segment[0] + 15, segment[1] + 15))
-                screen.blit(body_scaled, body_rect)
-
-        # Draw food with pulsing animation
-        food_scale = 1 + 0.05 * math.sin(animation_time * 2)
-        food_scaled = pygame.transform.scale(
-            food_image,
-            (int(food_base_size[0] * food_scale), int(food_base_size[1] * food_scale))
+            food_x, food_y = cell_position(self.sim.food)
+            food_rect = food_scaled.get_rect(center=(food_x + GRID_SIZE // 2, food_y + GRID_SIZE // 2))
+            self.screen.blit(food_scaled, food_rect)
+
+    def draw_score(self, dt):
+        # Update score animation
+        self.score_animation_scale = max(1.0, self.score_animation_scale - 0.5 * dt)
+
+        # Draw beautiful scoreboard on the right side (smaller)
+        font = sys_font("Arial", 24, bold=True)  # Reduced from 30 to 24 (Line 1)
+        score_text = font.render(f"Score: {self.sim.score}", True, WHITE)
+        score_text_scaled = pygame.transform.scale(
+            score_text,
+            (int(score_text.get_width() * self.score_animation_scale), int(score_text.get_height() * self.score_animation_scale))
+        )
+        score_rect = score_text_scaled.get_rect(topright=(WIDTH - 15, 15))  # Adjusted margin (Line 2)
+
+        # Draw background box with gradient effect
+        box_padding = 5  # Reduced from 10 to 5 (Line 3)
+        box_rect = pygame.Rect(
+            score_rect.x - box_padding,
+            score_rect.y - box_padding,
+            score_rect.width + 2 * box_padding,
+            score_rect.height + 2 * box_padding
+        )
+        gradient_surface = pygame.Surface((box_rect.width, box_rect.height), pygame.SRCALPHA)
+        for y in range(box_rect.height):
+            alpha = int(200 * (1 - y / box_rect.height))
+            pygame.draw.line(gradient_surface, (LIGHT_GREEN[0], LIGHT_GREEN[1], LIGHT_GREEN[2], alpha), (0, y), (box_rect.width, y))
+        self.screen.blit(gradient_surface, (box_rect.x, box_rect.y))
+
+        # Draw glowing border
+        glow_scale = 1 + 0.03 * math.sin(self.glow_animation)  # Reduced glow size (Line 4)
+        glow_rect = pygame.Rect(
+            box_rect.x - 3 * glow_scale,  # Reduced from 5 to 3 (Line 5)
+            box_rect.y - 3 * glow_scale,  # Reduced from 5 to 3 (Line 6)
+            box_rect.width + 6 * glow_scale,  # Reduced from 10 to 6 (Line 7)
+            box_rect.height + 6 * glow_scale  # Reduced from 10 to 6 (Line 8)
         )
-        food_rect = food_scaled.get_rect(center=(food.x + GRID_SIZE // 2, food.y + GRID_SIZE // 2))
-        screen.blit(food_scaled, food_rect)
-
-    # Draw particles for death animation
-    if game_over:
-        death_animation_timer += 1
-        for particle in particles[:]:
-            particle.update()
-            particle.draw(screen)
-            if particle.lifetime <= 0:
-                particles.remove(particle)
-        if death_animation_timer >= death_animation_duration:
-            running = False
-
-    # Update score animation
-    score_animation_scale = max(1.0, score_animation_scale - 0.05)
-
-    # Draw beautiful scoreboard on the right side (smaller)
-    font = pygame.font.SysFont("Arial", 24, bold=True)  # Reduced from 30 to 24 (Line 1)
-    score_text = font.render(f"Score: {score}", True, WHITE)
-    score_text_scaled = pygame.transform.scale(
-        score_text,
-        (int(score_text.get_width() * score_animation_scale), int(score_text.get_height() * score_animation_scale))
-    )
-    score_rect = score_text_scaled.get_rect(topright=(WIDTH - 15, 15))  # Adjusted margin (Line 2)
-
-    # Draw background box with gradient effect
-    box_padding = 5  # Reduced from 10 to 5 (Line 3)
-    box_rect = pygame.Rect(
-        score_rect.x - box_padding,
-        score_rect.y - box_padding,
-        score_rect.width + 2 * box_padding,
-        score_rect.height + 2 * box_padding
-    )
-    gradient_surface = pygame.Surface((box_rect.width, box_rect.height), pygame.SRCALPHA)
-    for y in range(box_rect.height):
-        alpha = int(200 * (1 - y / box_rect.height))
-        pygame.draw.line(gradient_surface, (LIGHT_GREEN[0], LIGHT_GREEN[1], LIGHT_GREEN[2], alpha), (0, y), (box_rect.width, y))
-    screen.blit(gradient_surface, (box_rect.x, box_rect.y))
-
-    # Draw glowing border
-    glow_scale = 1 + 0.03 * math.sin(glow_animation)  # Reduced glow size (Line 4)
-    glow_rect = pygame.Rect(
-        box_rect.x - 3 * glow_scale,  # Reduced from 5 to 3 (Line 5)
-        box_rect.y - 3 * glow_scale,  # Reduced from 5 to 3 (Line 6)
-        box_rect.width + 6 * glow_scale,  # Reduced from 10 to 6 (Line 7)
-        box_rect.height + 6 * glow_scale  # Reduced from 10 to 6 (Line 8)
-    )
-    pygame.draw.rect(screen, TRANSPARENT_PURPLE, glow_rect, 2)  # Reduced thickness from 3 to 2 (Line 9)
-    pygame.draw.rect(screen, PURPLE, box_rect, 1)  # Reduced thickness from 2 to 1 (Line 10)
-
-    # Draw score text with shadow
-    shadow_offset = 1  # Reduced from 2 to 1 (Line 11)
-    shadow_text = font.render(f"Score: {score}", True, (50, 50, 50))
-    shadow_rect = shadow_text.get_rect(topright=(WIDTH - 15 + shadow_offset, 15 + shadow_offset))
-    screen.blit(shadow_text, shadow_rect)
-    screen.blit(score_text_scaled, score_rect)
-
-    # Draw score pop-ups
-    for popup in score_popups[:]:
-        popup.update()
-        popup.draw(screen)
-        if popup.lifetime <= 0:
-            score_popups.remove(popup)
-
-    pygame.display.flip()
-    clock.tick(60 if game_over else 10)
-
-pygame.quit()
\ No newline at end of file
+        pygame.draw.rect(self.screen, TRANSPARENT_PURPLE, glow_rect, 2)  # Reduced thickness from 3 to 2 (Line 9)
+        pygame.draw.rect(self.screen, PURPLE, box_rect, 1)  # Reduced thickness from 2 to 1 (Line 10)
+
+        # Draw score text with shadow
+        shadow_offset = 1  # Reduced from 2 to 1 (Line 11)
+        shadow_text = font.render(f"Score: {self.sim.score}", True, (50, 50, 50))
+        shadow_rect = shadow_text.get_rect(topright=(WIDTH - 15 + shadow_offset, 15 + shadow_offset))
+        self.screen.blit(shadow_text, shadow_rect)
+        self.screen.blit(score_text_scaled, score_rect)
+
+        # Draw score pop-ups
+        for popup in self.score_popups[:]:
+            popup.update(dt)
+            popup.draw(self.screen)
+            if popup.lifetime <= 0:
+                self.score_popups.remove(popup)
+
+
+if __name__ == "__main__":
+    run_standalone(SnakeGame)
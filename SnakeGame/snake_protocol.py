@@ -0,0 +1,113 @@
+import struct
+import sys
+import zlib
+from array import array
+
+# Binary messages between the Snake match server and its clients.
+#
+# Over TCP every message is a frame: payload length (4 bytes), type (1 byte)
+# and the payload, all little-endian. Over WebSocket one binary message is
+# the type byte and the payload.
+#
+# Client to server:
+#   HELLO    room number to join, or ANY_ROOM
+#   TURN     index into snake_core.DIRECTIONS
+#   RESPAWN  start again after dying
+#   PING     an id of the client's choosing, echoed back in a PONG
+# Server to client:
+#   WELCOME  room, board size, your snake, then the whole grid (zlib)
+#   DELTA    tick, send time, your head, score and state, then the cells
+#            that changed this tick with their new grid values. The send
+#            time is on the server's clock, so only means something to
+#            readers on the same machine; clients time a PING instead.
+#   PONG     the id from a PING
+
+HEADER = struct.Struct("<IB")
+# Longest payload accepted; a longer frame is refused without reading it and
+# ends the connection. Client messages are a few bytes; server frames hold at
+# most the grid, compressed or as changed cells.
+MAX_FRAME = 16 * 1024 * 1024
+MAX_CLIENT_FRAME = 64
+HELLO, WELCOME, DELTA, TURN, RESPAWN, PING, PONG = range(1, 8)
+ANY_ROOM = 0xFFFF
+
+HELLO_BODY = struct.Struct("<H")
+TURN_BODY = struct.Struct("<B")
+PING_BODY = struct.Struct("<I")
+WELCOME_BODY = struct.Struct("<HHHH")
+DELTA_BODY = struct.Struct("<IdiHBI")
+NO_HEAD = -1
+
+
+def frame(kind, payload=b""):
+    return HEADER.pack(len(payload), kind) + payload
+
+
+def split_message(message, max_length=MAX_FRAME):
+    # A WebSocket message back into (type, payload); None if it is empty or
+    # too long
+    if not message or len(message) - 1 > max_length:
+        return None
+    return message[0], message[1:]
+
+
+def little_endian(cells):
+    if sys.byteorder == "big":
+        cells.byteswap()
+    return cells
+
+
+def encode_welcome(room, cols, rows, snake_index, grid):
+    return WELCOME_BODY.pack(room, cols, rows, snake_index) + zlib.compress(bytes(grid), 1)
+
+
+def decode_welcome(payload):
+    room, cols, rows, snake_index = WELCOME_BODY.unpack_from(payload)
+    grid = bytearray(zlib.decompress(payload[WELCOME_BODY.size:]))
+    return room, cols, rows, snake_index, grid
+
+
+def encode_cells(grid, cells):
+    # Cell indices as uint32, then one grid value byte per cell
+    return little_endian(array("I", cells)).tobytes() + bytes(grid[cell] for cell in cells)
+
+
+def encode_delta(tick, sent_at, head, score, alive, cell_count, cells_payload):
+    return DELTA_BODY.pack(tick, sent_at, head, score, alive, cell_count) + cells_payload
+
+
+def decode_delta(payload):
+    tick, sent_at, head, score, alive, count = DELTA_BODY.unpack_from(payload)
+    start = DELTA_BODY.size
+    cells = little_endian(array("I", payload[start:start + 4 * count]))
+    values = payload[start + 4 * count:start + 5 * count]
+    return tick, sent_at, head, score, bool(alive), cells, values
+
+
+def apply_delta(grid, cells, values):
+    for cell, value in zip(cells, values):
+        grid[cell] = value
+
+
+async def read_frame(reader, max_length=MAX_FRAME):
+    # (type, payload), or None for a frame longer than max_length
+    length, kind = HEADER.unpack(await reader.readexactly(HEADER.size))
+    if length > max_length:
+        return None
+    return kind, await reader.readexactly(length)
+
+
+def read_frame_blocking(stream, max_length=MAX_FRAME):
+    # For a socket.makefile("rb") stream; None once the server hangs up or
+    # sends a frame longer than max_length
+    header = stream.read(HEADER.size)
+    if len(header) < HEADER.size:
+        return None
+    length, kind = HEADER.unpack(header)
+    if length > max_length:
+        print(f"Refusing a {length} byte frame from the server")
+        return None
+    payload = stream.read(length)
+    if len(payload) < length:
+        return None
+    return kind, payload
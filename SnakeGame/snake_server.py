@@ -0,0 +1,268 @@
+import argparse
+import asyncio
+import os
+import socket
+import sys
+import time
+
+if __package__ in (None, ""):
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from SnakeGame.snake_arena import Arena
+from SnakeGame.snake_core import DIRECTIONS
+from SnakeGame.snake_protocol import (
+    ANY_ROOM, DELTA, HELLO, HELLO_BODY, MAX_CLIENT_FRAME, NO_HEAD, PING, PING_BODY, PONG, RESPAWN, TURN,
+    TURN_BODY, WELCOME,
+    encode_cells, encode_delta, encode_welcome, frame, read_frame, split_message,
+)
+
+try:
+    import websockets
+except ImportError:
+    websockets = None
+
+# Snake match server: many arena rooms in one process, all advanced together
+# on a fixed tick. Each tick a room sends its players only the cells that
+# changed. Players speak the binary protocol in snake_protocol.py over TCP,
+# or over WebSocket when the websockets package is installed.
+#
+#   python -m SnakeGame.snake_server --port 8765 --ws-port 8766
+
+TICK_RATE = 10
+BOARD_SIZE = "100x100"
+BOTS_PER_ROOM = 20
+PLAYERS_PER_ROOM = 8
+# Players whose unsent data passes this are too slow to keep up and dropped
+MAX_BUFFERED = 256 * 1024
+# Seconds between the stats lines on stdout
+STATS_INTERVAL = 2.0
+MAX_TURNS = 3
+
+
+class Player:
+    def __init__(self, send, buffered, close):
+        self.send = send
+        self.buffered = buffered
+        self.close = close
+        self.room = None
+        self.snake = None
+        self.index = None
+        self.turns = []
+        self.respawn = False
+        self.dropped = False
+
+    def handle(self, kind, payload):
+        # False for a malformed message, which ends the connection
+        if kind == TURN:
+            if len(payload) != TURN_BODY.size:
+                return False
+            direction = TURN_BODY.unpack(payload)[0]
+            if direction < len(DIRECTIONS) and len(self.turns) < MAX_TURNS:
+                self.turns.append(DIRECTIONS[direction])
+        elif kind == RESPAWN:
+            self.respawn = True
+        elif kind == PING:
+            if len(payload) != PING_BODY.size:
+                return False
+            self.send(frame(PONG, payload))
+        return True
+
+
+class Room:
+    def __init__(self, number, cols, rows, bots):
+        self.number = number
+        self.arena = Arena(cols, rows, bots, track_changes=True)
+        self.arena.take_changes()
+        self.players = []
+
+    def join(self, player):
+        snake = self.arena.spawn_snake(human=True)
+        if snake is None:
+            return False
+        player.room = self
+        player.snake = snake
+        player.index = snake.index
+        self.players.append(player)
+        arena = self.arena
+        player.send(frame(WELCOME, encode_welcome(self.number, arena.cols, arena.rows,
+                                                  player.index, arena.grid)))
+        return True
+
+    def leave(self, player):
+        self.players.remove(player)
+        self.arena.remove(player.snake)
+
+    def tick(self, sent_at):
+        arena = self.arena
+        turns = {}
+        for player in self.players:
+            if player.turns:
+                turns[player.index] = player.turns.pop(0)
+            if player.respawn:
+                player.respawn = False
+                if not player.snake.alive:
+                    arena.respawn(player.snake)
+        arena.tick(turns)
+
+        # The changed cells are the same for everyone; only the header
+        # with the player's own snake differs
+        cells = set(arena.take_changes())
+        cells_payload = encode_cells(arena.grid, cells)
+        sent = 0
+        for player in self.players:
+            if player.dropped:
+                continue
+            snake = player.snake
+            head = snake.head if snake.alive else NO_HEAD
+            data = frame(DELTA, encode_delta(arena.ticks, sent_at, head, min(snake.score, 0xFFFF),
+                                             snake.alive, len(cells), cells_payload))
+            player.send(data)
+            sent += len(data)
+            if player.buffered() > MAX_BUFFERED:
+                print(f"Room {self.number}: dropping a player that fell behind")
+                player.dropped = True
+                player.close()
+        return sent
+
+
+class MatchServer:
+    def __init__(self, cols, rows, bots, tick_rate=TICK_RATE):
+        self.cols = cols
+        self.rows = rows
+        self.bots = bots
+        self.tick_rate = tick_rate
+        self.rooms = {}
+        self.ticks = 0
+        self.tick_work = 0.0
+        self.bytes_sent = 0
+
+    def join(self, player, number):
+        if number == ANY_ROOM:
+            number = next((room.number for room in self.rooms.values()
+                           if len(room.players) < PLAYERS_PER_ROOM), None)
+            if number is None:
+                number = next(n for n in range(ANY_ROOM) if n not in self.rooms)
+        room = self.rooms.get(number)
+        if room is None:
+            room = self.rooms[number] = Room(number, self.cols, self.rows, self.bots)
+        if room.join(player):
+            return True
+        if not room.players:
+            del self.rooms[number]
+        return False
+
+    def leave(self, player):
+        room = player.room
+        if room is None:
+            return
+        room.leave(player)
+        if not room.players:
+            del self.rooms[room.number]
+
+    async def serve_player(self, player, next_message):
+        # next_message() gives (type, payload), None for a frame that is too
+        # long, and raises once the player has gone
+        try:
+            message = await next_message()
+            if message is None or message[0] != HELLO or len(message[1]) != HELLO_BODY.size:
+                print("Dropping a player that sent a malformed hello")
+                return
+            if not self.join(player, HELLO_BODY.unpack(message[1])[0]):
+                return
+            while True:
+                message = await next_message()
+                if message is None or not player.handle(*message):
+                    print(f"Room {player.room.number}: dropping a player that sent a malformed message")
+                    return
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        except Exception as e:
+            if websockets is None or not isinstance(e, websockets.ConnectionClosed):
+                raise
+        finally:
+            self.leave(player)
+            player.close()
+
+    async def handle_tcp(self, reader, writer):
+        sock = writer.get_extra_info("socket")
+        if sock is not None:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        player = Player(writer.write, writer.transport.get_write_buffer_size, writer.close)
+        await self.serve_player(player, lambda: read_frame(reader, MAX_CLIENT_FRAME))
+
+    async def handle_websocket(self, websocket):
+        # Same frames without the length prefix, one per message
+        def send(data):
+            asyncio.ensure_future(websocket.send(data[4:]))
+
+        async def next_message():
+            return split_message(await websocket.recv(), MAX_CLIENT_FRAME)
+
+        player = Player(send, websocket.transport.get_write_buffer_size,
+                        lambda: asyncio.ensure_future(websocket.close()))
+        await self.serve_player(player, next_message)
+
+    async def run_ticks(self):
+        loop = asyncio.get_running_loop()
+        interval = 1 / self.tick_rate
+        next_tick = loop.time()
+        while True:
+            start = time.perf_counter()
+            sent_at = time.monotonic()
+            for room in list(self.rooms.values()):
+                self.bytes_sent += room.tick(sent_at)
+            self.tick_work += time.perf_counter() - start
+            self.ticks += 1
+
+            # Skip ticks rather than bunch them up when running behind
+            next_tick += interval
+            delay = next_tick - loop.time()
+            if delay < 0:
+                next_tick = loop.time()
+                delay = 0
+            await asyncio.sleep(delay)
+
+    async def report_stats(self):
+        while True:
+            ticks, work, sent = self.ticks, self.tick_work, self.bytes_sent
+            await asyncio.sleep(STATS_INTERVAL)
+            ticks = self.ticks - ticks
+            players = sum(len(room.players) for room in self.rooms.values())
+            print(f"Server: {len(self.rooms)} rooms, {players} players, "
+                  f"{ticks / STATS_INTERVAL:.1f} ticks/s, "
+                  f"tick work {(self.tick_work - work) / max(ticks, 1) * 1000:.2f} ms, "
+                  f"{(self.bytes_sent - sent) / STATS_INTERVAL / 1024:.0f} KiB/s", flush=True)
+
+    async def serve(self, host, port, ws_port=None):
+        servers = [await asyncio.start_server(self.handle_tcp, host, port)]
+        print(f"Snake server on tcp://{host}:{port}", flush=True)
+        if ws_port is not None:
+            if websockets is None:
+                print("WebSocket port ignored: install the websockets package to use it")
+            else:
+                servers.append(await websockets.serve(self.handle_websocket, host, ws_port,
+                                                      max_size=MAX_CLIENT_FRAME + 1))
+                print(f"Snake server on ws://{host}:{ws_port}", flush=True)
+        await asyncio.gather(self.run_ticks(), self.report_stats())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Snake match server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--ws-port", type=int, default=None)
+    parser.add_argument("--board", default=BOARD_SIZE, help="cells, e.g. 100x100")
+    parser.add_argument("--bots", type=int, default=BOTS_PER_ROOM, help="computer snakes per room")
+    parser.add_argument("--tick-rate", type=float, default=TICK_RATE)
+    args = parser.parse_args()
+
+    cols, rows = (int(value) for value in args.board.lower().split("x"))
+    server = MatchServer(cols, rows, args.bots, args.tick_rate)
+    try:
+        asyncio.run(server.serve(args.host, args.port, args.ws_port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+from CarGame.car_sim import CarSim, ACTIONS, ALL_KINDS, COLLISION_ORDER, DIFFICULTY_LEVELS
+
+# Car games stepped several frames at a time (CarSim.advance with frames > 1,
+# swept collisions) against the same games stepped frame by frame with the
+# same actions held. After every step the two must agree on the score, the
+# car, the power-ups, every entity on the road and every event. A naive
+# multi-frame step that moves everything and only then looks for overlaps is
+# run alongside to show what the sweep prevents. Then frames per second.
+GAMES = 20
+FRAMES = 3000
+STEP_SIZES = [2, 4, 8]
+MODES = [("road", {}), ("track", {"track": True}), ("horde 300", {"horde": 300})]
+SPEED_FRAMES = 100000
+
+
+class NaiveSim(CarSim):
+    # Moves the frames, then one overlap test at the end
+    def advance_swept(self, action, frames):
+        targets = []
+        for _ in range(frames):
+            for kind, x in self.begin_frame(action):
+                self.entities.spawn(kind, x)
+            targets.append(self.car.x)
+            self.entities.step_frames(targets[-1:])
+        for kinds in COLLISION_ORDER:
+            found = self.entities.hits(self.car, kinds)
+            self.entities.remove([h for h in found if self.touch(self.entities.kind(h), self.entities.rect(h))])
+            if self.track is not None:
+                self.touch_track(kinds)
+
+
+def snapshot(sim):
+    entities = sorted((kind, tuple(rect)) for kind in ALL_KINDS for rect in sim.rects((kind,)))
+    return (sim.frames, sim.score, sim.done, tuple(sim.car), sim.car_speed, sim.shield_active, sim.shield_timer,
+            sim.speed_boost_active, sim.speed_boost_timer, entities)
+
+
+def compare(difficulty, options, seed, frames_per_step):
+    baseline = CarSim(difficulty, seed, **options)
+    swept = CarSim(difficulty, seed, **options)
+    naive = NaiveSim(difficulty, seed, **options)
+    rng = random.Random(seed)
+    naive_differs = False
+    while baseline.frames < FRAMES and not baseline.done:
+        action = rng.choice(ACTIONS)
+        events = []
+        for _ in range(frames_per_step):
+            baseline.advance(action)
+            events += baseline.events
+        swept.advance(action, frames_per_step)
+        if snapshot(swept) != snapshot(baseline) or swept.events != events:
+            return False, True, baseline
+        if not naive_differs:
+            naive.advance(action, frames_per_step)
+            naive_differs = snapshot(naive)[:9] != snapshot(baseline)[:9]
+    return True, naive_differs, baseline
+
+
+def speed(frames_per_step):
+    sim = CarSim("Hard", seed=1)
+    rng = random.Random(1)
+    played = 0
+    start = time.perf_counter()
+    while played < SPEED_FRAMES:
+        sim.step(rng.choice(ACTIONS), frames_per_step)
+        played += frames_per_step
+        if sim.done:
+            sim.reset()
+    return played / (time.perf_counter() - start)
+
+
+def main():
+    for name, options in MODES:
+        for frames_per_step in STEP_SIZES:
+            matched = naive_missed = frames = 0
+            for difficulty in DIFFICULTY_LEVELS:
+                for seed in range(GAMES):
+                    same, naive_differs, baseline = compare(difficulty, options, seed, frames_per_step)
+                    if not same:
+                        print(f"{name}, {frames_per_step} frames a step: {difficulty} seed {seed} differs "
+                              f"at frame {baseline.frames}")
+                    matched += same
+                    naive_missed += naive_differs
+                    frames += baseline.frames
+            games = GAMES * len(DIFFICULTY_LEVELS)
+            print(f"{name:>9}, {frames_per_step} frames a step: swept matches in {matched}/{games} games "
+                  f"({frames} frames), naive differs in {naive_missed}")
+
+    for frames_per_step in [1] + STEP_SIZES:
+        print(f"{frames_per_step} frames a step: {speed(frames_per_step):,.0f} frames/sec with observations")
+
+
+if __name__ == "__main__":
+    main()
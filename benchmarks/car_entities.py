@@ -0,0 +1,94 @@
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import pygame
+
+from smg.game import WIDTH, HEIGHT
+from CarGame.car_broadphase import FallingLane
+from CarGame.car_entities import KIND_SIZES, KIND_SPEEDS, OBSTACLE, COIN, SPEED_POWERUP, ENEMY
+
+# Car game entity update with thousands of entities on screen: spawn, fall,
+# cull and test against the player's car, the way car_game.py did it (lists
+# walked several times, list.remove inside the loops) and with the
+# FallingLane broadphase. The spawn rate is set so each step keeps about that
+# many entities on screen, and nothing ends the game.
+POPULATIONS = [100, 1000, 5000, 20000]
+FRAMES = 300
+# (speed, size) per kind: obstacles, coins, power-ups, enemy cars
+KINDS = [(KIND_SPEEDS[kind], KIND_SIZES[kind]) for kind in (OBSTACLE, COIN, SPEED_POWERUP, ENEMY)]
+
+
+def spawn_counts(population, rng):
+    # Entities of each kind to spawn this frame, as a whole number on average
+    counts = []
+    for speed, _ in KINDS:
+        lifetime = (HEIGHT + 50) / speed
+        rate = population / len(KINDS) / lifetime
+        counts.append(int(rate) + (rng.random() < rate % 1))
+    return counts
+
+
+def new_rect(rng, size):
+    return pygame.Rect(rng.randint(0, WIDTH - size[0]), -50, *size)
+
+
+def run_lists(population, car):
+    rng = random.Random(1)
+    lists = [[] for _ in KINDS]
+    hits = 0
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        for entities, count, (_, size) in zip(lists, spawn_counts(population, rng), KINDS):
+            for _ in range(count):
+                entities.append(new_rect(rng, size))
+        for entities, (speed, _) in zip(lists, KINDS):
+            for entity in entities[:]:
+                entity.y += speed
+                if entity.y > HEIGHT:
+                    entities.remove(entity)
+        for entities in lists:
+            for entity in entities[:]:
+                if car.colliderect(entity):
+                    entities.remove(entity)
+                    hits += 1
+    return time.perf_counter() - start, hits, sum(len(entities) for entities in lists)
+
+
+def run_lanes(population, car):
+    rng = random.Random(1)
+    lanes = [FallingLane(speed) for speed, _ in KINDS]
+    hits = 0
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        for lane, count, (_, size) in zip(lanes, spawn_counts(population, rng), KINDS):
+            for _ in range(count):
+                lane.spawn(new_rect(rng, size))
+        for lane in lanes:
+            lane.move()
+            lane.cull(HEIGHT)
+        for lane in lanes:
+            found = lane.hits(car)
+            lane.remove(found)
+            hits += len(found)
+    return time.perf_counter() - start, hits, sum(len(lane) for lane in lanes)
+
+
+def main():
+    car = pygame.Rect(WIDTH // 2 - 25, HEIGHT - 150, 50, 80)
+    print(f"{'entities':>9} {'lists ms/frame':>15} {'lanes ms/frame':>15} {'speedup':>8} {'hits':>7}")
+    for population in POPULATIONS:
+        lists_time, lists_hits, _ = run_lists(population, car)
+        lanes_time, lanes_hits, on_screen = run_lanes(population, car)
+        if lists_hits != lanes_hits:
+            print(f"hit counts differ: {lists_hits} with lists, {lanes_hits} with lanes")
+        print(f"{on_screen:>9} {lists_time / FRAMES * 1000:>15.3f} {lanes_time / FRAMES * 1000:>15.3f} "
+              f"{lists_time / lanes_time:>7.1f}x {lanes_hits:>7}")
+
+
+if __name__ == "__main__":
+    main()
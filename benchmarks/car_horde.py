@@ -0,0 +1,52 @@
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import pygame
+
+from smg.game import WIDTH, HEIGHT
+from CarGame.car_entities import (
+    OBSTACLE, COIN, ENEMY, POWERUPS, EntityArrays, EntityLanes, spawn_horde,
+)
+
+# Car horde mode without a window: spawn, fall, home, cull and collide with
+# about this many entities on screen, with the NumPy columns and with the
+# pure Python lanes. The car weaves across the road and nothing ends the run.
+# A frame has 16.7 ms at 60 FPS.
+POPULATIONS = [1000, 10000, 20000, 50000]
+WARMUP = 300
+FRAMES = 300
+FRAME_BUDGET = 1 / 60
+
+
+def run(entities, population):
+    rng = random.Random(1)
+    car = pygame.Rect(WIDTH // 2 - 25, HEIGHT - 150, 50, 80)
+    for frame in range(WARMUP + FRAMES):
+        if frame == WARMUP:
+            start = time.perf_counter()
+        car.x = (frame * 5) % (2 * (WIDTH - car.width))
+        if car.x > WIDTH - car.width:
+            car.x = 2 * (WIDTH - car.width) - car.x
+        spawn_horde(entities, rng, population, WIDTH)
+        entities.step(car.x)
+        for kinds in ((OBSTACLE,), (COIN,), POWERUPS, (ENEMY,)):
+            entities.remove(entities.hits(car, kinds))
+    return (time.perf_counter() - start) / FRAMES, len(entities)
+
+
+def main():
+    print(f"{'entities':>9} {'arrays ms/frame':>16} {'lanes ms/frame':>15} {'arrays at 60 FPS':>17}")
+    for population in POPULATIONS:
+        arrays_time, on_screen = run(EntityArrays(), population)
+        lanes_time, _ = run(EntityLanes(), population)
+        fits = "yes" if arrays_time < FRAME_BUDGET else "no"
+        print(f"{on_screen:>9} {arrays_time * 1000:>16.3f} {lanes_time * 1000:>15.3f} {fits:>17}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+from CarGame.car_sim import DIFFICULTY_LEVELS, difficulty_multipliers
+from CarGame.car_entities import OBSTACLE, COIN, SPEED_POWERUP, SHIELD_POWERUP, ENEMY
+from CarGame.car_spawner import SpawnScheduler, OBSTACLES, COINS, POWERUP_DROPS, ENEMIES
+
+# Car spawning: the four per-frame counters car_game.py used to keep, with
+# the spawn intervals recomputed from the distance every frame, against the
+# timing wheel in CarGame/car_spawner.py. Checks that both spawn each type on
+# the same frames at every difficulty and that a seed replays exactly, then
+# times a frame of each and a batch of seeded games.
+FRAMES = 100000
+GAMES = 200
+GAME_FRAMES = 3600
+KIND_STREAMS = {OBSTACLE: OBSTACLES, COIN: COINS, SPEED_POWERUP: POWERUP_DROPS,
+                SHIELD_POWERUP: POWERUP_DROPS, ENEMY: ENEMIES}
+
+
+def counter_step(multipliers, state, rng):
+    # One frame of the old counters with the old spawn position rolls
+    timers = state["timers"]
+    for stream in range(4):
+        timers[stream] += 1
+    difficulty_multiplier = 1.0 + (state["distance"] / 1000)
+    background_speed = min(5 * multipliers["speed"], (2 + (state["distance"] / 500)) * multipliers["speed"])
+    rates = (max(30, (60 / difficulty_multiplier) * multipliers["spawn_rate"]),
+             90 * multipliers["spawn_rate"],
+             240 * multipliers["spawn_rate"],
+             max(60, (120 / difficulty_multiplier) * multipliers["spawn_rate"]))
+    state["distance"] += background_speed
+    spawns = []
+    for stream, width in zip(range(4), (30, 20, 40, 50)):
+        if timers[stream] > rates[stream]:
+            spawns.append((stream, rng.randint(0, 800 - width)))
+            timers[stream] = 0
+    return spawns
+
+
+def counter_frames(multipliers, frames):
+    # Spawn frames per type, the way game_frame() used to find them
+    rng = random.Random(1)
+    state = {"timers": [0, 0, 0, 0], "distance": 0}
+    spawned = [[], [], [], []]
+    for frame in range(frames):
+        for stream, _ in counter_step(multipliers, state, rng):
+            spawned[stream].append(frame)
+    return spawned
+
+
+def scheduled_frames(multipliers, frames):
+    scheduler = SpawnScheduler(multipliers, seed=1)
+    spawned = [[], [], [], []]
+    for frame in range(frames):
+        for kind, _ in scheduler.advance():
+            spawned[KIND_STREAMS[kind]].append(frame)
+    return spawned
+
+
+def run_game(multipliers, seed):
+    scheduler = SpawnScheduler(multipliers, seed)
+    return [scheduler.advance() for _ in range(GAME_FRAMES)]
+
+
+def main():
+    for difficulty in DIFFICULTY_LEVELS:
+        multipliers = difficulty_multipliers[difficulty]
+        same = counter_frames(multipliers, FRAMES) == scheduled_frames(multipliers, FRAMES)
+        print(f"{difficulty:>6}: spawn frames over {FRAMES} frames {'match' if same else 'DIFFER'}")
+
+    multipliers = difficulty_multipliers["Medium"]
+    replayed = run_game(multipliers, 42) == run_game(multipliers, 42)
+    different = run_game(multipliers, 42) != run_game(multipliers, 43)
+    print(f"Seed 42 replays exactly: {replayed}; seed 43 gives another road: {different}")
+
+    rng = random.Random(1)
+    state = {"timers": [0, 0, 0, 0], "distance": 0}
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        counter_step(multipliers, state, rng)
+    counters = (time.perf_counter() - start) / FRAMES
+
+    scheduler = SpawnScheduler(multipliers, seed=1)
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        scheduler.background_speed()
+        scheduler.advance()
+    wheel = (time.perf_counter() - start) / FRAMES
+    print(f"Per frame: counters {counters * 1e6:.2f} us, timing wheel {wheel * 1e6:.2f} us "
+          f"({counters / wheel:.1f}x)")
+
+    start = time.perf_counter()
+    for seed in range(GAMES):
+        run_game(multipliers, seed)
+    elapsed = time.perf_counter() - start
+    print(f"{GAMES} seeded games of {GAME_FRAMES} frames: {GAMES * GAME_FRAMES / elapsed:,.0f} frames/sec")
+
+
+if __name__ == "__main__":
+    main()
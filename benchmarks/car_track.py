@@ -0,0 +1,61 @@
+import gc
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+from smg.game import HEIGHT
+from CarGame.car_sim import CarSim, STAY
+
+# Car track mode driven headless for 10 million metres on Hard, to check that
+# memory stays flat: every million metres it prints the chunks, pending and
+# on-screen items the track holds, the entities on the road, the objects the
+# garbage collector tracks and the process's peak RSS, plus the slowest frame
+# so far.
+# The car is parked below the screen, so nothing ends the run.
+TARGET = 10000000
+CHECKPOINT = 1000000
+
+
+def peak_rss_mib():
+    if resource is None:
+        return float("nan")
+    # Kilobytes on Linux, bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024 if sys.platform == "darwin" else 1024)
+
+
+def main():
+    sim = CarSim("Hard", seed=1, track=True)
+    print(f"{'metres':>10} {'chunks':>7} {'pending':>8} {'items':>6} {'entities':>9} {'gc objects':>11} "
+          f"{'peak RSS MiB':>13} {'frames/s':>9} {'worst ms':>9}")
+    checkpoint = CHECKPOINT
+    worst = 0
+    frames = 0
+    start = last = time.perf_counter()
+    while sim.distance_traveled < TARGET:
+        sim.car.top = HEIGHT + 200
+        sim.advance(STAY)
+        now = time.perf_counter()
+        worst = max(worst, now - last)
+        last = now
+        frames += 1
+        if sim.done:
+            raise RuntimeError(f"run ended at {sim.distance_traveled:.0f} metres")
+        if sim.distance_traveled >= checkpoint:
+            print(f"{checkpoint:>10,} {len(sim.track):>7} {len(sim.track.pending):>8} {len(sim.track.items):>6} "
+                  f"{len(sim.entities):>9} {len(gc.get_objects()):>11} {peak_rss_mib():>13.1f} "
+                  f"{frames / (now - start):>9,.0f} {worst * 1000:>9.3f}")
+            checkpoint += CHECKPOINT
+            last = time.perf_counter()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+import cProfile
+import contextlib
+import io
+import os
+import pstats
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import pygame
+
+from smg.assets import load_font
+from smg.game import WIDTH, HEIGHT
+from smg.text import glyph_atlas
+
+# HUD text as the Car dashboard draws it (three strings, each with a
+# shadow), with Font.render every frame against the glyph atlases in
+# smg/text.py. The distance changes every few frames and the coins now and
+# then, as in play. Then a profile of the Car game itself, to check that text
+# is no longer near the top.
+FRAMES = 3000
+PROFILE_FRAMES = 600
+YELLOW, CYAN, WHITE, DARK_GRAY = (255, 255, 0), (0, 255, 255), (255, 255, 255), (50, 50, 50, 200)
+
+
+def hud_strings(frame):
+    return ((f"Coins: {frame // 200}", YELLOW, (20, 15)),
+            (f"M: {frame // 3}", CYAN, (20, 45)),
+            ("Speed: 5", WHITE, (WIDTH - 200, HEIGHT - 30)))
+
+
+def with_render(screen, font):
+    for frame in range(FRAMES):
+        for text, color, position in hud_strings(frame):
+            screen.blit(font.render(text, True, DARK_GRAY), (position[0] + 1, position[1] + 1))
+            screen.blit(font.render(text, True, color), position)
+
+
+def with_atlas(screen, font):
+    for frame in range(FRAMES):
+        for text, color, position in hud_strings(frame):
+            glyph_atlas(font, DARK_GRAY).draw(screen, text, topleft=(position[0] + 1, position[1] + 1))
+            glyph_atlas(font, color).draw(screen, text, topleft=position)
+
+
+def profile_car_game(screen):
+    from CarGame.car_game import CarGame
+
+    class NoWait:
+        def tick(self, framerate=0):
+            return 0
+
+    game = CarGame(screen)
+    game.clock = NoWait()
+    frames = [0]
+
+    def present():
+        # Straight from the main menu into the game, then stop
+        game.in_main_menu = False
+        frames[0] += 1
+        if frames[0] >= PROFILE_FRAMES:
+            game.running = False
+
+    game.present = present
+    profiler = cProfile.Profile()
+    with contextlib.redirect_stdout(io.StringIO()):
+        profiler.runcall(game.run)
+    stats = pstats.Stats(profiler, stream=sys.stdout)
+    print(f"Car game, {PROFILE_FRAMES} frames, top entries by own time:")
+    stats.sort_stats("tottime").print_stats(8)
+
+
+def main():
+    pygame.init()
+    pygame.mixer.init()
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    font = load_font("CarGame/PressStart2P-Regular.ttf", 14)
+
+    for name, draw in (("Font.render", with_render), ("glyph atlas", with_atlas)):
+        start = time.perf_counter()
+        draw(screen, font)
+        print(f"{name:>12}: {(time.perf_counter() - start) / FRAMES * 1000:.3f} ms per HUD frame")
+    profile_car_game(screen)
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from SnakeGame.snake_arena import Arena, BODY
+
+# Headless arena tick rate with computer snakes, against the 60 ticks/sec the
+# game runs at. The food-heavy setup grows long snakes to show the tick cost
+# follows the number of heads, not body length. After each run the shared
+# grid is checked against the snakes' own cell lists.
+SETUPS = [(200, 200, 100, None), (1000, 1000, 1000, None), (1000, 1000, 1000, 200000),
+          (1000, 1000, 5000, None)]
+TICKS = 600
+TARGET = 60
+
+
+def check(arena):
+    bodies = sum(len(snake) for snake in arena.snakes if snake.alive)
+    marked = sum(1 for value in arena.grid if value >= BODY)
+    if bodies != marked:
+        raise RuntimeError(f"grid has {marked} body cells, snakes have {bodies}")
+
+
+def bench(cols, rows, count, food):
+    arena = Arena(cols, rows, count, food, seed=0)
+    times = []
+    for _ in range(TICKS):
+        start = time.perf_counter()
+        arena.tick()
+        times.append(time.perf_counter() - start)
+    check(arena)
+    times.sort()
+    longest = max(len(snake) for snake in arena.snakes)
+    return len(times) / sum(times), times[len(times) * 99 // 100], arena.deaths, longest
+
+
+def main():
+    print(f"{'board':>10} {'snakes':>7} {'food':>7} {'ticks/sec':>10} {'p99 ms':>8} {'deaths':>7} {'longest':>8}")
+    for cols, rows, count, food in SETUPS:
+        rate, p99, deaths, longest = bench(cols, rows, count, food)
+        verdict = "" if rate >= TARGET else f"  below {TARGET} ticks/sec"
+        print(f"{f'{cols}x{rows}':>10} {count:>7} {food or count:>7} {rate:>10,.0f} {p99 * 1000:>8.2f} {deaths:>7} {longest:>8}{verdict}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+import os
+import sys
+import time
+from collections import deque
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from SnakeGame.snake_autopilot import Autopilot, hamiltonian_cycle
+from SnakeGame.snake_core import SnakeBody, SnakeSim
+
+# Snake autopilot throughput. First a few boards are played to the end, with
+# the steps taken over cells squared: following the cycle past PLAN_LIMIT
+# makes a full game O(cells²) steps (see SnakeGame/snake_autopilot.py). Then
+# decisions per second are measured at several board sizes and snake lengths
+# (the snake laid along the autopilot's cycle) against a plain breadth-first
+# search from the head redone every tick.
+FULL_GAMES = [(10, 10), (20, 20), (26, 20)]
+BOARDS = [(100, 100), (500, 500), (1000, 1000)]
+FILLS = [0.0, 0.1, 0.4]
+DECISIONS = 2000
+SCRATCH_DECISIONS = 20
+
+
+def bfs_from_scratch(sim):
+    # The per-tick search the autopilot avoids: a fresh BFS over every cell
+    cols, rows = sim.cols, sim.rows
+    body = sim.body
+    seen = bytearray(cols * rows)
+    seen[body.head] = 1
+    queue = deque([body.head])
+    while queue:
+        cell = queue.popleft()
+        if cell == sim.food:
+            return
+        x, y = cell % cols, cell // cols
+        for neighbour, ok in ((cell - 1, x > 0), (cell + 1, x < cols - 1),
+                              (cell - cols, y > 0), (cell + cols, y < rows - 1)):
+            if ok and not seen[neighbour] and neighbour not in body:
+                seen[neighbour] = 1
+                queue.append(neighbour)
+
+
+def play_to_end(cols, rows):
+    sim = SnakeSim(cols, rows, seed=0)
+    autopilot = Autopilot(sim)
+    start = time.perf_counter()
+    done = False
+    while not done:
+        state, reward, done = sim.step(autopilot.decide())
+    elapsed = time.perf_counter() - start
+    return len(sim.body) == cols * rows, sim.steps, autopilot.plans, sim.steps / elapsed
+
+
+def laid_out(cols, rows, fill):
+    sim = SnakeSim(cols, rows, seed=0)
+    cycle = hamiltonian_cycle(cols, rows)
+    length = max(1, int(cols * rows * fill))
+    sim.body = SnakeBody(cols, rows, cycle[0])
+    for cell in cycle[1:length]:
+        sim.body.move(cell, grow=True)
+    if length > 1:
+        head, neck = cycle[length - 1], cycle[length - 2]
+        sim.direction = (head % cols - neck % cols, head // cols - neck // cols)
+    sim.food = sim.body.spawn_food(sim.rng)
+    return sim, length
+
+
+def bench(cols, rows, fill):
+    sim, length = laid_out(cols, rows, fill)
+    autopilot = Autopilot(sim)
+    spent = scratch = 0.0
+    for i in range(DECISIONS):
+        if i < SCRATCH_DECISIONS:
+            start = time.perf_counter()
+            bfs_from_scratch(sim)
+            scratch += time.perf_counter() - start
+        start = time.perf_counter()
+        action = autopilot.decide()
+        spent += time.perf_counter() - start
+        state, reward, done = sim.step(action)
+        if done:
+            raise RuntimeError("autopilot died")
+    return length, DECISIONS / spent, SCRATCH_DECISIONS / scratch, autopilot.plans
+
+
+def main():
+    print(f"{'board':>10} {'filled':>7} {'steps':>8} {'steps/cells²':>13} {'plans':>6} {'steps/sec':>10}")
+    for cols, rows in FULL_GAMES:
+        won, steps, plans, rate = play_to_end(cols, rows)
+        print(f"{f'{cols}x{rows}':>10} {'yes' if won else 'no':>7} {steps:>8} {steps / (cols * rows) ** 2:>13.3f} "
+              f"{plans:>6} {rate:>10,.0f}")
+    print()
+    print(f"{'board':>10} {'length':>8} {'decisions/sec':>14} {'scratch BFS/sec':>16} {'plans':>6}")
+    for cols, rows in BOARDS:
+        for fill in FILLS:
+            length, rate, scratch, plans = bench(cols, rows, fill)
+            print(f"{f'{cols}x{rows}':>10} {length:>8} {rate:>14,.0f} {scratch:>16,.1f} {plans:>6}")
+
+
+if __name__ == "__main__":
+    main()
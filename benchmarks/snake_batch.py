@@ -0,0 +1,81 @@
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from SnakeGame.snake_batch import SnakeBatch
+from SnakeGame.snake_core import SnakeSim, DIRECTIONS
+
+# SnakeBatch env-steps per second against stepping the same number of
+# SnakeSim games one by one in Python. Before timing, a batch and a set of
+# SnakeSims are played side by side with the same actions (the sims are given
+# the batch's food) to check that both follow the same rules.
+COLS, ROWS = 26, 20
+COUNTS = [256, 1024, 4096]
+STEPS = 200
+
+
+def random_actions(rng, count, steps):
+    # Mostly keep going, sometimes turn
+    turns = rng.integers(len(DIRECTIONS), size=(steps, count))
+    return np.where(rng.random((steps, count)) < 0.2, turns, -1)
+
+
+def check(count=64, steps=5000):
+    batch = SnakeBatch(count, 10, 10, seed=1)
+    sims = [SnakeSim(10, 10) for _ in range(count)]
+    for i, sim in enumerate(sims):
+        sim.food = int(batch.food[i])
+    actions = random_actions(np.random.default_rng(1), count, steps)
+    eaten = 0
+    for step in range(steps):
+        (head, food, direction), reward, done = batch.step(actions[step])
+        eaten += int((reward > 0).sum())
+        for i, sim in enumerate(sims):
+            action = actions[step, i]
+            state, sim_reward, sim_done = sim.step(None if action < 0 else DIRECTIONS[action])
+            if sim_reward != reward[i] or sim_done != done[i]:
+                raise RuntimeError(f"board {i} differs at step {step}")
+            if sim_done:
+                sim.reset()
+            elif sim.body.head != head[i] or len(sim.body) != batch.length[i]:
+                raise RuntimeError(f"board {i} differs at step {step}")
+            sim.food = int(food[i])
+    print(f"Rules check passed: {count} boards, {steps} steps, {batch.games} games, {eaten} food eaten")
+
+
+def bench_sims(count, actions):
+    sims = [SnakeSim(COLS, ROWS, seed=i) for i in range(count)]
+    moves = [[None if a < 0 else DIRECTIONS[a] for a in row] for row in actions]
+    start = time.perf_counter()
+    for row in moves:
+        for sim, action in zip(sims, row):
+            state, reward, done = sim.step(action)
+            if done:
+                sim.reset()
+    return count * len(actions) / (time.perf_counter() - start)
+
+
+def bench_batch(count, actions):
+    batch = SnakeBatch(count, COLS, ROWS, seed=0)
+    start = time.perf_counter()
+    for row in actions:
+        batch.step(row)
+    return count * len(actions) / (time.perf_counter() - start)
+
+
+def main():
+    check()
+    print(f"{'boards':>7} {'SnakeSim steps/s':>17} {'SnakeBatch steps/s':>19} {'speedup':>8}")
+    for count in COUNTS:
+        actions = random_actions(np.random.default_rng(0), count, STEPS)
+        sims_rate = bench_sims(count, actions)
+        batch_rate = bench_batch(count, actions)
+        print(f"{count:>7} {sims_rate:>17,.0f} {batch_rate:>19,.0f} {batch_rate / sims_rate:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
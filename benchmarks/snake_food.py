@@ -0,0 +1,55 @@
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from SnakeGame.snake_core import SnakeBody
+
+# Food spawn cost as the board fills up: retrying random cells until one is
+# free against picking from the snake's FreeCells index.
+COLS = ROWS = 200
+FILL_RATIOS = [0.1, 0.5, 0.9, 0.99, 0.9999]
+SPAWNS = 2000
+
+
+def build_body(length):
+    body = SnakeBody(COLS, ROWS, 0)
+    for i in range(1, length):
+        y, x = divmod(i, COLS)
+        if y % 2:
+            x = COLS - 1 - x
+        body.move(y * COLS + x, grow=True)
+    return body
+
+
+def bench_retry(body, rng):
+    start = time.perf_counter()
+    for _ in range(SPAWNS):
+        while True:
+            cell = rng.randrange(COLS * ROWS)
+            if cell not in body:
+                break
+    return (time.perf_counter() - start) / SPAWNS
+
+
+def bench_free_cells(body, rng):
+    start = time.perf_counter()
+    for _ in range(SPAWNS):
+        body.spawn_food(rng)
+    return (time.perf_counter() - start) / SPAWNS
+
+
+def main():
+    rng = random.Random(1)
+    print(f"{'fill':>8} {'retry us/spawn':>16} {'FreeCells us/spawn':>20}")
+    for ratio in FILL_RATIOS:
+        body = build_body(int(COLS * ROWS * ratio))
+        retry_time = bench_retry(body, rng)
+        free_time = bench_free_cells(body, rng)
+        print(f"{ratio:>8.2%} {retry_time * 1e6:>16.2f} {free_time * 1e6:>20.2f}")
+
+
+if __name__ == "__main__":
+    main()
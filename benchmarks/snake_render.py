@@ -0,0 +1,79 @@
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import pygame
+
+from smg.game import WIDTH, HEIGHT
+from SnakeGame.big_snake import BigSnakeGame
+from SnakeGame.snake_core import SnakeBody, RIGHT
+from SnakeGame.snake_game import TICK_TIME
+
+# Frame time of the large-board Snake as the snake grows. The snake is laid
+# out as a serpentine over a 500x500 board with its head part way along an
+# even row, then left to run right for 100 ticks at 6 frames per tick.
+COLS = ROWS = 500
+LENGTHS = [10, 1000, 10000, 100000, 200000]
+TICKS = 100
+FRAMES_PER_TICK = 6
+
+
+def serpentine(count):
+    cells = []
+    for y in range(ROWS):
+        xs = range(COLS) if y % 2 == 0 else range(COLS - 1, -1, -1)
+        for x in xs:
+            cells.append(y * COLS + x)
+            if len(cells) == count:
+                return cells
+    return cells
+
+
+def bench(screen, length):
+    game = BigSnakeGame(screen)
+    game.cols, game.rows = COLS, ROWS
+    game.reset_game()
+
+    # Head at column 100 of an even row, heading right
+    rows_below = max(0, -(-(length - 100) // COLS))
+    rows_below += rows_below % 2
+    cells = serpentine(rows_below * COLS + 100)[-length:]
+    sim = game.sim
+    sim.body = SnakeBody(COLS, ROWS, cells[0])
+    for cell in cells[1:]:
+        sim.body.move(cell, grow=True)
+    sim.food = sim.body.spawn_food(random.Random(1))
+    sim.direction = RIGHT
+
+    # Build the chunks around the start before timing
+    game.frame(0)
+    built = game.tiles.built
+    times = []
+    for _ in range(TICKS * FRAMES_PER_TICK):
+        start = time.perf_counter()
+        game.frame(TICK_TIME / FRAMES_PER_TICK + 1e-9)
+        times.append(time.perf_counter() - start)
+        if game.game_over:
+            raise RuntimeError("unexpected game over")
+    times.sort()
+    return sum(times) / len(times), times[len(times) * 99 // 100], game.tiles.built - built
+
+
+def main():
+    pygame.init()
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    print(f"{'length':>8} {'avg ms/frame':>13} {'p99 ms/frame':>13} {'chunks built':>13}")
+    for length in LENGTHS:
+        average, p99, built = bench(screen, length)
+        print(f"{length:>8} {average * 1000:>13.3f} {p99 * 1000:>13.3f} {built:>13}")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
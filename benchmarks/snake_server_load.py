@@ -0,0 +1,174 @@
+import asyncio
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from SnakeGame.snake_protocol import (
+    DELTA, HEADER, HELLO, HELLO_BODY, TURN, TURN_BODY, WELCOME, decode_delta, decode_welcome, frame, read_frame,
+)
+
+# Load test for the Snake match server. First a check: a player that sends a
+# truncated TURN or claims a 4 GiB frame is disconnected while the rest of
+# its room plays on, and players that come and go reuse the same snake slot.
+# Then, for each room count, a fresh server is started on a local port and
+# filled with fake players (two per room) that turn now and then. Over a few
+# seconds the players record how many ticks each room delivers and how long
+# a frame takes from the server's send to being read here. The server's own
+# stats line reports its tick work.
+ROOM_COUNTS = [10, 100, 300, 500]
+PLAYERS_PER_ROOM = 2
+BOTS_PER_ROOM = 20
+WARMUP = 1.0
+DURATION = 5.0
+PORT = 8899
+
+
+class FakePlayer:
+    def __init__(self, room):
+        self.room = room
+        self.ticks = 0
+        self.latencies = []
+        self.bytes = 0
+        self.measuring = False
+
+    async def play(self, stop):
+        reader, writer = await asyncio.open_connection("127.0.0.1", PORT)
+        writer.get_extra_info("socket").setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        writer.write(frame(HELLO, HELLO_BODY.pack(self.room)))
+        kind, payload = await read_frame(reader)
+        if kind != WELCOME:
+            raise RuntimeError("no welcome")
+        rng = random.Random(self.room)
+        while not stop.is_set():
+            kind, payload = await read_frame(reader)
+            if kind != DELTA:
+                continue
+            received = time.monotonic()
+            tick, sent_at = decode_delta(payload)[:2]
+            if self.measuring:
+                self.ticks += 1
+                self.bytes += len(payload)
+                self.latencies.append(received - sent_at)
+            if rng.random() < 0.2:
+                writer.write(frame(TURN, TURN_BODY.pack(rng.randrange(4))))
+        writer.close()
+
+
+async def load(room_count):
+    players = [FakePlayer(room) for room in range(room_count) for _ in range(PLAYERS_PER_ROOM)]
+    stop = asyncio.Event()
+    tasks = [asyncio.ensure_future(player.play(stop)) for player in players]
+    await asyncio.sleep(WARMUP)
+    for player in players:
+        player.measuring = True
+    await asyncio.sleep(DURATION)
+    for player in players:
+        player.measuring = False
+    stop.set()
+    await asyncio.wait(tasks, timeout=2)
+    return players
+
+
+async def join(room):
+    reader, writer = await asyncio.open_connection("127.0.0.1", PORT)
+    writer.write(frame(HELLO, HELLO_BODY.pack(room)))
+    kind, payload = await read_frame(reader)
+    if kind != WELCOME:
+        raise RuntimeError("no welcome")
+    return reader, writer, decode_welcome(payload)[3]
+
+
+async def closed_by_server(reader, timeout=2.0):
+    try:
+        while True:
+            await asyncio.wait_for(read_frame(reader), timeout)
+    except asyncio.IncompleteReadError:
+        return True
+    except asyncio.TimeoutError:
+        return False
+
+
+async def check_misbehaving():
+    # One player stays in room 0 throughout, so the room is kept
+    reader, writer, _ = await join(0)
+
+    bad_reader, bad_writer, _ = await join(0)
+    bad_writer.write(frame(TURN, TURN_BODY.pack(0)[:-1]))
+    if not await closed_by_server(bad_reader):
+        raise RuntimeError("truncated TURN did not end the connection")
+    bad_reader, bad_writer, _ = await join(0)
+    bad_writer.write(HEADER.pack(0xFFFFFFFF, TURN))
+    if not await closed_by_server(bad_reader):
+        raise RuntimeError("oversized frame did not end the connection")
+
+    indexes = set()
+    for _ in range(20):
+        other_reader, other_writer, index = await join(0)
+        indexes.add(index)
+        other_writer.close()
+        await closed_by_server(other_reader)
+    if len(indexes) > 2:
+        raise RuntimeError(f"players coming and going took {len(indexes)} snake slots")
+
+    # The first player still gets ticks
+    await asyncio.wait_for(read_frame(reader), 2.0)
+    writer.close()
+    return len(indexes)
+
+
+def start_server():
+    server = subprocess.Popen(
+        [sys.executable, "-m", "SnakeGame.snake_server", "--port", str(PORT), "--bots", str(BOTS_PER_ROOM)],
+        stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True,
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        env=dict(os.environ, PYGAME_HIDE_SUPPORT_PROMPT="1"),
+    )
+    server.stdout.readline()
+    return server
+
+
+def check():
+    server = start_server()
+    try:
+        slots = asyncio.run(check_misbehaving())
+    finally:
+        server.terminate()
+        output = server.communicate()[0]
+    if "Traceback" in output or "exception" in output:
+        raise RuntimeError(f"server errors:\n{output}")
+    print(f"Server check passed: truncated TURN and oversized frame dropped cleanly, 20 players coming and going used {slots} slot(s)")
+
+
+def run_step(room_count):
+    server = start_server()
+    try:
+        players = asyncio.run(load(room_count))
+    finally:
+        server.terminate()
+        output = server.communicate()[0]
+    stats = [line for line in output.splitlines() if line.startswith("Server:")]
+
+    latencies = sorted(latency for player in players for latency in player.latencies)
+    ticks = sum(player.ticks for player in players) / len(players) / DURATION
+    frame_bytes = sum(player.bytes for player in players) / max(1, sum(player.ticks for player in players))
+    work = stats[-1].split("tick work ")[1].split(" ms")[0] if stats else "?"
+    return ticks, latencies[len(latencies) // 2], latencies[len(latencies) * 99 // 100], frame_bytes, work
+
+
+def main():
+    check()
+    print(f"{'rooms':>6} {'players':>8} {'ticks/s/room':>13} {'p50 ms':>7} {'p99 ms':>7} "
+          f"{'bytes/frame':>12} {'server tick ms':>15}")
+    for room_count in ROOM_COUNTS:
+        ticks, p50, p99, frame_bytes, work = run_step(room_count)
+        print(f"{room_count:>6} {room_count * PLAYERS_PER_ROOM:>8} {ticks:>13.1f} {p50 * 1000:>7.2f} "
+              f"{p99 * 1000:>7.2f} {frame_bytes:>12.0f} {work:>15}")
+
+
+if __name__ == "__main__":
+    main()
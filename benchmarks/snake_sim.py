@@ -0,0 +1,39 @@
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from SnakeGame.snake_core import SnakeSim, DIRECTIONS
+
+# Headless SnakeSim steps per second with a random player, restarting each
+# game as soon as it ends. Nothing here imports pygame.
+BOARDS = [(26, 20), (100, 100), (1000, 1000)]
+STEPS = 500000
+
+
+def bench(cols, rows):
+    sim = SnakeSim(cols, rows, seed=0)
+    rng = random.Random(0)
+    # Mostly keep going, sometimes turn, so games last a while
+    actions = [rng.choice(DIRECTIONS) if rng.random() < 0.1 else None for _ in range(4096)]
+    games = 1
+    start = time.perf_counter()
+    for i in range(STEPS):
+        state, reward, done = sim.step(actions[i & 4095])
+        if done:
+            sim.reset(i)
+            games += 1
+    return STEPS / (time.perf_counter() - start), games
+
+
+def main():
+    print(f"{'board':>10} {'steps/sec':>12} {'games':>8}")
+    for cols, rows in BOARDS:
+        rate, games = bench(cols, rows)
+        print(f"{f'{cols}x{rows}':>10} {rate:>12,.0f} {games:>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from SnakeGame.snake_core import SnakeBody
+
+# Tick time of the Snake body at growing lengths: the old list version
+# (insert(0), pop() and "in snake[1:]") against SnakeBody. The snake follows
+# a serpentine path over a 1000x1000 board so it never hits itself.
+COLS = ROWS = 1000
+LENGTHS = [10, 100, 1000, 10000, 100000]
+
+
+def serpentine(count):
+    path = []
+    for y in range(ROWS):
+        xs = range(COLS) if y % 2 == 0 else range(COLS - 1, -1, -1)
+        for x in xs:
+            path.append((x, y))
+            if len(path) == count:
+                return path
+    return path
+
+
+def bench_list(path, length, ticks):
+    snake = [path[i] for i in range(length - 1, -1, -1)]
+    start = time.perf_counter()
+    for i in range(length, length + ticks):
+        new_head = path[i]
+        snake.insert(0, new_head)
+        snake.pop()
+        if new_head in snake[1:]:
+            raise RuntimeError("unexpected collision")
+    return (time.perf_counter() - start) / ticks
+
+
+def bench_body(cells, length, ticks):
+    body = SnakeBody(COLS, ROWS, cells[0])
+    for i in range(1, length):
+        body.move(cells[i], grow=True)
+    start = time.perf_counter()
+    for i in range(length, length + ticks):
+        vacated, hit = body.move(cells[i])
+        if hit:
+            raise RuntimeError("unexpected collision")
+    return (time.perf_counter() - start) / ticks
+
+
+def main():
+    path = serpentine(max(LENGTHS) + 20000)
+    cells = [y * COLS + x for x, y in path]
+    print(f"{'length':>8} {'list us/tick':>14} {'SnakeBody us/tick':>18}")
+    for length in LENGTHS:
+        list_ticks = max(20, 200000 // length)
+        list_time = bench_list(path, length, min(list_ticks, 20000))
+        body_time = bench_body(cells, length, 20000)
+        print(f"{length:>8} {list_time * 1e6:>14.2f} {body_time * 1e6:>18.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+import math
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import pygame
+
+from smg.game import WIDTH, HEIGHT
+from smg.assets import load_image
+from smg.transforms import TransformCache, quantize_scale
+
+# Per-frame sprite transforms of the three games, done with pygame.transform
+# every frame as before and through a TransformCache. Each pattern runs for
+# FRAMES frames at 60 FPS animation time.
+FRAMES = 600
+SNAKE_LENGTH = 100
+PIPES = 4
+CAR_SIZE = (50, 80)
+
+
+class Uncached:
+    # Same calls as TransformCache, with nothing kept
+    def scale(self, image, size, flip_x=False, flip_y=False):
+        scaled = pygame.transform.scale(image, size)
+        if flip_x or flip_y:
+            scaled = pygame.transform.flip(scaled, flip_x, flip_y)
+        return scaled
+
+    def scale_by(self, image, factor):
+        width, height = image.get_size()
+        return pygame.transform.scale(image, (round(width * factor), round(height * factor)))
+
+    def rotate(self, image, angle):
+        return pygame.transform.rotate(image, angle)
+
+    def get(self, key, make):
+        return make()
+
+
+def snake_frame(transforms, images, t):
+    head, body, food = images
+    transforms.rotate(head, (90, 180, -90, 0)[int(t) % 4])
+    for i in range(1, SNAKE_LENGTH):
+        scale = 1 + 0.1 * math.sin(t + i * 0.5)
+        transforms.scale(body, (int(30 * scale), int(30 * scale)))
+    food_scale = 1 + 0.05 * math.sin(t * 2)
+    transforms.scale(food, (int(25 * food_scale), int(25 * food_scale)))
+
+
+def pipe_frame(transforms, pipe, heights):
+    for height in heights:
+        transforms.scale(pipe, (60, height), flip_y=True)
+        transforms.scale(pipe, (60, HEIGHT - height - 150))
+
+
+def glow_frame(transforms, t):
+    width, height = CAR_SIZE[0] + 20, CAR_SIZE[1] + 20
+
+    def make():
+        surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        pygame.draw.rect(surface, (128, 0, 128, 150), (10, 10, *CAR_SIZE), border_radius=5)
+        return surface
+
+    glow = transforms.get(("car_glow", width, height), make)
+    transforms.scale_by(glow, quantize_scale(1 + 0.1 * math.sin(t)))
+
+
+def run(transforms, images, pipe):
+    rng = random.Random(1)
+    # Pipes scroll across the screen; a new pipe with a random gap every 90 frames
+    heights = [rng.randint(50, HEIGHT - 200) for _ in range(PIPES)]
+    timings = {}
+    for name, frame in (
+        ("snake", lambda t: snake_frame(transforms, images, t)),
+        ("flappy pipes", lambda t: pipe_frame(transforms, pipe, heights)),
+        ("car glow", lambda t: glow_frame(transforms, t)),
+    ):
+        start = time.perf_counter()
+        for i in range(FRAMES):
+            if name == "flappy pipes" and i % 90 == 0:
+                heights = heights[1:] + [rng.randint(50, HEIGHT - 200)]
+            frame(i * 0.1)
+        timings[name] = (time.perf_counter() - start) / FRAMES * 1000
+    return timings
+
+
+def main():
+    pygame.init()
+    pygame.display.set_mode((WIDTH, HEIGHT))
+    images = (
+        load_image("SnakeGame/snake_head.png", (30, 30)),
+        load_image("SnakeGame/snake_body.png", (22, 22)),
+        load_image("SnakeGame/food.png", (25, 25)),
+    )
+    pipe = load_image("FlappyBird/pipe.png")
+
+    cache = TransformCache()
+    uncached = run(Uncached(), images, pipe)
+    cached = run(cache, images, pipe)
+    print(f"{'pattern':>14} {'uncached ms/frame':>18} {'cached ms/frame':>16} {'speedup':>8}")
+    for name in uncached:
+        print(f"{name:>14} {uncached[name]:>18.3f} {cached[name]:>16.3f} {uncached[name] / cached[name]:>7.1f}x")
+    cache.report()
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
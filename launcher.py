@@ -6,6 +6,17 @@ import random
 import time
 import json
 
+from smg.assets import load_font
+from smg.fonts import sys_font
+from smg.host import GameHost
+from smg.preload import AssetPreloader
+from smg.registry import discover
+from smg.scene import DirtyScene, SurfaceLayer, FillLayer
+from smg.scheduler import FrameScheduler
+from smg.text import glyph_atlas
+from smg.transforms import transforms
+from smg.workers import WorkerPool
+
 # Initialize Pygame
 pygame.init()
 pygame.mixer.init()
@@ -30,14 +41,14 @@ OVERLAY_COLOR = (50, 50, 50, 200)  # Semi-transparent overlay
 
 # Load fonts
 try:
-    font = pygame.font.Font("LauncherAssets/PressStart2P-Regular.ttf", 24)  # For title
-    button_font = pygame.font.Font("LauncherAssets/PressStart2P-Regular.ttf", 18)  # For buttons
-    small_font = pygame.font.Font("LauncherAssets/PressStart2P-Regular.ttf", 16)  # For attribution and slider
+    font = load_font("LauncherAssets/PressStart2P-Regular.ttf", 24)  # For title
+    button_font = load_font("LauncherAssets/PressStart2P-Regular.ttf", 18)  # For buttons
+    small_font = load_font("LauncherAssets/PressStart2P-Regular.ttf", 16)  # For attribution and slider
     print("Custom font loaded: PressStart2P-Regular.ttf")
 except FileNotFoundError:
-    font = pygame.font.SysFont("monospace", 24, bold=True)
-    button_font = pygame.font.SysFont("monospace", 18, bold=True)
-    small_font = pygame.font.SysFont("monospace", 16, bold=True)
+    font = sys_font("monospace", 24, bold=True)
+    button_font = sys_font("monospace", 18, bold=True)
+    small_font = sys_font("monospace", 16, bold=True)
     print("Font not found, using default font")
 
 # Load textures
@@ -52,20 +63,8 @@ except FileNotFoundError:
 button_normal = None
 button_hover = None
 
-# Load game preview images
-try:
-    car_game_preview = pygame.image.load("LauncherAssets/car_game_preview.png").convert_alpha()
-    car_game_preview = pygame.transform.scale(car_game_preview, (200, 150))
-    snake_game_preview = pygame.image.load("LauncherAssets/snake_game_preview.png").convert_alpha()
-    snake_game_preview = pygame.transform.scale(snake_game_preview, (200, 150))
-    flappy_bird_preview = pygame.image.load("LauncherAssets/flappy_bird_preview.png").convert_alpha()
-    flappy_bird_preview = pygame.transform.scale(flappy_bird_preview, (200, 150))
-    print("Game preview images loaded")
-except FileNotFoundError:
-    car_game_preview = None
-    snake_game_preview = None
-    flappy_bird_preview = None
-    print("Game preview images not found, previews will not be displayed")
+# Games are discovered from their manifests; previews and code load lazily
+game_entries = discover()
 
 # Load particle texture (optional)
 try:
@@ -88,14 +87,19 @@ except FileNotFoundError:
 # Load background music
 music_playing = True
 music_volume = 0.5
-try:
-    pygame.mixer.music.load("LauncherAssets/pixel_peeker_polka_faster.wav")
-    pygame.mixer.music.set_volume(music_volume)
-    pygame.mixer.music.play(-1)  # Loop indefinitely
-    print("Background music loaded: pixel_peeker_polka_faster.wav")
-except pygame.error as e:
-    print(f"Failed to load background music: {e}")
-    music_playing = False
+
+def start_launcher_music():
+    global music_playing
+    try:
+        pygame.mixer.music.load("LauncherAssets/pixel_peeker_polka_faster.wav")
+        pygame.mixer.music.set_volume(music_volume)
+        pygame.mixer.music.play(-1)  # Loop indefinitely
+        print("Background music loaded: pixel_peeker_polka_faster.wav")
+    except pygame.error as e:
+        print(f"Failed to load background music: {e}")
+        music_playing = False
+
+start_launcher_music()
 
 # Load sound effects
 try:
@@ -128,12 +132,88 @@ class Particle:
         elif self.y > HEIGHT:
             self.y = 0
 
+    @property
+    def rect(self):
+        if particle_image:
+            return particle_image.get_rect(topleft=(int(self.x), int(self.y)))
+        return pygame.Rect(int(self.x) - 2, int(self.y) - 2, 5, 5)
+
     def draw(self, surface):
         if particle_image:
             surface.blit(particle_image, (int(self.x), int(self.y)))
         else:
             pygame.draw.circle(surface, WHITE, (int(self.x), int(self.y)), 2)
 
+# All particles as one scene layer; only those inside the clip area are drawn
+class ParticleField:
+    def __init__(self, count):
+        self.particles = [Particle() for _ in range(count)]
+        self.rect = pygame.Rect(0, 0, WIDTH, HEIGHT)
+
+    def update(self):
+        dirty_rects = []
+        for i, particle in enumerate(self.particles):
+            old_rect = particle.rect
+            particle.update()
+            if particle.lifetime <= 0:
+                dirty_rects.append(old_rect)
+                self.particles[i] = particle = Particle()
+                dirty_rects.append(particle.rect)
+            elif abs(particle.rect.x - old_rect.x) > 10 or abs(particle.rect.y - old_rect.y) > 10:
+                # Wrapped around the screen edge
+                dirty_rects.append(old_rect)
+                dirty_rects.append(particle.rect)
+            elif particle.rect != old_rect:
+                dirty_rects.append(old_rect.union(particle.rect))
+        return dirty_rects
+
+    def draw(self, surface):
+        clip = surface.get_clip()
+        for particle in self.particles:
+            if particle.rect.colliderect(clip):
+                particle.draw(surface)
+
+# Text with a drop shadow, fading with the shared title alpha
+class Title:
+    def __init__(self, text, text_font, center):
+        self.text_surface = text_font.render(text, True, WHITE)
+        self.text_shadow = text_font.render(text, True, SHADOW_COLOR)
+        self.text_rect = self.text_surface.get_rect(center=center)
+        self.shadow_rect = self.text_rect.move(3, 3)
+        self.rect = self.text_rect.union(self.shadow_rect)
+        self.alpha = 255
+
+    def set_alpha(self, alpha):
+        if alpha == self.alpha:
+            return None
+        self.alpha = alpha
+        self.text_surface.set_alpha(alpha)
+        self.text_shadow.set_alpha(alpha)
+        return self.rect
+
+    def draw(self, surface):
+        surface.blit(self.text_shadow, self.shadow_rect)
+        surface.blit(self.text_surface, self.text_rect)
+
+# Game preview below the main menu buttons
+class Preview:
+    def __init__(self, center):
+        self.center = center
+        self.image = None
+        self.rect = pygame.Rect(center, (0, 0))
+
+    def set_image(self, image):
+        if image is self.image:
+            return []
+        old_rect = self.rect
+        self.image = image
+        self.rect = image.get_rect(center=self.center) if image else pygame.Rect(self.center, (0, 0))
+        return [old_rect, self.rect]
+
+    def draw(self, surface):
+        if self.image:
+            surface.blit(self.image, self.rect)
+
 # Button class with sound effects
 class Button:
     def __init__(self, text, x, y, width, height, action, preview_image=None):
@@ -141,12 +221,24 @@ class Button:
         self.text = text
         self.action = action
         self.preview_image = preview_image
-        self.text_surface = button_font.render(text, True, WHITE)
-        self.text_shadow = button_font.render(text, True, SHADOW_COLOR)
+        self.hovered = False
+
+    def set_text(self, text):
+        if text == self.text:
+            return None
+        self.text = text
+        return self.rect
+
+    def update(self, mouse_pos):
+        # Returns the rect to repaint when the hover state changed
+        hovered = self.rect.collidepoint(mouse_pos)
+        if hovered == self.hovered:
+            return None
+        self.hovered = hovered
+        return self.rect
 
     def draw(self, surface):
-        mouse_pos = pygame.mouse.get_pos()
-        if self.rect.collidepoint(mouse_pos):
+        if self.hovered:
             if button_hover:
                 surface.blit(button_hover, self.rect.topleft)
             else:
@@ -156,10 +248,9 @@ class Button:
                 surface.blit(button_normal, self.rect.topleft)
             else:
                 pygame.draw.rect(surface, BUTTON_COLOR, self.rect, border_radius=10)
-        text_rect = self.text_surface.get_rect(center=self.rect.center)
-        shadow_rect = self.text_shadow.get_rect(center=(text_rect.centerx + 3, text_rect.centery + 3))
-        surface.blit(self.text_shadow, shadow_rect)
-        surface.blit(self.text_surface, text_rect)
+        text_rect = glyph_atlas(button_font, WHITE).get_rect(self.text, center=self.rect.center)
+        glyph_atlas(button_font, SHADOW_COLOR).draw(surface, self.text, topleft=text_rect.move(3, 3).topleft)
+        glyph_atlas(button_font, WHITE).draw(surface, self.text, topleft=text_rect.topleft)
 
     def check_click(self, event):
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
@@ -181,16 +272,20 @@ class Slider:
         self.dragging = False
         self.label = small_font.render("Volume", True, WHITE)
         self.label_shadow = small_font.render("Volume", True, SHADOW_COLOR)
+        self.label_rect = self.label.get_rect(midright=(self.rect.left - 10, self.rect.centery))
+        self.label_shadow_rect = self.label_shadow.get_rect(midright=(self.label_rect.left + 3, self.label_rect.centery + 3))
+        # Everything the slider can touch, used by the dirty-rect scene
+        self.bounds = self.rect.inflate(0, 10).union(self.label_rect).union(self.label_shadow_rect)
 
     def draw(self, surface):
         pygame.draw.rect(surface, GRAY, self.rect)
         pygame.draw.rect(surface, WHITE, self.handle_rect)
-        label_rect = self.label.get_rect(midright=(self.rect.left - 10, self.rect.centery))
-        shadow_rect = self.label_shadow.get_rect(midright=(label_rect.left + 3, label_rect.centery + 3))
-        surface.blit(self.label_shadow, shadow_rect)
-        surface.blit(self.label, label_rect)
+        surface.blit(self.label_shadow, self.label_shadow_rect)
+        surface.blit(self.label, self.label_rect)
 
     def update(self, event):
+        # Returns the rect to repaint when the handle moved
+        old_handle_rect = self.handle_rect.copy()
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
             if self.handle_rect.collidepoint(event.pos) or self.rect.collidepoint(event.pos):
                 self.dragging = True
@@ -201,62 +296,104 @@ class Slider:
             self.handle_rect.x = max(self.rect.left, min(mouse_x - self.handle_rect.width // 2, self.rect.right - self.handle_rect.width))
             self.value = self.min_val + (self.handle_rect.x - self.rect.x) / self.rect.width * (self.max_val - self.min_val)
             pygame.mixer.music.set_volume(self.value)
-
-# Loading screen function with spinner
-def show_loading_screen(game_name):
+        if self.handle_rect != old_handle_rect:
+            return old_handle_rect.union(self.handle_rect)
+        return None
+
+# Loading screen with spinner and progress bar, shown until the game's assets
+# have been decoded by the preloader. If the preloader stops or takes longer
+# than PRELOAD_TIMEOUT seconds, the game is imported the usual way instead.
+PRELOAD_TIMEOUT = float(os.environ.get("SMG_PRELOAD_TIMEOUT", "15"))
+
+def show_loading_screen(entry):
+    preloader.request(entry)
+    deadline = time.perf_counter() + PRELOAD_TIMEOUT
     overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
     overlay.fill(OVERLAY_COLOR)
+    loading_text = small_font.render(f"Loading {entry.name}", True, WHITE)
+    loading_shadow = small_font.render(f"Loading {entry.name}", True, SHADOW_COLOR)
+    loading_rect = loading_text.get_rect(center=(WIDTH // 2, HEIGHT // 2 - 30))
+    shadow_rect = loading_shadow.get_rect(center=(loading_rect.centerx + 3, loading_rect.centery + 3))
+    bar_rect = pygame.Rect(WIDTH // 2 - 100, HEIGHT // 2 + 70, 200, 10)
     angle = 0
-    for i in range(30):  # Show for 30 frames (0.5 seconds at 60 FPS)
+    while not preloader.is_ready(entry):
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                confirm_quit()
+        if not preloader.is_alive() or time.perf_counter() > deadline:
+            print(f"Preloading {entry.name} did not finish, loading it directly")
+            return
         screen.blit(overlay, (0, 0))
         # Draw loading text
-        loading_text = small_font.render(f"Loading {game_name}", True, WHITE)
-        loading_shadow = small_font.render(f"Loading {game_name}", True, SHADOW_COLOR)
-        loading_rect = loading_text.get_rect(center=(WIDTH // 2, HEIGHT // 2 - 30))
-        shadow_rect = loading_shadow.get_rect(center=(loading_rect.centerx + 3, loading_rect.centery + 3))
         screen.blit(loading_shadow, shadow_rect)
         screen.blit(loading_text, loading_rect)
         # Draw spinning animation
         if spinner_image:
-            rotated_spinner = pygame.transform.rotate(spinner_image, angle)
+            rotated_spinner = transforms.rotate(spinner_image, angle)
             spinner_rect = rotated_spinner.get_rect(center=(WIDTH // 2, HEIGHT // 2 + 30))
             screen.blit(rotated_spinner, spinner_rect)
         else:
             pygame.draw.circle(screen, WHITE, (WIDTH // 2, HEIGHT // 2 + 30), 20, 2)
-        angle -= 12  # Rotate 12 degrees per frame (360 degrees in 30 frames)
+        angle -= 12
+        # Draw progress bar
+        pygame.draw.rect(screen, GRAY, bar_rect)
+        filled_rect = bar_rect.copy()
+        filled_rect.width = int(bar_rect.width * preloader.fraction(entry))
+        pygame.draw.rect(screen, WHITE, filled_rect)
         pygame.display.flip()
-        pygame.time.delay(16)  # Delay for ~60 FPS
-
-# Actions for each button
-def launch_car_game():
+        clock.tick(60)
+
+# How games are started: "inprocess" runs them in this window (see
+# smg/host.py), "worker" hands them to pre-warmed processes (see
+# smg/workers.py) and "subprocess" starts a fresh interpreter per launch
+LAUNCH_MODE = os.environ.get("SMG_LAUNCH_MODE", "inprocess")
+
+game_host = GameHost(screen, "SimpleMiniGames Launcher")
+preloader = AssetPreloader()
+worker_pool = WorkerPool() if LAUNCH_MODE == "worker" else None
+print(f"Launch mode: {LAUNCH_MODE}")
+
+# Called while a game's button is hovered
+def prepare_game(entry):
+    if LAUNCH_MODE == "inprocess":
+        preloader.request(entry)
+    elif LAUNCH_MODE == "worker":
+        worker_pool.warm(entry)
+
+def launch_game(entry):
     global music_playing
-    show_loading_screen("Car Game")
-    if music_playing:
-        pygame.mixer.music.pause()
-        music_playing = False
-    subprocess.run([sys.executable, "CarGame/car_game.py"])
-    pygame.mixer.music.unpause()
-    music_playing = True
-
-def launch_snake_game():
-    global music_playing
-    show_loading_screen("Snake Game")
-    if music_playing:
-        pygame.mixer.music.pause()
-        music_playing = False
-    subprocess.run([sys.executable, "SnakeGame/snake_game.py"])
-    pygame.mixer.music.unpause()
-    music_playing = True
+    # The loading screen and the game draw over the whole window
+    scene.invalidate_all()
+    music_enabled = music_playing
+    if LAUNCH_MODE == "inprocess":
+        if not preloader.is_ready(entry):
+            show_loading_screen(entry)
+        return_to_launcher = game_host.launch(entry.load_class())
+        if not return_to_launcher:
+            confirm_quit()
+        # The game replaced the music stream, so load ours again
+        start_launcher_music()
+        pygame.mixer.music.set_volume(volume_slider.value)
+        if not music_enabled:
+            pygame.mixer.music.pause()
+            music_playing = False
+        return
 
-def launch_flappy_bird():
-    global music_playing
-    show_loading_screen("Flappy Bird")
     if music_playing:
         pygame.mixer.music.pause()
         music_playing = False
-    subprocess.run([sys.executable, "FlappyBird/flappy_bird.py"])
-    pygame.mixer.music.unpause()
-    music_playing = True
+    # Either way the game tells us whether to come back or quit the app, as
+    # game_host.launch does in process (see run_standalone for exit codes)
+    if LAUNCH_MODE == "worker":
+        return_to_launcher = worker_pool.launch(entry)
+    else:
+        result = subprocess.run([sys.executable, "-m", entry.module_name], env=dict(os.environ, SMG_LAUNCH_T0=str(time.time())))
+        return_to_launcher = result.returncode != 1
+    if not return_to_launcher:
+        confirm_quit()
+    if music_enabled:
+        pygame.mixer.music.unpause()
+        music_playing = True
 
 def toggle_music():
     global music_playing
@@ -280,6 +417,9 @@ def show_quit_dialog():
     current_menu = "quit_dialog"
 
 def confirm_quit():
+    scheduler.report()
+    if worker_pool:
+        worker_pool.shutdown()
     pygame.quit()
     sys.exit()
 
@@ -288,10 +428,38 @@ button_width, button_height = 200, 40
 button_spacing = 15
 start_y = HEIGHT // 2 - 80
 
-# Main menu buttons
-car_game_button = Button("Car Game", WIDTH // 2 - button_width // 2, start_y, button_width, button_height, launch_car_game, car_game_preview)
-snake_game_button = Button("Snake Game", WIDTH // 2 - button_width // 2, start_y + button_height + button_spacing, button_width, button_height, launch_snake_game, snake_game_preview)
-flappy_bird_button = Button("Flappy Bird", WIDTH // 2 - button_width // 2, start_y + 2 * (button_height + button_spacing), button_width, button_height, launch_flappy_bird, flappy_bird_preview)
+# Main menu buttons: one row per game, scrolled with the mouse wheel when the
+# catalogue has more games than rows
+GAME_ROWS = 3
+game_buttons = []
+for entry in game_entries:
+    button = Button(entry.name, WIDTH // 2 - button_width // 2, start_y, button_width, button_height, lambda entry=entry: launch_game(entry))
+    button.entry = entry
+    game_buttons.append(button)
+game_scroll = 0
+
+def visible_game_buttons():
+    return game_buttons[game_scroll:game_scroll + GAME_ROWS]
+
+def place_game_buttons():
+    for row, button in enumerate(visible_game_buttons()):
+        button.rect.y = start_y + row * (button_height + button_spacing)
+        button.hovered = False
+        # First time on screen: load the preview now, not at startup
+        button.entry.load_preview()
+
+def scroll_games(amount):
+    global game_scroll
+    max_scroll = max(0, len(game_buttons) - GAME_ROWS)
+    new_scroll = max(0, min(max_scroll, game_scroll + amount))
+    if new_scroll != game_scroll:
+        game_scroll = new_scroll
+        place_game_buttons()
+        menu_layers["main"] = main_menu_layers()
+        scene.set_layers(menu_layers["main"])
+
+place_game_buttons()
+
 settings_button = Button("Settings", WIDTH // 2 - button_width // 2, start_y + 3 * (button_height + button_spacing), button_width, button_height, show_settings)
 quit_button = Button("Quit", WIDTH // 2 - button_width // 2, start_y + 4 * (button_height + button_spacing), button_width, button_height, show_quit_dialog)
 
@@ -305,151 +473,130 @@ quit_yes_button = Button("Yes", WIDTH // 2 - button_width - 20, HEIGHT // 2 + 20
 quit_no_button = Button("No", WIDTH // 2 + 20, HEIGHT // 2 + 20, button_width, button_height, back_to_main)
 
 # Title with animation
-title_text = font.render("SimpleMiniGames", True, WHITE)
-title_shadow = font.render("SimpleMiniGames", True, SHADOW_COLOR)
-title_rect = title_text.get_rect(center=(WIDTH // 2, 100))
+title = Title("SimpleMiniGames", font, (WIDTH // 2, 100))
 title_alpha = 255
 title_fade_direction = -1
 
 # Settings title
-settings_title = font.render("Settings", True, WHITE)
-settings_title_shadow = font.render("Settings", True, SHADOW_COLOR)
-settings_title_rect = settings_title.get_rect(center=(WIDTH // 2, 150))
+settings_title = Title("Settings", font, (WIDTH // 2, 150))
 
 # Quit dialog title
-quit_dialog_title = font.render("Are you sure you want to quit?", True, WHITE)
-quit_dialog_title_shadow = font.render("Are you sure you want to quit?", True, SHADOW_COLOR)
-quit_dialog_title_rect = quit_dialog_title.get_rect(center=(WIDTH // 2, HEIGHT // 2 - 50))
+quit_dialog_title = Title("Are you sure you want to quit?", font, (WIDTH // 2, HEIGHT // 2 - 50))
 
 # Attribution text
-attribution_text = small_font.render('Music: "Pixel Peeker Polka-faster" by Kevin MacLeod', True, WHITE)
-attribution_shadow = small_font.render('Music: "Pixel Peeker Polka-faster" by Kevin MacLeod', True, SHADOW_COLOR)
-attribution_rect = attribution_text.get_rect(center=(WIDTH // 2, HEIGHT - 20))
+attribution = Title('Music: "Pixel Peeker Polka-faster" by Kevin MacLeod', small_font, (WIDTH // 2, HEIGHT - 20))
 
 # Game preview display
-selected_game_preview = None
+preview = Preview((WIDTH // 2, HEIGHT // 2 + 180))
 
 # Particle effects
-particles = [Particle() for _ in range(20)]
+particle_field = ParticleField(20)
+
+# Static layers, built once
+if background_image:
+    background_layer = SurfaceLayer(background_image)
+else:
+    background_layer = FillLayer((0, 0, WIDTH, HEIGHT), PASTEL_BLUE)
+overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
+overlay.fill(OVERLAY_COLOR)
+overlay_layer = SurfaceLayer(overlay)
+
+# Scroll hints next to the game rows
+more_above = Title("^", small_font, (WIDTH // 2 + button_width // 2 + 20, start_y + button_height // 2))
+more_below = Title("v", small_font, (WIDTH // 2 + button_width // 2 + 20, start_y + (GAME_ROWS - 1) * (button_height + button_spacing) + button_height // 2))
+
+# Scene layers for each menu, in drawing order
+def main_menu_layers():
+    hints = []
+    if game_scroll > 0:
+        hints.append(more_above)
+    if game_scroll + GAME_ROWS < len(game_buttons):
+        hints.append(more_below)
+    return [background_layer, particle_field, title] + visible_game_buttons() + [settings_button, quit_button] + hints + [preview, attribution]
+
+settings_buttons = [music_toggle_button, back_button]
+quit_buttons = [quit_yes_button, quit_no_button]
+menu_layers = {
+    "main": main_menu_layers(),
+    "settings": [background_layer, particle_field, title, overlay_layer, settings_title] + settings_buttons + [volume_slider, attribution],
+    "quit_dialog": [background_layer, particle_field, title, overlay_layer, quit_dialog_title] + quit_buttons + [attribution],
+}
+menu_buttons = {"settings": settings_buttons, "quit_dialog": quit_buttons}
+menu_titles = {"main": [title], "settings": [title, settings_title], "quit_dialog": [title, quit_dialog_title]}
 
 # Menu state
 current_menu = "main"
+scene = DirtyScene(screen)
+scene_menu = None
+scheduler = FrameScheduler()
 
 # Main loop
 running = True
 while running:
-    for event in pygame.event.get():
+    for event in scheduler.get_events():
         if event.type == pygame.QUIT:
             running = False
         # Handle button clicks based on current menu
         if current_menu == "main":
-            if car_game_button.check_click(event):
-                selected_game_preview = car_game_preview
-            if snake_game_button.check_click(event):
-                selected_game_preview = snake_game_preview
-            if flappy_bird_button.check_click(event):
-                selected_game_preview = flappy_bird_preview
+            for button in visible_game_buttons():
+                button.check_click(event)
+            if event.type == pygame.MOUSEWHEEL:
+                scroll_games(-event.y)
             settings_button.check_click(event)
             quit_button.check_click(event)
         elif current_menu == "settings":
             music_toggle_button.check_click(event)
-            volume_slider.update(event)
+            scene.mark(volume_slider.update(event))
             back_button.check_click(event)
         elif current_menu == "quit_dialog":
             quit_yes_button.check_click(event)
             quit_no_button.check_click(event)
 
-    # Update particles
-    for particle in particles:
-        particle.update()
-        if particle.lifetime <= 0:
-            particles.remove(particle)
-            particles.append(Particle())
-
-    # Animate title
-    title_alpha += title_fade_direction * 2
-    if title_alpha <= 150:
-        title_fade_direction = 1
-    elif title_alpha >= 255:
-        title_fade_direction = -1
-    title_text.set_alpha(title_alpha)
-    title_shadow.set_alpha(title_alpha)
-    settings_title.set_alpha(title_alpha)
-    settings_title_shadow.set_alpha(title_alpha)
-    quit_dialog_title.set_alpha(title_alpha)
-    quit_dialog_title_shadow.set_alpha(title_alpha)
-
-    # Draw the screen
-    if background_image:
-        screen.blit(background_image, (0, 0))
+    if current_menu != scene_menu:
+        scene.set_layers(menu_layers[current_menu])
+        scene_menu = current_menu
+
+    # Ambient effects advance by the full-rate frames that have elapsed
+    for _ in range(scheduler.steps):
+        # Update particles
+        for rect in particle_field.update():
+            scene.mark(rect)
+
+        # Animate title
+        title_alpha += title_fade_direction * 2
+        if title_alpha <= 150:
+            title_fade_direction = 1
+        elif title_alpha >= 255:
+            title_fade_direction = -1
+    for menu_title in menu_titles[current_menu]:
+        scene.mark(menu_title.set_alpha(title_alpha))
+
+    # Hover states
+    mouse_pos = pygame.mouse.get_pos()
+    if current_menu == "main":
+        buttons = visible_game_buttons() + [settings_button, quit_button]
     else:
-        screen.fill(PASTEL_BLUE)
-
-    # Draw particles
-    for particle in particles:
-        particle.draw(screen)
+        buttons = menu_buttons[current_menu]
+    for button in buttons:
+        scene.mark(button.update(mouse_pos))
 
-    # Draw title with shadow
-    shadow_rect = title_shadow.get_rect(center=(title_rect.centerx + 3, title_rect.centery + 3))
-    screen.blit(title_shadow, shadow_rect)
-    screen.blit(title_text, title_rect)
-
-    # Draw menu based on current state
     if current_menu == "main":
-        car_game_button.draw(screen)
-        snake_game_button.draw(screen)
-        flappy_bird_button.draw(screen)
-        settings_button.draw(screen)
-        quit_button.draw(screen)
-
-        mouse_pos = pygame.mouse.get_pos()
-        if car_game_button.rect.collidepoint(mouse_pos):
-            selected_game_preview = car_game_preview
-        elif snake_game_button.rect.collidepoint(mouse_pos):
-            selected_game_preview = snake_game_preview
-        elif flappy_bird_button.rect.collidepoint(mouse_pos):
-            selected_game_preview = flappy_bird_preview
-        else:
-            selected_game_preview = None
-
-        if selected_game_preview:
-            preview_rect = selected_game_preview.get_rect(center=(WIDTH // 2, HEIGHT // 2 + 180))
-            screen.blit(selected_game_preview, preview_rect)
+        selected_game_preview = None
+        for button in visible_game_buttons():
+            if button.hovered:
+                selected_game_preview = button.entry.preview
+                prepare_game(button.entry)
+        for rect in preview.set_image(selected_game_preview):
+            scene.mark(rect)
     elif current_menu == "settings":
-        overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-        overlay.fill(OVERLAY_COLOR)
-        screen.blit(overlay, (0, 0))
-
-        shadow_rect = settings_title_shadow.get_rect(center=(settings_title_rect.centerx + 3, settings_title_rect.centery + 3))
-        screen.blit(settings_title_shadow, shadow_rect)
-        screen.blit(settings_title, settings_title_rect)
-
-        music_toggle_button.text = "Music: " + ("ON" if music_playing else "OFF")
-        music_toggle_button.text_surface = button_font.render(music_toggle_button.text, True, WHITE)
-        music_toggle_button.text_shadow = button_font.render(music_toggle_button.text, True, SHADOW_COLOR)
-        music_toggle_button.draw(screen)
-        volume_slider.draw(screen)
-        back_button.draw(screen)
-    elif current_menu == "quit_dialog":
-        overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-        overlay.fill(OVERLAY_COLOR)
-        screen.blit(overlay, (0, 0))
-
-        shadow_rect = quit_dialog_title_shadow.get_rect(center=(quit_dialog_title_rect.centerx + 3, quit_dialog_title_rect.centery + 3))
-        screen.blit(quit_dialog_title_shadow, shadow_rect)
-        screen.blit(quit_dialog_title, quit_dialog_title_rect)
-
-        quit_yes_button.draw(screen)
-        quit_no_button.draw(screen)
-
-    # Draw attribution with shadow
-    shadow_rect = attribution_shadow.get_rect(center=(attribution_rect.centerx + 3, attribution_rect.centery + 3))
-    screen.blit(attribution_shadow, shadow_rect)
-    screen.blit(attribution_text, attribution_rect)
+        scene.mark(music_toggle_button.set_text("Music: " + ("ON" if music_playing else "OFF")))
 
-    pygame.display.flip()
-    clock.tick(60)
+    scene.render()
+    scheduler.tick(animating=volume_slider.dragging)
 
 # Quit Pygame
+scheduler.report()
+if worker_pool:
+    worker_pool.shutdown()
 pygame.quit()
-sys.exit()
\ No newline at end of file
+sys.exit()
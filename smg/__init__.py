@@ -0,0 +1 @@
+# Shared code for the launcher and the games it hosts
@@ -0,0 +1,66 @@
+import io
+import os
+import pygame
+
+# Assets are decoded once per process and handed out from these caches, so a
+# game that is started a second time from the launcher does not touch the disk.
+# Missing files raise FileNotFoundError just like the pygame loaders do.
+_images = {}
+_sounds = {}
+_fonts = {}
+
+# Filled by preload_file() from a background thread: images decoded but not
+# yet converted to the display format, and raw bytes of fonts and music
+_raw_images = {}
+_files = {}
+
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".bmp")
+SOUND_EXTENSIONS = (".wav", ".ogg")
+
+
+def preload_file(path):
+    # Safe to call off the main thread; convert() happens later in load_image()
+    extension = os.path.splitext(path)[1].lower()
+    if extension in IMAGE_EXTENSIONS:
+        if path not in _raw_images:
+            _raw_images[path] = pygame.image.load(path)
+    elif extension in SOUND_EXTENSIONS:
+        if path not in _sounds:
+            _sounds[path] = pygame.mixer.Sound(path)
+    elif path not in _files:
+        with open(path, "rb") as f:
+            _files[path] = f.read()
+
+
+def load_image(path, size=None, alpha=True):
+    key = (path, size, alpha)
+    if key not in _images:
+        image = _raw_images.get(path) or pygame.image.load(path)
+        image = image.convert_alpha() if alpha else image.convert()
+        if size:
+            image = pygame.transform.scale(image, size)
+        _images[key] = image
+    return _images[key]
+
+
+def load_sound(path):
+    if path not in _sounds:
+        _sounds[path] = pygame.mixer.Sound(path)
+    return _sounds[path]
+
+
+def load_font(path, size):
+    key = (path, size)
+    if key not in _fonts:
+        if path in _files:
+            _fonts[key] = pygame.font.Font(io.BytesIO(_files[path]), size)
+        else:
+            _fonts[key] = pygame.font.Font(path, size)
+    return _fonts[key]
+
+
+def load_music(path):
+    if path in _files:
+        pygame.mixer.music.load(io.BytesIO(_files[path]), os.path.splitext(path)[1][1:])
+    else:
+        pygame.mixer.music.load(path)
@@ -0,0 +1,74 @@
+import json
+import os
+import pygame
+
+# System fonts for the launcher and the games. Font objects are cached by
+# (name, size, bold, italic) so they can be asked for from draw code.
+#
+# pygame.font.SysFont scans every installed font the first time it is called.
+# The font file it settles on for each (name, bold, italic) is kept in
+# FONT_INDEX_FILE, so later launches open that file directly and only scan
+# for names that are not in the index yet. Delete the file to pick up fonts
+# installed since.
+FONT_INDEX_FILE = "font_index.json"
+
+_fonts = {}
+_index = None
+
+
+def _index_key(name, bold, italic):
+    return f"{name}|{int(bold)}|{int(italic)}"
+
+
+def _load_index():
+    global _index
+    _index = {}
+    try:
+        if os.path.exists(FONT_INDEX_FILE):
+            with open(FONT_INDEX_FILE, "r") as f:
+                _index = json.load(f)
+    except (IOError, ValueError) as e:
+        print(f"Error loading font index: {e}")
+
+
+def _save_index():
+    # Worker processes may save at the same time; a reader sees one whole file
+    temp_file = f"{FONT_INDEX_FILE}.{os.getpid()}"
+    try:
+        with open(temp_file, "w") as f:
+            json.dump(_index, f, indent=1, sort_keys=True)
+        os.replace(temp_file, FONT_INDEX_FILE)
+    except IOError as e:
+        print(f"Error saving font index: {e}")
+
+
+def _resolve(name, bold, italic):
+    # (path, set_bold, set_italic) as SysFont would pick them; path is None
+    # for pygame's built-in font
+    if _index is None:
+        _load_index()
+    key = _index_key(name, bold, italic)
+    entry = _index.get(key)
+    if entry is not None and (entry[0] is None or os.path.exists(entry[0])):
+        return entry
+
+    def record(path, size, set_bold, set_italic):
+        return [path, set_bold, set_italic]
+
+    entry = _index[key] = pygame.font.SysFont(name, 1, bold, italic, constructor=record)
+    _save_index()
+    return entry
+
+
+def sys_font(name, size, bold=False, italic=False):
+    key = (name, size, bold, italic)
+    font = _fonts.get(key)
+    if font is None:
+        path, set_bold, set_italic = _resolve(name, bold, italic)
+        font = pygame.font.Font(path, size)
+        if set_bold:
+            font.set_bold(True)
+        if set_italic:
+            font.set_italic(True)
+        _fonts[key] = font
+    return font
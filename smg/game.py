@@ -0,0 +1,61 @@
+import os
+import sys
+import time
+import pygame
+
+from smg.metrics import log_launch_latency
+from smg.transforms import transforms
+
+WIDTH, HEIGHT = 800, 600
+
+
+# Base class for a game that can be hosted inside the launcher window.
+# Assets are loaded once in load_assets(); run() plays one session and can be
+# called again later without reloading anything.
+class Game:
+    caption = "SimpleMiniGames"
+
+    def __init__(self, screen):
+        self.screen = screen
+        self.clock = pygame.time.Clock()
+        self.first_frame_callback = None
+        self.load_assets()
+
+    def load_assets(self):
+        pass
+
+    def run(self):
+        # Returns True to go back to the launcher, False to quit completely
+        raise NotImplementedError
+
+    def present(self):
+        pygame.display.flip()
+        if self.first_frame_callback:
+            callback = self.first_frame_callback
+            self.first_frame_callback = None
+            callback()
+
+
+# Entry point used when a game script is started on its own
+def run_standalone(game_class):
+    pygame.init()
+    pygame.mixer.init()
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    pygame.display.set_caption(game_class.caption)
+    game = game_class(screen)
+
+    # Set by the launcher when it starts this script as a subprocess
+    clicked_at = os.environ.get("SMG_LAUNCH_T0")
+    if clicked_at:
+        game.first_frame_callback = lambda: log_launch_latency("subprocess", game_class.caption, time.time() - float(clicked_at))
+
+    return_to_launcher = game.run()
+    transforms.report()
+    pygame.quit()
+
+    if return_to_launcher:
+        print("Exiting with return code 0 (return to launcher)")
+        sys.exit(0)
+    else:
+        print("Exiting with return code 1 (full exit)")
+        sys.exit(1)
@@ -0,0 +1,39 @@
+import time
+import pygame
+
+from smg.metrics import log_launch_latency
+from smg.transforms import transforms
+
+
+# Runs games inside the launcher's own process and window. Each game object is
+# created on its first launch and kept around, so the display, the mixer and
+# every decoded asset stay alive between sessions.
+class GameHost:
+    def __init__(self, screen, caption):
+        self.screen = screen
+        self.caption = caption
+        self.games = {}
+
+    def is_loaded(self, game_class):
+        return game_class in self.games
+
+    def get(self, game_class):
+        if game_class not in self.games:
+            start = time.perf_counter()
+            self.games[game_class] = game_class(self.screen)
+            print(f"{game_class.caption} loaded in {(time.perf_counter() - start) * 1000:.0f} ms")
+        return self.games[game_class]
+
+    def launch(self, game_class):
+        game = self.get(game_class)
+        pygame.display.set_caption(game_class.caption)
+        start = time.perf_counter()
+
+        game.first_frame_callback = lambda: log_launch_latency("inprocess", game_class.caption, time.perf_counter() - start)
+        try:
+            return_to_launcher = game.run()
+        finally:
+            pygame.display.set_caption(self.caption)
+            pygame.event.clear()
+            transforms.report()
+        return return_to_launcher
@@ -0,0 +1,20 @@
+import csv
+import os
+import time
+
+# Launch latency (click to first gameplay frame) is appended here so the
+# different launch modes can be compared across runs
+METRICS_FILE = "launch_metrics.csv"
+
+
+def log_launch_latency(mode, game_name, seconds):
+    print(f"Launch latency [{mode}] {game_name}: {seconds * 1000:.0f} ms")
+    try:
+        new_file = not os.path.exists(METRICS_FILE)
+        with open(METRICS_FILE, "a", newline="") as f:
+            writer = csv.writer(f)
+            if new_file:
+                writer.writerow(["timestamp", "mode", "game", "latency_ms"])
+            writer.writerow([int(time.time()), mode, game_name, round(seconds * 1000, 1)])
+    except IOError as e:
+        print(f"Error saving launch metrics: {e}")
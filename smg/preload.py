@@ -0,0 +1,51 @@
+import queue
+import threading
+
+from smg.assets import preload_file
+
+
+# Decodes a game's asset files and imports its code on a background thread,
+# typically while the player hovers its button in the launcher. Works on
+# registry entries, which list their files in the game's manifest.
+class AssetPreloader:
+    def __init__(self):
+        self.queue = queue.Queue()
+        self.progress = {}
+        self.thread = threading.Thread(target=self.work, daemon=True)
+        self.thread.start()
+
+    def request(self, entry):
+        if entry not in self.progress:
+            # The game code counts as one more step after the files
+            self.progress[entry] = [0, len(entry.assets) + 1]
+            self.queue.put(entry)
+
+    def fraction(self, entry):
+        done, total = self.progress.get(entry, (0, 1))
+        return done / total
+
+    def is_ready(self, entry):
+        return self.fraction(entry) >= 1.0
+
+    def is_alive(self):
+        return self.thread.is_alive()
+
+    def work(self):
+        while True:
+            entry = self.queue.get()
+            # A file that fails to load is skipped, never the whole thread:
+            # the loading screen waits on this progress
+            for path in entry.assets:
+                try:
+                    preload_file(path)
+                except Exception as e:
+                    print(f"Preload skipped {path}: {e}")
+                finally:
+                    self.progress[entry][0] += 1
+            try:
+                entry.load_class()
+            except Exception as e:
+                print(f"Failed to import {entry.class_path}: {e}")
+            finally:
+                self.progress[entry][0] += 1
+            print(f"{entry.name} preloaded")
@@ -0,0 +1,76 @@
+import importlib
+import json
+import os
+
+from smg.assets import load_image
+
+# Every game folder holds a small manifest describing the game:
+#   name     button label in the launcher
+#   module   importable module with the game class, e.g. "CarGame.car_game"
+#   class    smg.game.Game subclass inside that module
+#   order    position in the menu (optional)
+#   preview  image shown while the button is hovered (optional)
+#   assets   files the launcher may decode before the first launch (optional)
+# A folder with several games lists one manifest object per game.
+MANIFEST_NAME = "game.json"
+PREVIEW_SIZE = (200, 150)
+
+
+# One game from the catalogue. Reading the manifest is all that happens at
+# startup; the preview and the game code are loaded on first use.
+class GameEntry:
+    def __init__(self, directory, manifest):
+        self.directory = directory
+        self.name = manifest["name"]
+        self.module_name = manifest["module"]
+        self.class_name = manifest["class"]
+        self.order = manifest.get("order", 0)
+        self.preview_path = manifest.get("preview")
+        self.assets = manifest.get("assets", [])
+        self.game_class = None
+        self.preview_loaded = False
+        self.preview_image = None
+
+    @property
+    def class_path(self):
+        return f"{self.module_name}:{self.class_name}"
+
+    def load_class(self):
+        if self.game_class is None:
+            module = importlib.import_module(self.module_name)
+            self.game_class = getattr(module, self.class_name)
+        return self.game_class
+
+    @property
+    def preview(self):
+        return self.load_preview()
+
+    def load_preview(self):
+        if not self.preview_loaded:
+            self.preview_loaded = True
+            if self.preview_path:
+                try:
+                    self.preview_image = load_image(self.preview_path, PREVIEW_SIZE)
+                    print(f"Preview loaded for {self.name}")
+                except FileNotFoundError:
+                    print(f"Preview not found for {self.name}")
+        return self.preview_image
+
+
+def discover(root="."):
+    entries = []
+    for directory in sorted(os.listdir(root)):
+        path = os.path.join(root, directory, MANIFEST_NAME)
+        if not os.path.isfile(path):
+            continue
+        try:
+            with open(path, "r") as f:
+                manifests = json.load(f)
+            if isinstance(manifests, dict):
+                manifests = [manifests]
+            entries.extend(GameEntry(directory, manifest) for manifest in manifests)
+        except (ValueError, KeyError, IOError) as e:
+            print(f"Skipping {path}: {e}")
+    entries.sort(key=lambda entry: (entry.order, entry.name))
+    print(f"Found {len(entries)} games")
+    return entries
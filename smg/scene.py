@@ -0,0 +1,85 @@
+import pygame
+
+
+# Retained scene for dirty-rectangle rendering. Layers are drawn in order and
+# need a draw(surface) method plus the area they may touch, as "bounds" or,
+# failing that, "rect". Widgets
+# report what they changed through mark(); render() then repaints only those
+# areas, with the screen clipped so each blit only touches dirty pixels, and
+# pushes them with pygame.display.update(rects) instead of flip().
+class DirtyScene:
+    def __init__(self, screen):
+        self.screen = screen
+        self.layers = []
+        self.dirty_rects = []
+        self.full_redraw = True
+        self.frames = 0
+        self.pixels_updated = 0
+
+    def set_layers(self, layers):
+        self.layers = layers
+        self.invalidate_all()
+
+    def invalidate_all(self):
+        self.full_redraw = True
+
+    def mark(self, rect):
+        if rect and rect.width > 0 and rect.height > 0:
+            self.dirty_rects.append(pygame.Rect(rect))
+
+    def merged_rects(self):
+        screen_rect = self.screen.get_rect()
+        merged = []
+        for rect in self.dirty_rects:
+            rect = rect.clip(screen_rect)
+            if rect.width <= 0 or rect.height <= 0:
+                continue
+            # Fold overlapping rects together so no pixel is painted twice
+            index = rect.collidelist(merged)
+            while index != -1:
+                rect.union_ip(merged.pop(index))
+                index = rect.collidelist(merged)
+            merged.append(rect)
+        return merged
+
+    def render(self):
+        if self.full_redraw:
+            rects = [self.screen.get_rect()]
+        else:
+            rects = self.merged_rects()
+        self.dirty_rects = []
+
+        for rect in rects:
+            self.screen.set_clip(rect)
+            for layer in self.layers:
+                if getattr(layer, "bounds", layer.rect).colliderect(rect):
+                    layer.draw(self.screen)
+        self.screen.set_clip(None)
+
+        if self.full_redraw:
+            pygame.display.flip()
+            self.full_redraw = False
+        elif rects:
+            pygame.display.update(rects)
+        self.frames += 1
+        self.pixels_updated += sum(rect.width * rect.height for rect in rects)
+        return rects
+
+
+# Static layers whose pixels are built once and blitted from then on
+class SurfaceLayer:
+    def __init__(self, surface, pos=(0, 0)):
+        self.surface = surface
+        self.rect = surface.get_rect(topleft=pos)
+
+    def draw(self, surface):
+        surface.blit(self.surface, self.rect)
+
+
+class FillLayer:
+    def __init__(self, rect, color):
+        self.rect = pygame.Rect(rect)
+        self.color = color
+
+    def draw(self, surface):
+        surface.fill(self.color, self.rect)
@@ -0,0 +1,74 @@
+import time
+import pygame
+
+# Events that count as the user doing something
+ACTIVITY_EVENTS = (pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.KEYDOWN, pygame.KEYUP)
+
+
+# Chooses how often the menu loop runs. Full rate while the user is active or
+# something is animating, a lower rate when only ambient effects are moving,
+# and blocking in pygame.event.wait() while the window is unfocused or
+# minimized. Callers advance their animations by "steps" (elapsed time in
+# full-rate frames) so effects keep their speed at any rate.
+class FrameScheduler:
+    def __init__(self, full_fps=60, ambient_fps=20, idle_timeout=250, active_hold=0.5):
+        self.full_fps = full_fps
+        self.ambient_fps = ambient_fps
+        self.idle_timeout = idle_timeout
+        self.active_hold = active_hold
+        self.clock = pygame.time.Clock()
+        self.focused = True
+        self.minimized = False
+        self.last_activity = time.perf_counter()
+        self.last_frame = time.perf_counter()
+        self.steps = 1
+        self.frames_rendered = 0
+        self.frames_skipped = 0
+
+    @property
+    def idle(self):
+        return self.minimized or not self.focused
+
+    def get_events(self):
+        if self.idle:
+            event = pygame.event.wait(self.idle_timeout)
+            events = [event] if event.type != pygame.NOEVENT else []
+            events += pygame.event.get()
+        else:
+            events = pygame.event.get()
+
+        for event in events:
+            if event.type in ACTIVITY_EVENTS:
+                self.last_activity = time.perf_counter()
+            elif event.type == pygame.WINDOWFOCUSLOST:
+                self.focused = False
+            elif event.type == pygame.WINDOWFOCUSGAINED:
+                self.focused = True
+                self.last_activity = time.perf_counter()
+            elif event.type in (pygame.WINDOWMINIMIZED, pygame.WINDOWHIDDEN):
+                self.minimized = True
+            elif event.type in (pygame.WINDOWRESTORED, pygame.WINDOWSHOWN, pygame.WINDOWEXPOSED):
+                self.minimized = False
+
+        now = time.perf_counter()
+        elapsed_frames = (now - self.last_frame) * self.full_fps
+        self.last_frame = now
+        # Cap the catch-up so effects don't jump after a long idle wait
+        self.steps = max(1, min(15, round(elapsed_frames)))
+        return events
+
+    def tick(self, animating=False):
+        # Call once per rendered frame
+        self.frames_rendered += 1
+        self.frames_skipped += self.steps - 1
+        if self.idle:
+            return
+        if animating or time.perf_counter() - self.last_activity < self.active_hold:
+            self.clock.tick(self.full_fps)
+        else:
+            self.clock.tick(self.ambient_fps)
+
+    def report(self):
+        total = self.frames_rendered + self.frames_skipped
+        saved = 100 * self.frames_skipped / total if total else 0
+        print(f"Frames rendered: {self.frames_rendered}, skipped: {self.frames_skipped} ({saved:.0f}% saved)")
@@ -0,0 +1,91 @@
+import pygame
+
+# Text drawn from glyph atlases. Every printable ASCII character of a font is
+# rendered once per colour into one Surface, and a new string is put together
+# from it with a single Surface.blits() call instead of being rasterized
+# again. Finished strings are kept, so a HUD showing the same text frame after
+# frame costs one lookup and one blit.
+#
+# Glyphs are placed side by side without kerning, which is exact for pixel
+# fonts like PressStart2P and close for the others.
+
+ATLAS_CHARS = "".join(chr(code) for code in range(32, 127))
+# Finished strings kept per atlas before the oldest are dropped
+MAX_STRINGS = 256
+
+_atlases = {}
+
+
+class GlyphAtlas:
+    def __init__(self, font, color):
+        self.font = font
+        self.color = color
+        self.areas = {}
+        self.advances = {}
+        self.extra = {}
+        self.strings = {}
+
+        # All glyphs in one render so they share a baseline; each one's area
+        # runs from its pen position to the next
+        self.surface = font.render(ATLAS_CHARS, True, color)
+        self.height = self.surface.get_height()
+        advances = [metrics[4] if metrics else 0 for metrics in font.metrics(ATLAS_CHARS)]
+        if sum(advances) != self.surface.get_width():
+            # Kerned, so measure where each glyph really starts (slower)
+            ends = [font.size(ATLAS_CHARS[:i + 1])[0] for i in range(len(ATLAS_CHARS))]
+            advances = [end - start for start, end in zip([0] + ends, ends)]
+        x = 0
+        for char, advance in zip(ATLAS_CHARS, advances):
+            self.areas[char] = pygame.Rect(x, 0, advance, self.height)
+            self.advances[char] = advance
+            x += advance
+
+    def glyph(self, char):
+        # (source, area, advance); characters outside the atlas get a
+        # Surface of their own the first time they are drawn
+        area = self.areas.get(char)
+        if area is not None:
+            return self.surface, area, self.advances[char]
+        if char not in self.extra:
+            glyph = self.font.render(char, True, self.color)
+            self.extra[char] = glyph, glyph.get_width()
+        glyph, advance = self.extra[char]
+        return glyph, None, advance
+
+    def render(self, text):
+        # Like Font.render: a Surface with the text on it, put together from
+        # the atlas with one blits() call and kept for the next time
+        image = self.strings.get(text)
+        if image is None:
+            if len(self.strings) >= MAX_STRINGS:
+                del self.strings[next(iter(self.strings))]
+            blits = []
+            x = 0
+            for char in text:
+                source, area, advance = self.glyph(char)
+                # Copy the pixels as they are rather than blending them
+                blits.append((source, (x, 0), area, pygame.BLEND_RGBA_MAX))
+                x += advance
+            image = self.strings[text] = pygame.Surface((x, self.height), pygame.SRCALPHA)
+            image.blits(blits, doreturn=False)
+        return image
+
+    def get_rect(self, text, **anchor):
+        return self.render(text).get_rect(**anchor)
+
+    def draw(self, surface, text, **anchor):
+        # Anchors as for Surface.get_rect(), e.g. center=(x, y); returns the
+        # rect the text covers
+        image = self.render(text)
+        rect = image.get_rect(**anchor)
+        surface.blit(image, rect)
+        return rect
+
+
+def glyph_atlas(font, color):
+    # One atlas per font and colour, shared by everything in the process
+    key = (font, tuple(color))
+    atlas = _atlases.get(key)
+    if atlas is None:
+        atlas = _atlases[key] = GlyphAtlas(font, color)
+    return atlas
@@ -0,0 +1,98 @@
+from collections import OrderedDict
+
+import pygame
+
+# Scaled, rotated and flipped copies of sprites, made once and handed out
+# again on later frames. Scale factors are rounded to SCALE_STEP and angles to
+# ANGLE_STEP degrees, so a pulsing or spinning sprite cycles through a few
+# dozen variants instead of allocating a new Surface every frame. Once the
+# cached pixels pass the byte budget the least recently used variants go.
+#
+# Keys hold the source Surface itself (Surfaces compare by identity), which
+# also keeps the source alive for as long as its variants are cached.
+
+SCALE_STEP = 0.02
+ANGLE_STEP = 3
+BYTE_BUDGET = 32 * 1024 * 1024
+
+
+def quantize_scale(factor):
+    return round(factor / SCALE_STEP) * SCALE_STEP
+
+
+def quantize_angle(angle):
+    return round(angle / ANGLE_STEP) * ANGLE_STEP % 360
+
+
+def surface_bytes(surface):
+    return surface.get_pitch() * surface.get_height()
+
+
+class TransformCache:
+    def __init__(self, byte_budget=BYTE_BUDGET):
+        self.byte_budget = byte_budget
+        self.surfaces = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key, make):
+        # Also for surfaces that are drawn rather than transformed: make() is
+        # only called when key is not cached
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return surface
+        return self.add(key, make())
+
+    def add(self, key, surface):
+        self.misses += 1
+        self.surfaces[key] = surface
+        self.bytes += surface_bytes(surface)
+        while self.bytes > self.byte_budget and len(self.surfaces) > 1:
+            _, old = self.surfaces.popitem(last=False)
+            self.bytes -= surface_bytes(old)
+            self.evictions += 1
+        return surface
+
+    def scale(self, image, size, flip_x=False, flip_y=False):
+        # Sizes are whole pixels already, so they are used as they are
+        key = ("scale", image, size, flip_x, flip_y)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return surface
+        surface = pygame.transform.scale(image, size)
+        if flip_x or flip_y:
+            surface = pygame.transform.flip(surface, flip_x, flip_y)
+        return self.add(key, surface)
+
+    def scale_by(self, image, factor):
+        factor = quantize_scale(factor)
+        width, height = image.get_size()
+        return self.scale(image, (round(width * factor), round(height * factor)))
+
+    def rotate(self, image, angle):
+        angle = quantize_angle(angle)
+        if angle == 0:
+            return image
+        return self.get(("rotate", image, angle), lambda: pygame.transform.rotate(image, angle))
+
+    def clear(self):
+        self.surfaces.clear()
+        self.bytes = 0
+
+    def report(self):
+        lookups = self.hits + self.misses
+        if not lookups:
+            return
+        print(f"Transform cache: {self.hits} hits, {self.misses} misses "
+              f"({self.hits / lookups * 100:.1f}% hit rate), {len(self.surfaces)} surfaces, "
+              f"{self.bytes / (1024 * 1024):.1f} MiB, {self.evictions} evicted")
+
+
+# One cache per process, shared by the launcher and every game in it
+transforms = TransformCache()
@@ -0,0 +1,119 @@
+import importlib
+import os
+import subprocess
+import sys
+import time
+import pygame
+
+from smg.game import WIDTH, HEIGHT
+from smg.metrics import log_launch_latency
+from smg.transforms import transforms
+
+# Pre-warmed worker processes for running games in isolation. Every worker
+# imports pygame, opens a hidden window and loads its game's assets, then
+# waits for a "run" line on stdin. Workers report back on stdout with one
+# line per message ("ready", "first_frame", "done <0|1>"); the game's own
+# prints go to stderr.
+
+
+class Worker:
+    def __init__(self, entry):
+        self.entry = entry
+        self.process = subprocess.Popen(
+            [sys.executable, "-m", "smg.workers", entry.class_path],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True,
+            bufsize=1,
+            env=dict(os.environ, PYGAME_HIDE_SUPPORT_PROMPT="1"),
+        )
+
+    def read_message(self):
+        line = self.process.stdout.readline()
+        return line.strip() if line else None
+
+    def run_session(self, clicked_at):
+        # Blocks until the session is over, like subprocess.run did
+        message = self.read_message()
+        if message != "ready":
+            print(f"Worker for {self.entry.name} failed to start: {message}")
+            return True
+        self.process.stdin.write("run\n")
+        self.process.stdin.flush()
+
+        return_to_launcher = True
+        while True:
+            message = self.read_message()
+            if message is None:
+                print(f"Worker for {self.entry.name} exited unexpectedly")
+                break
+            if message == "first_frame":
+                log_launch_latency("worker", self.entry.name, time.perf_counter() - clicked_at)
+            elif message.startswith("done"):
+                return_to_launcher = message.split()[1] == "0"
+                break
+        self.process.wait()
+        return return_to_launcher
+
+    def stop(self):
+        if self.process.poll() is None:
+            self.process.stdin.close()
+            self.process.wait()
+
+
+# Workers are keyed by registry entry and started on first hover, so the
+# launcher does not pay for games nobody looks at
+class WorkerPool:
+    def __init__(self):
+        self.workers = {}
+
+    def warm(self, entry):
+        if entry not in self.workers:
+            self.workers[entry] = Worker(entry)
+
+    def launch(self, entry):
+        clicked_at = time.perf_counter()
+        worker = self.workers.pop(entry, None) or Worker(entry)
+        try:
+            return worker.run_session(clicked_at)
+        finally:
+            # Warm a fresh worker while the launcher is back on screen
+            self.workers[entry] = Worker(entry)
+
+    def shutdown(self):
+        for worker in self.workers.values():
+            worker.stop()
+        self.workers = {}
+
+
+def worker_main(path):
+    protocol = sys.stdout
+    sys.stdout = sys.stderr
+
+    def send(message):
+        protocol.write(message + "\n")
+        protocol.flush()
+
+    module_name, class_name = path.split(":")
+    game_class = getattr(importlib.import_module(module_name), class_name)
+
+    pygame.init()
+    pygame.mixer.init()
+    screen = pygame.display.set_mode((WIDTH, HEIGHT), pygame.HIDDEN)
+    pygame.display.set_caption(game_class.caption)
+    game = game_class(screen)
+    send("ready")
+
+    if sys.stdin.readline().strip() != "run":
+        pygame.quit()
+        return
+    game.screen = pygame.display.set_mode((WIDTH, HEIGHT), pygame.SHOWN)
+    game.first_frame_callback = lambda: send("first_frame")
+    return_to_launcher = game.run()
+    transforms.report()
+    pygame.quit()
+    send("done 0" if return_to_launcher else "done 1")
+
+
+if __name__ == "__main__":
+    worker_main(sys.argv[1])